@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the lesson and quiz generators
+
+Renders two corpora through generate_lesson_content, generate_quiz_questions
+and generate_enhanced_content:
+
+    curriculum   every tutorial in the curriculum catalog
+    synthetic    a seeded 10,000-lesson catalog spread over many tenants,
+                 with varied codes, titles and topic counts
+
+and records per-call latency percentiles (each call's best of --repeat
+passes), throughput, bytes allocated per call (tracemalloc peak) and output
+bytes per call, taking each metric's median over --runs suite runs.
+
+Results are compared with a baseline JSON recorded for the same corpus
+sizes. Baseline latencies are rescaled by a calibration workload timed in
+both runs, so a slower or busier machine is not reported as a regression;
+any tracked metric that grows past --threshold (and, for latencies, by at
+least MIN_DELTA_US) makes the run exit 1.
+
+Usage:
+    python3 code/bench_generators.py                     # compare with baseline
+    python3 code/bench_generators.py --save-baseline     # record a new baseline
+    python3 code/bench_generators.py --threshold 0.10 --synthetic 2000
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+sys.path.append(os.path.dirname(__file__))
+from content_generator_full import generate_lesson_content, generate_quiz_questions
+from curriculum_catalog import load_curriculum_entries
+from lesson_templates import generate_enhanced_content
+
+CODE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(CODE_DIR, 'bench_generators_baseline.json')
+DEFAULT_SYNTHETIC = 10000
+DEFAULT_TENANTS = 50
+DEFAULT_THRESHOLD = 0.25  # Allowed relative growth before a metric counts as a regression
+TRACKED_METRICS = ('p50_us', 'p90_us', 'alloc_bytes', 'output_bytes')
+MIN_DELTA_US = 1.0  # Latency growth below this is timer noise at µs scale
+
+GENERATORS: Dict[str, Callable[[Dict], object]] = {
+    'generate_lesson_content':
+        lambda e: generate_lesson_content(e['code'], e['title'], e['topics'], e['description']),
+    'generate_quiz_questions':
+        lambda e: generate_quiz_questions(e['code'], e['title'], e['topics']),
+    'generate_enhanced_content':
+        lambda e: generate_enhanced_content(e['title'], ""),
+}
+
+
+def synthetic_entries(count: int, tenants: int, seed: int = 0) -> List[Dict]:
+    """Seeded multi-tenant catalog built by remixing curriculum titles and topics"""
+    rng = random.Random(seed)
+    curriculum = load_curriculum_entries()
+    topic_pool = sorted({topic for entry in curriculum for topic in entry['topics']})
+    entries = []
+    for i in range(count):
+        base = curriculum[i % len(curriculum)]
+        tenant = f"Tenant {i % tenants + 1:03d}"
+        topics = rng.sample(topic_pool, rng.randint(1, min(8, len(topic_pool))))
+        entries.append({
+            # Keep the curriculum's codes so the 1.x special cases are exercised too
+            'code': base['code'],
+            'title': f"{base['title']} ({tenant})",
+            'description': f"{base['description']} Presented by {tenant}.",
+            'topics': topics,
+        })
+    return entries
+
+
+def calibrate(repeat: int = 20) -> float:
+    """
+    Best-of-repeat µs for a fixed string-building workload
+
+    Stored with the baseline so latencies can be rescaled by how fast this
+    machine (or this moment on a shared host) runs plain Python.
+    """
+    def workload():
+        parts = []
+        for i in range(2000):
+            parts.append(f"<li>Item {i}: {'x' * (i % 7)}</li>")
+        return ''.join(parts).upper()
+
+    clock = time.perf_counter_ns
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = clock()
+        workload()
+        best = min(best, clock() - t0)
+    return best / 1000
+
+
+def output_size(output) -> int:
+    if isinstance(output, str):
+        return len(output.encode('utf-8'))
+    return len(json.dumps(output, ensure_ascii=False).encode('utf-8'))
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def measure(func: Callable[[Dict], object], entries: List[Dict], repeat: int) -> Dict:
+    """Latency, throughput, allocation and output size of func over entries"""
+    for entry in entries[:100]:
+        func(entry)  # Warm up caches and compiled templates
+
+    best = [float('inf')] * len(entries)
+    clock = time.perf_counter_ns
+    passes = []
+    for _ in range(repeat):
+        started = clock()
+        for i, entry in enumerate(entries):
+            t0 = clock()
+            func(entry)
+            elapsed = clock() - t0
+            if elapsed < best[i]:
+                best[i] = elapsed
+        passes.append(clock() - started)
+
+    # Separate pass: tracemalloc slows every allocation, so it must not skew timings
+    allocated = 0
+    output_bytes = 0
+    tracemalloc.start()
+    try:
+        for entry in entries:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            output = func(entry)
+            allocated += tracemalloc.get_traced_memory()[1] - before
+            output_bytes += output_size(output)
+            del output
+    finally:
+        tracemalloc.stop()
+
+    latencies = sorted(ns / 1000 for ns in best)
+    return {
+        'calls': len(entries),
+        'p50_us': round(percentile(latencies, 0.50), 2),
+        'p90_us': round(percentile(latencies, 0.90), 2),
+        'p99_us': round(percentile(latencies, 0.99), 2),
+        'max_us': round(latencies[-1], 2),
+        'mean_us': round(statistics.fmean(latencies), 2),
+        'calls_per_sec': round(len(entries) / (min(passes) / 1e9), 1),
+        'alloc_bytes': allocated // len(entries),
+        'output_bytes': output_bytes // len(entries),
+    }
+
+
+def run_suite(corpora: Dict[str, List[Dict]], repeat: int) -> Dict:
+    results = {}
+    for corpus, entries in corpora.items():
+        for name, func in GENERATORS.items():
+            results[f"{corpus}/{name}"] = measure(func, entries, repeat)
+    return results
+
+
+def median_results(runs: List[Dict]) -> Dict:
+    """Per-metric median across suite runs, so one lucky or noisy run can't set the bar"""
+    return {key: {metric: statistics.median(run[key][metric] for run in runs)
+                  for metric in runs[0][key]}
+            for key in runs[0]}
+
+
+def compare(results: Dict, baseline: Dict, threshold: float, speed: float = 1.0) -> List[str]:
+    """
+    Descriptions of every tracked metric that regressed past threshold
+
+    speed is this run's calibration time over the baseline's; baseline
+    latencies are scaled by it so a slower machine is not a regression.
+    """
+    regressions = []
+    for key, metrics in results.items():
+        previous = baseline.get(key)
+        if previous is None or previous.get('calls') != metrics['calls']:
+            continue  # Different corpus size: not comparable
+        for metric in TRACKED_METRICS:
+            before, after = previous.get(metric), metrics[metric]
+            if metric.endswith('_us') and before:
+                before = round(before * speed, 2)
+                if after - before < MIN_DELTA_US:
+                    continue
+            if before and after > before * (1 + threshold):
+                regressions.append(f"{key} {metric}: {before:,} -> {after:,} "
+                                   f"(+{(after / before - 1) * 100:.0f}%)")
+    return regressions
+
+
+def print_report(results: Dict, baseline: Dict, speed: float = 1.0):
+    print(f"{'Benchmark':<46}{'p50 µs':>9}{'p90 µs':>9}{'p99 µs':>9}{'calls/s':>11}"
+          f"{'alloc B':>10}{'out B':>9}{'Δp50':>8}")
+    print("-" * 111)
+    for key, m in results.items():
+        previous = baseline.get(key, {}).get('p50_us')
+        previous = previous and previous * speed
+        delta = f"{(m['p50_us'] / previous - 1) * 100:+.0f}%" if previous else '-'
+        print(f"{key:<46}{m['p50_us']:>9.2f}{m['p90_us']:>9.2f}{m['p99_us']:>9.2f}"
+              f"{m['calls_per_sec']:>11,.0f}{m['alloc_bytes']:>10,}{m['output_bytes']:>9,}{delta:>8}")
+
+
+def environment() -> Dict:
+    return {'python': platform.python_version(), 'machine': platform.machine(),
+            'system': platform.system()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the content generators")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Baseline JSON path")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="Write results as the new baseline instead of comparing")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Allowed relative growth per metric (default {DEFAULT_THRESHOLD})")
+    parser.add_argument('--synthetic', type=int, default=DEFAULT_SYNTHETIC,
+                        help=f"Synthetic catalog size (default {DEFAULT_SYNTHETIC})")
+    parser.add_argument('--tenants', type=int, default=DEFAULT_TENANTS)
+    parser.add_argument('--repeat', type=int, default=5, help="Timed passes per benchmark")
+    parser.add_argument('--runs', type=int, default=3,
+                        help="Suite runs; each metric is the median across runs")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args()
+
+    corpora = {'curriculum': load_curriculum_entries()}
+    if args.synthetic:
+        corpora['synthetic'] = synthetic_entries(args.synthetic, args.tenants)
+    print(f"Benchmarking {', '.join(f'{k} ({len(v):,})' for k, v in corpora.items())}, "
+          f"best of {args.repeat} passes, median of {args.runs} runs", file=sys.stderr)
+    runs = []
+    calibrations = []
+    for run in range(1, args.runs + 1):
+        print(f"  run {run}/{args.runs}...", file=sys.stderr)
+        calibrations.append(calibrate())
+        runs.append(run_suite(corpora, args.repeat))
+    calibrations.append(calibrate())
+    results = median_results(runs)
+    calibration = round(statistics.median(calibrations), 2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'environment': environment(), 'calibration_us': calibration,
+                       'results': results}, f, indent=2)
+            f.write('\n')
+        print(f"✓ Baseline written to {os.path.relpath(args.baseline)}", file=sys.stderr)
+
+    baseline = {}
+    speed = 1.0
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            saved = json.load(f)
+        baseline = saved['results']
+        if saved.get('calibration_us'):
+            speed = calibration / saved['calibration_us']
+            print(f"Machine speed vs baseline: {1 / speed:.2f}x "
+                  f"(baseline latencies scaled by {speed:.2f})", file=sys.stderr)
+        if saved.get('environment') != environment():
+            print(f"⚠ Baseline was recorded on {saved.get('environment')}; "
+                  f"latency deltas are cross-machine", file=sys.stderr)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results, baseline, speed)
+
+    regressions = compare(results, baseline, args.threshold, speed)
+    if regressions:
+        print(f"\n✗ {len(regressions)} regression(s) past {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    if baseline:
+        print(f"\n✓ No regressions past {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Import-time budget check for the pure content modules
+
+Imports each module in a fresh interpreter with `python -X importtime` and
+fails (exit 1) if its cumulative import time exceeds the budget, if it pulls
+in a heavy dependency (requests, httpx, PyPDF2, numpy), or if it prints
+anything on import. Timings are the best of several runs to damp noise.
+
+Usage:
+    python3 code/bench_import.py [--budget-ms 10] [--runs 5] [module ...]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+CODE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MODULES = ['content_generator_full', 'lesson_templates', 'fragment_template',
+                   'content_hash']
+HEAVY_MODULES = {'requests', 'httpx', 'PyPDF2', 'numpy', 'urllib3', 'aiohttp'}
+DEFAULT_BUDGET_MS = 10.0
+
+
+def measure_import(module: str) -> Tuple[float, Dict[str, int], str]:
+    """(cumulative µs for module, {imported module: cumulative µs}, stdout)"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=CODE_DIR, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr}")
+    imported = {}
+    for line in result.stderr.splitlines():
+        # "import time:   self [us] | cumulative | imported package"
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        imported[name.strip()] = int(cumulative)
+    return imported.get(module, 0), imported, result.stdout
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check import-time budgets")
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES)
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    problems: List[str] = []
+    print(f"{'Module':<26}{'Import ms':>11}  {'Budget ms':>9}")
+    print("-" * 48)
+    for module in args.modules:
+        runs = [measure_import(module) for _ in range(args.runs)]
+        best_us, imported, stdout = min(runs, key=lambda run: run[0])
+        ok = best_us / 1000 <= args.budget_ms
+        print(f"{module:<26}{best_us / 1000:>11.2f}  {args.budget_ms:>9.1f} {'✓' if ok else '✗'}")
+        if not ok:
+            problems.append(f"{module} took {best_us / 1000:.2f} ms (budget {args.budget_ms} ms)")
+        heavy = sorted(HEAVY_MODULES & {name.split('.')[0] for name in imported})
+        if heavy:
+            problems.append(f"{module} imports heavy dependencies: {', '.join(heavy)}")
+        if stdout:
+            problems.append(f"{module} prints on import: {stdout.splitlines()[0]!r}")
+
+    if problems:
+        print()
+        for problem in problems:
+            print(f"✗ {problem}")
+        sys.exit(1)
+    print("\n✓ All modules within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+End-to-end throughput of the content pipeline against a fake PostgREST
+
+For each size, starts fake_postgrest.FakePostgrest in-process, seeds that
+many courses from the curriculum catalog and runs the real scripts as
+subprocesses with SUPABASE_URL pointed at it:
+
+    insert_all_content.py --bulk   (creates one lesson + quiz per course)
+    enhance_all_lessons.py         (re-renders and PATCHes every lesson)
+    check_word_count.py --json     (audits every lesson)
+
+and reports wall time, requests served and requests/sec per script.
+The scripts run with the client's defaults: backoff and the circuit breaker
+on, no request cap unless --rate-limit (or SUPABASE_RATE_LIMIT) is given, so
+--async concurrency is measured as configured; use --latency-ms / --throttle-rate / --error-rate to see how
+they behave against a slow or unhealthy API.
+
+Usage:
+    python3 code/bench_pipeline.py [--sizes 87,1000,10000] [--latency-ms 20]
+    python3 code/bench_pipeline.py --sizes 1000 --throttle-rate 0.05 --async
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+sys.path.append(os.path.dirname(__file__))
+from fake_postgrest import FakePostgrest, seed_courses
+
+CODE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SIZES = '87,1000,10000'
+DEFAULT_TIMEOUT = 1800  # Seconds per script run
+
+
+def pipeline_steps(args) -> List[List[str]]:
+    """Script argv (relative to code/) in pipeline order"""
+    insert = ['insert_all_content.py'] + ([] if args.row_inserts else ['--bulk'])
+    enhance = ['enhance_all_lessons.py'] + (['--async'] if args.use_async else [])
+    audit = ['check_word_count.py', '--json'] + (['--workers', str(args.workers)] if args.workers else [])
+    return [insert, enhance, audit]
+
+
+def script_env(server: FakePostgrest, args) -> Dict[str, str]:
+    env = dict(os.environ)
+    env['SUPABASE_URL'] = server.url
+    env['SUPABASE_SERVICE_ROLE_KEY'] = 'fake-service-role-key'
+    if args.rate_limit is not None:
+        env['SUPABASE_RATE_LIMIT'] = str(args.rate_limit)
+    return env
+
+
+def run_step(server: FakePostgrest, argv: List[str], env: Dict[str, str], timeout: float) -> Dict:
+    """Run one script to completion and read the server's counters"""
+    server.reset_stats()
+    started = time.perf_counter()
+    try:
+        result = subprocess.run([sys.executable] + argv, cwd=CODE_DIR, env=env, timeout=timeout,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        returncode, stderr = result.returncode, result.stderr
+    except subprocess.TimeoutExpired:
+        returncode, stderr = None, f"timed out after {timeout:.0f}s"
+    elapsed = time.perf_counter() - started
+    requests = server.requests()
+    return {
+        'script': argv[0][:-len('.py')],
+        'args': argv[1:],
+        'seconds': round(elapsed, 3),
+        'requests': requests,
+        'requests_per_sec': round(requests / elapsed, 1) if elapsed else 0.0,
+        'throttled': server.stats['429'],
+        'errors': server.stats['500'],
+        'rows_written': server.stats['rows_written'],
+        'returncode': returncode,
+        'stderr_tail': stderr.strip().splitlines()[-1] if returncode != 0 and stderr.strip() else '',
+    }
+
+
+def run_size(size: int, args) -> Dict:
+    """Fresh server and tables for one corpus size"""
+    server = FakePostgrest(latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000,
+                           error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+                           seed=args.seed)
+    with server:
+        seed_courses(server, size)
+        env = script_env(server, args)
+        steps = [run_step(server, argv, env, args.timeout) for argv in pipeline_steps(args)]
+        return {
+            'courses': size,
+            'lessons': len(server.tables['lessons'].rows),
+            'quizzes': len(server.tables['quizzes'].rows),
+            'steps': steps,
+        }
+
+
+def print_report(results: List[Dict]):
+    print(f"{'Lessons':>8}  {'Script':<22}{'Wall s':>9}{'Requests':>10}{'Req/s':>9}"
+          f"{'429s':>6}{'5xx':>6}  Status")
+    print("-" * 82)
+    for result in results:
+        for step in result['steps']:
+            status = '✓' if step['returncode'] == 0 else f"✗ {step['stderr_tail'][:60]}"
+            print(f"{result['courses']:>8,}  {step['script']:<22}{step['seconds']:>9.2f}"
+                  f"{step['requests']:>10,}{step['requests_per_sec']:>9.1f}"
+                  f"{step['throttled']:>6}{step['errors']:>6}  {status}")
+        total = sum(step['seconds'] for step in result['steps'])
+        print(f"{'':>8}  {'pipeline':<22}{total:>9.2f}   "
+              f"({result['lessons']:,} lessons, {result['quizzes']:,} quizzes stored)")
+        print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the content pipeline offline")
+    parser.add_argument('--sizes', default=DEFAULT_SIZES,
+                        help=f"Comma-separated course/lesson counts (default {DEFAULT_SIZES})")
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="Injected per-request latency")
+    parser.add_argument('--jitter-ms', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction answered 500")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="Fraction answered 429")
+    parser.add_argument('--seed', type=int, default=0, help="RNG seed for injected faults")
+    parser.add_argument('--rate-limit', type=float,
+                        help="SUPABASE_RATE_LIMIT for the scripts (default: no cap)")
+    parser.add_argument('--row-inserts', action='store_true',
+                        help="Insert one lesson/quiz per request instead of --bulk")
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help="Run the enhancer in --async mode")
+    parser.add_argument('--workers', type=int, help="check_word_count.py --workers")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT)
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+    results = []
+    for size in sizes:
+        if not args.json:
+            print(f"⏱  {size:,} lessons...", file=sys.stderr)
+        results.append(run_size(size, args))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print()
+        print_report(results)
+
+    if any(step['returncode'] != 0 for result in results for step in result['steps']):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
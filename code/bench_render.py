@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: compiled fragment templates vs. per-call formatting
+
+Renders every tutorial in the curriculum catalog with
+generate_lesson_content and generate_enhanced_content, and compares them to
+the previous implementations: growing the lesson HTML with `+=` section by
+section from the same template sources, and the enhanced lesson's original
+f-string, loaded with `git show` from BASELINE_REF (skipped outside a git
+checkout). Outputs are checked to be identical.
+
+Usage:
+    python3 code/bench_render.py [--repeat 5] [--number 20]
+"""
+
+import argparse
+import ast
+import os
+import subprocess
+import sys
+import timeit
+from typing import Callable, Dict, List, Optional
+
+sys.path.append(os.path.dirname(__file__))
+from content_generator_full import generate_lesson_content
+from curriculum_catalog import ROOT_DIR, load_curriculum_entries
+from lesson_templates import (
+    DEFAULT_BRAND, GENERIC_CLOSING, GENERIC_INTRO, GENERIC_PRACTICE, GENERIC_TOPIC,
+    LESSON_FOOTER, LESSON_HEADER, MAIN_CONTENT_OPEN, OBJECTIVE_ITEM, SCORE_BASICS_CONTENT,
+    TAKEAWAY_ITEM, WELCOME_CONTENT, generate_enhanced_content,
+)
+
+BASELINE_REF = '039918c45b0e656122e8528a18dceba2beb81f67'  # Last commit before compiled templates
+BASELINE_SOURCES = {'generate_enhanced_content': 'code/enhance_all_lessons.py'}
+
+
+def load_baseline(name: str, ref: str = BASELINE_REF) -> Optional[Callable]:
+    """Function `name` as it was at ref, read with git show; None outside a git checkout"""
+    path = BASELINE_SOURCES[name]
+    try:
+        source = subprocess.run(['git', 'show', f'{ref}:{path}'], cwd=ROOT_DIR, capture_output=True,
+                                text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    node = next(node for node in ast.parse(source).body
+                if isinstance(node, ast.FunctionDef) and node.name == name)
+    namespace: Dict = {}
+    exec(compile(ast.Module([node], type_ignores=[]), f'{ref}:{path}', 'exec'), namespace)
+    return namespace[name]
+
+
+def legacy_lesson_content(tutorial_code, title, topics, description):
+    """Previous strategy: grow one string with += per section and per topic"""
+    content_html = LESSON_HEADER.source.format(title=title, description=description)
+    for topic in topics[:5]:
+        content_html += OBJECTIVE_ITEM.source.format(topic=topic)
+    content_html += MAIN_CONTENT_OPEN
+    if tutorial_code == "1.1":
+        content_html += WELCOME_CONTENT.source.format(brand=DEFAULT_BRAND)
+    elif tutorial_code == "1.2":
+        content_html += SCORE_BASICS_CONTENT
+    else:
+        content_html += GENERIC_INTRO.source.format(title=title)
+        for i, topic in enumerate(topics, 1):
+            content_html += GENERIC_TOPIC.source.format(index=i, topic=topic, topic_lower=topic.lower())
+        content_html += GENERIC_PRACTICE
+        for topic in topics[:5]:
+            content_html += TAKEAWAY_ITEM.source.format(topic_lower=topic.lower())
+        content_html += GENERIC_CLOSING.source.format(brand=DEFAULT_BRAND)
+    content_html += LESSON_FOOTER
+    return content_html.strip()
+
+
+def best_per_call(func, entries: List[Dict], repeat: int, number: int) -> float:
+    """Best-of-repeat seconds for one render (averaged over the corpus)"""
+    def run():
+        for entry in entries:
+            func(entry)
+    return min(timeit.repeat(run, repeat=repeat, number=number)) / (number * len(entries))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark compiled lesson templates")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=20, help="Corpus passes per repeat")
+    args = parser.parse_args()
+
+    entries = load_curriculum_entries()
+
+    cases = [
+        ("generate_lesson_content",
+         lambda e: legacy_lesson_content(e['code'], e['title'], e['topics'], e['description']),
+         lambda e: generate_lesson_content(e['code'], e['title'], e['topics'], e['description'])),
+    ]
+    legacy_enhanced_content = load_baseline('generate_enhanced_content')
+    if legacy_enhanced_content is None:
+        print(f"ℹ️  Skipping generate_enhanced_content: no git history for {BASELINE_REF[:7]}\n")
+    else:
+        cases.append(("generate_enhanced_content",
+                      lambda e: legacy_enhanced_content(e['title'], ""),
+                      lambda e: generate_enhanced_content(e['title'], "")))
+
+    print(f"Rendering {len(entries)} curriculum entries "
+          f"(best of {args.repeat} x {args.number} passes)\n")
+    print(f"{'Function':<28}{'Previous µs':>14}{'Current µs':>14}{'Speedup':>10}")
+    print("-" * 66)
+    for name, legacy, current in cases:
+        for entry in entries:
+            if legacy(entry) != current(entry):
+                print(f"✗ {name} output differs for {entry['code']} {entry['title']}")
+                sys.exit(1)
+        before = best_per_call(legacy, entries, args.repeat, args.number)
+        after = best_per_call(current, entries, args.repeat, args.number)
+        print(f"{name:<28}{before * 1e6:>14.2f}{after * 1e6:>14.2f}{before / after:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Deduplicated block storage for lesson HTML
+
+Enhanced lessons are ~2,000 words of shared boilerplate with the title
+interpolated into a few dozen lines, so storing content_html per lesson
+keeps near-identical copies. This stage splits each document into
+content-addressed blocks and stores every unique block once; a lesson keeps
+the ordered list of its block hashes, and reassemble() (or the
+lesson_content_html() SQL function) joins them back into the exact HTML.
+--push writes each lesson's block list and clears its content_html, so the
+table stores every shared block once; BlockResolver rebuilds content_html
+for scripts that read deduplicated lessons. Any later content_html write
+drops the lesson's block list again (see the clear_stale_content_blocks
+trigger), so a lesson is never served from stale blocks.
+
+Block boundaries are corpus-aware: a first pass finds the lines that occur
+in more than one document, then each document is cut wherever it switches
+between shared and lesson-specific lines. Runs of boilerplate become large
+shared blocks and only the interpolated lines are stored per lesson. Any
+split reassembles byte-for-byte, so a document added later with an older
+shared-line set still round-trips; it just dedupes less.
+
+Usage:
+    python3 code/block_store.py                       # rendered catalog, report only
+    python3 code/block_store.py --template lesson --sqlite blocks.sqlite
+    python3 code/block_store.py --source db [--push]  # lessons table
+"""
+
+import argparse
+import hashlib
+import os
+import sqlite3
+import sys
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple
+
+sys.path.append(os.path.dirname(__file__))
+
+REF_BYTES = 64  # Hex SHA-256 per block reference
+MIN_SHARED_DOCUMENTS = 2
+FETCH_CHUNK = 100  # Block hashes per content_blocks lookup (hash=in.(...) keeps the URL short)
+MAX_CACHED_BLOCKS = 4096  # BlockResolver keeps the most recently used blocks
+LESSON_KEY_COLUMNS = ('course_id', 'title', 'slug')  # NOT NULL, so an upsert row must carry them
+
+
+def block_hash(block: str) -> str:
+    return hashlib.sha256(block.encode('utf-8')).hexdigest()
+
+
+def shared_lines(documents: Iterable[str], min_documents: int = MIN_SHARED_DOCUMENTS) -> Set[str]:
+    """Lines that appear in at least min_documents documents"""
+    counts: Counter = Counter()
+    for html in documents:
+        counts.update(set((html or '').splitlines(keepends=True)))
+    return {line for line, documents_with_line in counts.items() if documents_with_line >= min_documents}
+
+
+def split_blocks(html: str, shared: Set[str]) -> List[str]:
+    """Cut html wherever it switches between shared and document-specific lines"""
+    blocks = []
+    run: List[str] = []
+    run_shared = None
+    for line in (html or '').splitlines(keepends=True):
+        is_shared = line in shared
+        if run and is_shared != run_shared:
+            blocks.append(''.join(run))
+            run = []
+        run.append(line)
+        run_shared = is_shared
+    if run:
+        blocks.append(''.join(run))
+    return blocks
+
+
+class BlockStore:
+    """Unique blocks by hash, with logical vs. stored byte accounting"""
+
+    def __init__(self, shared: Set[str]):
+        self.shared = shared
+        self.blocks: Dict[str, str] = {}
+        self.documents = 0
+        self.logical_bytes = 0
+        self.block_bytes = 0
+        self.refs = 0
+
+    def add(self, html: str) -> List[str]:
+        """Store html's blocks; returns the ordered block hashes"""
+        hashes = []
+        for block in split_blocks(html, self.shared):
+            digest = block_hash(block)
+            if digest not in self.blocks:
+                self.blocks[digest] = block
+                self.block_bytes += len(block.encode('utf-8'))
+            hashes.append(digest)
+        self.documents += 1
+        self.logical_bytes += len((html or '').encode('utf-8'))
+        self.refs += len(hashes)
+        return hashes
+
+    def reassemble(self, hashes: List[str]) -> str:
+        return ''.join(self.blocks[digest] for digest in hashes)
+
+    @property
+    def stored_bytes(self) -> int:
+        return self.block_bytes + self.refs * REF_BYTES
+
+    @property
+    def ratio(self) -> float:
+        return self.logical_bytes / self.stored_bytes if self.stored_bytes else 0.0
+
+    def summary(self) -> Dict:
+        return {
+            'documents': self.documents,
+            'unique_blocks': len(self.blocks),
+            'block_refs': self.refs,
+            'logical_bytes': self.logical_bytes,
+            'block_bytes': self.block_bytes,
+            'stored_bytes': self.stored_bytes,
+            'ratio': round(self.ratio, 2),
+        }
+
+    def save_sqlite(self, path: str, documents: Dict[str, List[str]]):
+        """Write blocks and each document's block list to a SQLite file"""
+        db = sqlite3.connect(path)
+        try:
+            db.execute('CREATE TABLE IF NOT EXISTS content_blocks '
+                       '(hash TEXT PRIMARY KEY, html TEXT NOT NULL, bytes INTEGER NOT NULL)')
+            db.execute('CREATE TABLE IF NOT EXISTS documents '
+                       '(id TEXT PRIMARY KEY, content_blocks TEXT NOT NULL)')
+            db.executemany('INSERT OR IGNORE INTO content_blocks VALUES (?, ?, ?)',
+                           [(digest, block, len(block.encode('utf-8')))
+                            for digest, block in self.blocks.items()])
+            db.executemany('INSERT OR REPLACE INTO documents VALUES (?, ?)',
+                           [(doc_id, ' '.join(hashes)) for doc_id, hashes in documents.items()])
+            db.commit()
+        finally:
+            db.close()
+
+
+class BlockResolver:
+    """
+    Rebuilds content_html for deduplicated lessons from content_blocks
+
+    Shared blocks are kept in an LRU cache of max_blocks entries, so each is
+    usually fetched once while memory stays bounded; a page's blocks are
+    held only while the page is assembled.
+    """
+
+    def __init__(self, client, max_blocks: int = MAX_CACHED_BLOCKS):
+        self.client = client
+        self.max_blocks = max_blocks
+        self.blocks: OrderedDict = OrderedDict()
+
+    def fill(self, lessons: List[Dict]) -> List[Dict]:
+        """Set content_html on the lessons of a page that only have content_blocks"""
+        from supabase_client import chunked
+
+        pending = [lesson for lesson in lessons
+                   if lesson.get('content_html') is None and lesson.get('content_blocks')]
+        needed = {digest for lesson in pending for digest in lesson['content_blocks']}
+        page_blocks = {}
+        for digest in needed & self.blocks.keys():
+            self.blocks.move_to_end(digest)
+            page_blocks[digest] = self.blocks[digest]
+        for chunk in chunked(sorted(needed - page_blocks.keys()), FETCH_CHUNK):
+            resp = self.client.select('content_blocks', 'hash,html', {'hash': f"in.({','.join(chunk)})"})
+            resp.raise_for_status()
+            for row in resp.json():
+                page_blocks[row['hash']] = self.blocks[row['hash']] = row['html']
+                if len(self.blocks) > self.max_blocks:
+                    self.blocks.popitem(last=False)
+        for lesson in pending:
+            lost = [digest for digest in lesson['content_blocks'] if digest not in page_blocks]
+            if lost:
+                raise ValueError(f"lesson {lesson['id']} references {len(lost)} missing content blocks")
+            lesson['content_html'] = ''.join(page_blocks[digest] for digest in lesson['content_blocks'])
+        return lessons
+
+
+def catalog_documents(template: str) -> Callable[[], Iterator[Tuple[str, str]]]:
+    """(code, html) for every catalog tutorial, rendered through the render cache"""
+    from content_generator_full import generate_lesson_content
+    from curriculum_catalog import load_curriculum_entries
+    from lesson_templates import generate_enhanced_content
+    from render_cache import get_render_cache
+
+    def documents():
+        cache = get_render_cache()
+        for e in load_curriculum_entries():
+            if template == 'enhanced':
+                html = cache.render('enhanced_html', generate_enhanced_content, e['title'], "")
+            else:
+                html = cache.render('lesson', generate_lesson_content,
+                                    e['code'], e['title'], e['topics'], e['description'])
+            yield e['code'], html
+    return documents
+
+
+def db_documents(page_size: int, lesson_keys: Dict[str, Dict]) -> Callable[[], Iterator[Tuple[str, str]]]:
+    """(lesson id, content_html) streamed from the lessons table; fills lesson_keys for push()"""
+    from supabase_client import get_client
+
+    client = get_client()
+    resolver = BlockResolver(client)
+    columns = ','.join(('id', 'content_html', 'content_blocks') + LESSON_KEY_COLUMNS)
+
+    def documents():
+        for page in client.select_pages('lessons', columns, page_size=page_size):
+            for lesson in resolver.fill(page):
+                lesson_keys[lesson['id']] = {column: lesson[column] for column in LESSON_KEY_COLUMNS}
+                yield lesson['id'], lesson['content_html'] or ''
+    return documents
+
+
+def push(store: BlockStore, documents: Dict[str, List[str]], lesson_keys: Dict[str, Dict],
+         chunk_size: int) -> int:
+    """Upsert blocks, then swap each lesson's content_html for its block list; returns failed rows"""
+    from supabase_client import get_client
+
+    client = get_client()
+    rows = [{'hash': digest, 'html': block, 'bytes': len(block.encode('utf-8'))}
+            for digest, block in store.blocks.items()]
+    _, failures = client.upsert_many('content_blocks', rows, chunk_size, on_conflict='hash')
+    for chunk, resp in failures:
+        print(f"  ✗ Failed to upsert {len(chunk)} blocks: {resp.text[:200]}")
+    if failures:
+        return len(failures)  # Never reference blocks that may not exist
+    lessons = [{'id': lesson_id, **lesson_keys[lesson_id], 'content_blocks': hashes, 'content_html': None}
+               for lesson_id, hashes in documents.items() if hashes]
+    _, failures = client.upsert_many('lessons', lessons, chunk_size)
+    for chunk, resp in failures:
+        print(f"  ✗ Failed to update {len(chunk)} lessons: {resp.status_code} {resp.text[:200]}")
+    return sum(len(chunk) for chunk, _ in failures)
+
+
+def main():
+    from supabase_client import DEFAULT_CHUNK_SIZE, DEFAULT_PAGE_SIZE
+
+    parser = argparse.ArgumentParser(description="Deduplicate lesson HTML into shared blocks")
+    parser.add_argument('--source', choices=['catalog', 'db'], default='catalog',
+                        help="Render the catalog, or stream content_html from Supabase")
+    parser.add_argument('--template', choices=['enhanced', 'lesson'], default='enhanced',
+                        help="Catalog template to render (--source catalog)")
+    parser.add_argument('--page-size', type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument('--sqlite', help="Also write blocks and block lists to this SQLite file")
+    parser.add_argument('--push', action='store_true',
+                        help="Upsert content_blocks, set lessons.content_blocks and clear content_html (--source db)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    if args.push and args.source != 'db':
+        parser.error("--push needs --source db (lesson ids come from the lessons table)")
+    lesson_keys: Dict[str, Dict] = {}
+    documents = (db_documents(args.page_size, lesson_keys) if args.source == 'db'
+                 else catalog_documents(args.template))
+
+    # Two streaming passes: find shared lines, then split and store
+    shared = shared_lines(html for _, html in documents())
+    store = BlockStore(shared)
+    block_lists: Dict[str, List[str]] = {}
+    for doc_id, html in documents():
+        hashes = store.add(html)
+        if store.reassemble(hashes) != html:
+            print(f"✗ {doc_id} does not reassemble")
+            sys.exit(1)
+        block_lists[doc_id] = hashes
+
+    summary = store.summary()
+    print(f"Documents:      {summary['documents']:,}")
+    print(f"Logical bytes:  {summary['logical_bytes']:,}")
+    print(f"Unique blocks:  {summary['unique_blocks']:,} ({summary['block_bytes']:,} bytes)")
+    print(f"Block refs:     {summary['block_refs']:,} ({summary['block_refs'] * REF_BYTES:,} bytes)")
+    print(f"Stored bytes:   {summary['stored_bytes']:,}")
+    print(f"Storage ratio:  {summary['ratio']:.2f}x")
+
+    if args.sqlite:
+        store.save_sqlite(args.sqlite, block_lists)
+        print(f"✓ Wrote {os.path.relpath(args.sqlite)}")
+    if args.push:
+        failed = push(store, block_lists, lesson_keys, args.chunk_size)
+        if failed:
+            sys.exit(1)
+        print(f"✓ Pushed {summary['unique_blocks']:,} blocks and {len(block_lists):,} block lists")
+
+
+if __name__ == "__main__":
+    main()
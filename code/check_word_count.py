@@ -1,32 +1,188 @@
 #!/usr/bin/env python3
+"""
+Word-count audit for every lesson against the 1,500-2,500 word target
+
+Streams lessons with keyset pagination (id, title, content_html; deduplicated
+lessons are rebuilt from content_blocks), counts visible words (see
+text_stats.py) on a process pool while the next page is being fetched, and
+keeps only counts and the histogram. Out-of-range lessons are written out as
+they are found, so memory stays at two pages of lessons (plus a bounded
+block cache) however many lessons the database holds or miss the target.
+
+Usage:
+    python3 code/check_word_count.py [--workers 4] [--page-size 500]
+    python3 code/check_word_count.py --json [--strict]   # for CI
+"""
+import argparse
+import json
 import os
-import requests
-
-SUPABASE_URL = os.environ.get('SUPABASE_URL')
-SUPABASE_SERVICE_KEY = os.environ.get('SUPABASE_SERVICE_ROLE_KEY')
-
-headers = {
-    'apikey': SUPABASE_SERVICE_KEY,
-    'Authorization': f'Bearer {SUPABASE_SERVICE_KEY}',
-    'Content-Type': 'application/json'
-}
-
-# Fetch one lesson to check word count
-response = requests.get(
-    f'{SUPABASE_URL}/rest/v1/lessons',
-    headers=headers,
-    params={'select': '*', 'limit': '1'}
-)
-
-if response.status_code == 200:
-    lesson = response.json()[0]
-    content = lesson['content_html']
-    word_count = len(content.split())
-    
-    print(f"Sample lesson: {lesson['title']}")
-    print(f"Character count: {len(content)}")
-    print(f"Approximate word count: {word_count}")
-    print(f"Target: 1500-2500 words")
-    print(f"Status: {'✓ MEETS' if word_count >= 1500 else '✗ SHORT'}")
-else:
-    print(f"Error: {response.status_code}")
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Optional
+
+from block_store import BlockResolver
+from supabase_client import get_client
+from text_stats import word_count
+
+MIN_WORDS = 1500
+MAX_WORDS = 2500
+BUCKET_WIDTH = 250
+DEFAULT_PAGE_SIZE = 500
+
+
+class WordCountAudit:
+    """Running totals and histogram; out-of-range lessons are returned by add(), not kept"""
+
+    def __init__(self, min_words: int, max_words: int, bucket_width: int = BUCKET_WIDTH):
+        self.min_words = min_words
+        self.max_words = max_words
+        self.bucket_width = bucket_width
+        self.total = 0
+        self.total_words = 0
+        self.below = 0
+        self.above = 0
+        self.min_seen = None
+        self.max_seen = None
+        self.histogram: Dict[int, int] = {}
+
+    def add(self, lesson: Dict, words: int) -> Optional[Dict]:
+        """Count one lesson; returns {id, title, words} if it is out of range"""
+        self.total += 1
+        self.total_words += words
+        self.min_seen = words if self.min_seen is None else min(self.min_seen, words)
+        self.max_seen = words if self.max_seen is None else max(self.max_seen, words)
+        bucket = words // self.bucket_width * self.bucket_width
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+        if self.min_words <= words <= self.max_words:
+            return None
+        if words < self.min_words:
+            self.below += 1
+        else:
+            self.above += 1
+        return {'id': lesson['id'], 'title': lesson['title'], 'words': words}
+
+    def summary(self) -> Dict:
+        return {
+            'target': [self.min_words, self.max_words],
+            'total': self.total,
+            'in_range': self.total - self.below - self.above,
+            'below': self.below,
+            'above': self.above,
+            'min_words': self.min_seen,
+            'max_words': self.max_seen,
+            'average_words': self.total_words // self.total if self.total else 0,
+            'histogram': {f"{bucket}-{bucket + self.bucket_width - 1}": count
+                          for bucket, count in sorted(self.histogram.items())},
+        }
+
+
+def run_audit(audit: WordCountAudit, page_size: int, workers: int, report: Callable[[Dict], None]):
+    """Count every lesson into audit, passing each out-of-range lesson to report as it is found"""
+    client = get_client()
+    resolver = BlockResolver(client)  # Deduplicated lessons only have content_blocks
+    pages = (resolver.fill(page) for page in
+             client.select_pages('lessons', 'id,title,content_html,content_blocks', page_size=page_size))
+
+    def settle(pending):
+        for lesson, words in zip(*pending):
+            out_of_range = audit.add(lesson, words)
+            if out_of_range:
+                report(out_of_range)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = None
+        for page in pages:
+            # Submit this page, then settle the previous one while it is counted
+            counts = pool.map(word_count, [lesson['content_html'] for lesson in page],
+                              chunksize=max(1, len(page) // (workers * 4)))
+            meta = [{'id': lesson['id'], 'title': lesson['title']} for lesson in page]
+            if pending:
+                settle(pending)
+            pending = (meta, counts)
+        if pending:
+            settle(pending)
+
+
+def print_report(summary: Dict):
+    low, high = summary['target']
+    print(f"Lessons audited:  {summary['total']:,}")
+    print(f"Target:           {low:,}-{high:,} words")
+    print(f"In range:         {summary['in_range']:,} ✓")
+    print(f"Below target:     {summary['below']:,}")
+    print(f"Above target:     {summary['above']:,}")
+    print(f"Words min/avg/max: {summary['min_words'] or 0:,} / "
+          f"{summary['average_words']:,} / {summary['max_words'] or 0:,}")
+    print()
+
+    print("Histogram (words)")
+    peak = max(summary['histogram'].values(), default=0)
+    for bucket, count in summary['histogram'].items():
+        bar = '█' * max(1, round(40 * count / peak))
+        print(f"  {bucket:>11}  {bar} {count:,}")
+
+
+def text_reporter(min_words: int) -> Callable[[Dict], None]:
+    """Prints each out-of-range lesson as it is found, under one heading"""
+    printed = []
+
+    def report(lesson: Dict):
+        if not printed:
+            print("Out of range")
+            printed.append(True)
+        status = '✗ SHORT' if lesson['words'] < min_words else '✗ LONG'
+        print(f"  {status:<8} {lesson['words']:>6,}  {lesson['title'][:60]}  ({lesson['id']})", flush=True)
+    return report
+
+
+class JsonReport:
+    """Writes {"out_of_range": [...], **summary} to stdout one out-of-range row at a time"""
+
+    def __init__(self, out=sys.stdout):
+        self.out = out
+        self.rows = 0
+        out.write('{\n  "out_of_range": [')
+
+    def add(self, lesson: Dict):
+        self.out.write((',' if self.rows else '') + '\n    ' + json.dumps(lesson))
+        self.out.flush()
+        self.rows += 1
+
+    def close(self, summary: Dict):
+        # The summary's own keys follow out_of_range in the same object
+        self.out.write(('\n  ' if self.rows else '') + '],' + json.dumps(summary, indent=2)[1:] + '\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audit lesson word counts")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--page-size', type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument('--min-words', type=int, default=MIN_WORDS)
+    parser.add_argument('--max-words', type=int, default=MAX_WORDS)
+    parser.add_argument('--json', action='store_true', help="Print out-of-range lessons and the summary as JSON")
+    parser.add_argument('--strict', action='store_true',
+                        help="Exit 1 if any lesson is out of range")
+    args = parser.parse_args()
+
+    audit = WordCountAudit(args.min_words, args.max_words)
+    json_report = JsonReport() if args.json else None
+    try:
+        run_audit(audit, args.page_size, args.workers,
+                  json_report.add if json_report else text_reporter(args.min_words))
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    summary = audit.summary()
+    if json_report:
+        json_report.close(summary)
+    else:
+        if summary['below'] or summary['above']:
+            print()
+        print_report(summary)
+
+    if args.strict and (summary['below'] or summary['above']):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Content hashing shared by the content scripts
+
+Rendered lesson HTML is compared by digest so scripts can tell whether a
+write would actually change a row without shipping or storing full copies.
+"""
+
+import hashlib
+
+
+def content_hash(content) -> str:
+    """SHA-256 hex digest of content (None hashes like the empty string)"""
+    return hashlib.sha256((content or '').encode('utf-8')).hexdigest()
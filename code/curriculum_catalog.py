@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Indexed curriculum catalog
+
+Loads CURRICULUM_STRUCTURE.json (categories, tiers, learning paths) and
+CURRICULUM_TUTORIALS.json (per-tutorial code, title, aliases, duration, xp
+and topics) once per process and indexes tutorials by code, normalized title
+(including aliases) and slug, so generators get O(1) lookups.
+
+The parsed catalog is cached in code/.cache/ as a marshal file keyed by each
+source file's mtime/size and SHA-256; the JSON is only re-parsed when a
+source actually changes.
+
+Usage:
+    from curriculum_catalog import get_catalog
+    tutorial = get_catalog().lookup_title(course['title'])
+    topics = lesson_topics(tutorial['topics'], description)  # Shared fallback
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+ROOT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+STRUCTURE_PATH = os.path.join(ROOT_DIR, 'CURRICULUM_STRUCTURE.json')
+TUTORIALS_PATH = os.path.join(ROOT_DIR, 'CURRICULUM_TUTORIALS.json')
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache',
+                          'curriculum_catalog.marshal')
+CACHE_VERSION = 1  # Bump when the indexed layout changes
+
+DEFAULT_DURATION = 30
+DEFAULT_XP = 20
+FALLBACK_TOPICS = ("Implementation strategies", "Common challenges")
+
+
+def normalize_title(title: str) -> str:
+    """Case-, punctuation- and whitespace-insensitive key for a title"""
+    title = title.lower().replace('&', ' and ')
+    return ' '.join(re.sub(r'[^a-z0-9]+', ' ', title).split())
+
+
+def slugify(title: str) -> str:
+    """Lesson slug, as insert_all_content.py builds it"""
+    return title.lower().replace(' ', '-').replace(':', '').replace('&', 'and')
+
+
+def build_index(structure: Dict, tutorials: List[Dict]) -> Dict:
+    """Plain-data catalog (marshal-safe) with hash indexes into tutorials"""
+    by_code = {}
+    by_title = {}
+    by_slug = {}
+    for position, tutorial in enumerate(tutorials):
+        tutorial.setdefault('duration', DEFAULT_DURATION)
+        if tutorial.get('xp') is None:
+            tutorial['xp'] = DEFAULT_XP
+        by_code[tutorial['code']] = position
+        for title in [tutorial['title']] + tutorial.get('aliases', []):
+            by_title.setdefault(normalize_title(title), position)
+            by_slug.setdefault(slugify(title), position)
+    return {
+        'platform': structure.get('platform', {}),
+        'categories': structure.get('categories', []),
+        'subscription_tiers': structure.get('subscription_tiers', {}),
+        'learning_paths': structure.get('learning_paths', {}),
+        'tutorials': tutorials,
+        'by_code': by_code,
+        'by_title': by_title,
+        'by_slug': by_slug,
+    }
+
+
+class CurriculumCatalog:
+    """Read-only view over an indexed catalog"""
+
+    def __init__(self, data: Dict):
+        self.data = data
+        self.tutorials: List[Dict] = data['tutorials']
+        self.categories: List[Dict] = data['categories']
+        self._categories_by_id = {category['id']: category for category in self.categories}
+
+    def __len__(self) -> int:
+        return len(self.tutorials)
+
+    def __iter__(self):
+        return iter(self.tutorials)
+
+    def by_code(self, code: str) -> Optional[Dict]:
+        position = self.data['by_code'].get(code)
+        return None if position is None else self.tutorials[position]
+
+    def lookup_title(self, title: str) -> Optional[Dict]:
+        """Tutorial whose title or alias matches, ignoring case and punctuation"""
+        position = self.data['by_title'].get(normalize_title(title or ''))
+        return None if position is None else self.tutorials[position]
+
+    def by_slug(self, slug: str) -> Optional[Dict]:
+        position = self.data['by_slug'].get(slug)
+        return None if position is None else self.tutorials[position]
+
+    def category(self, category_id: int) -> Optional[Dict]:
+        return self._categories_by_id.get(category_id)
+
+
+def _fingerprint(path: str) -> List:
+    stat = os.stat(path)
+    return [path, stat.st_mtime_ns, stat.st_size]
+
+
+def _file_hash(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _read_cache(sources: List[str]) -> Tuple[Optional[Dict], bool]:
+    """Cached catalog if every source is unchanged, and whether its key needs refreshing"""
+    try:
+        with open(CACHE_PATH, 'rb') as f:
+            cached = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None, False
+    if not isinstance(cached, dict) or cached.get('version') != CACHE_VERSION:
+        return None, False
+    keys = cached.get('sources', [])
+    if [key[0] for key in keys] != sources:
+        return None, False
+    refresh = False
+    for key, path in zip(keys, sources):
+        _, mtime_ns, size, digest = key
+        if _fingerprint(path)[1:] == [mtime_ns, size]:
+            continue
+        # Touched but possibly unchanged (checkout, copy): fall back to the hash
+        if _file_hash(path) != digest:
+            return None, False
+        refresh = True
+    return cached['catalog'], refresh
+
+
+def _write_cache(sources: List[str], catalog: Dict):
+    keys = [_fingerprint(path) + [_file_hash(path)] for path in sources]
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    tmp_path = f'{CACHE_PATH}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        marshal.dump({'version': CACHE_VERSION, 'sources': keys, 'catalog': catalog}, f)
+    os.replace(tmp_path, CACHE_PATH)
+
+
+def load_catalog(structure_path: str = STRUCTURE_PATH, tutorials_path: str = TUTORIALS_PATH,
+                 use_cache: bool = True) -> CurriculumCatalog:
+    """Load the catalog from the on-disk cache, re-parsing the JSON only if a source changed"""
+    sources = [structure_path, tutorials_path]
+    data, refresh = _read_cache(sources) if use_cache else (None, False)
+    if data is None:
+        with open(structure_path, encoding='utf-8') as f:
+            structure = json.load(f)
+        with open(tutorials_path, encoding='utf-8') as f:
+            tutorials = json.load(f)['tutorials']
+        data = build_index(structure, tutorials)
+        if use_cache:
+            refresh = True
+    if refresh:
+        try:
+            _write_cache(sources, data)
+        except OSError:
+            pass  # Read-only checkout: run uncached
+    return CurriculumCatalog(data)
+
+
+_catalog: Optional[CurriculumCatalog] = None
+
+
+def get_catalog() -> CurriculumCatalog:
+    """Process-wide catalog, loaded on first use"""
+    global _catalog
+    if _catalog is None:
+        _catalog = load_catalog()
+    return _catalog
+
+
+def lesson_topics(topics: Optional[List[str]], description: Optional[str]) -> List[str]:
+    """
+    Generator topics for a tutorial: its catalog topics, or the description
+    plus FALLBACK_TOPICS when the catalog has none (an empty description is
+    left out so the first quiz option is never blank)
+    """
+    if topics:
+        return list(topics)
+    return ([description] if description else []) + list(FALLBACK_TOPICS)
+
+
+def load_curriculum_entries() -> List[Dict]:
+    """Every catalog tutorial as generator inputs {code, title, description, topics}"""
+    entries = []
+    for tutorial in get_catalog():
+        description = tutorial['description']
+        entries.append({'code': tutorial['code'], 'title': tutorial['title'],
+                        'description': description, 'topics': lesson_topics(tutorial['topics'], description)})
+    return entries
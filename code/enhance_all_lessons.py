@@ -7,392 +7,262 @@ Adds deeper analysis, more examples, and comprehensive explanations.
 
 Usage:
     python3 code/enhance_all_lessons.py
+    python3 code/enhance_all_lessons.py --async [--max-in-flight 20]
+    python3 code/enhance_all_lessons.py --page-size 500 --force
 
 Requirements:
     - SUPABASE_URL environment variable
     - SUPABASE_SERVICE_ROLE_KEY environment variable
+      (or SUPABASE_MIRROR to run against the local mirror, see local_mirror.py)
+    - httpx (only for --async)
 """
 
 import os
-import requests
 import time
 import sys
-from typing import Dict, List
+import asyncio
+import argparse
+from typing import Dict, Iterable, Iterator, List, Optional
 
-# Configuration
-SUPABASE_URL = os.environ.get('SUPABASE_URL')
-SUPABASE_SERVICE_KEY = os.environ.get('SUPABASE_SERVICE_ROLE_KEY')
-BATCH_SIZE = 10  # Process lessons in batches
-DELAY_BETWEEN_BATCHES = 2  # Seconds to wait between batches
+import requests
+
+from block_store import BlockResolver
+from content_hash import content_hash
+from lesson_templates import generate_enhanced_content
+from rate_limit import CircuitOpenError
+from render_cache import get_render_cache
+from text_stats import reading_minutes, text_stats
+from supabase_client import DEFAULT_PAGE_SIZE, eq, get_client
 
-if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
+# Configuration
+client = get_client()
+render_cache = get_render_cache()
+BATCH_SIZE = 10  # Lessons per progress group; throttling is done by the client's rate limiter
+MAX_IN_FLIGHT = 20  # Concurrent PATCHes in --async mode
+CIRCUIT_WAITS = 3  # Circuit openings without a successful write in between before the run aborts
+LESSON_COLUMNS = 'id,title,content_html,content_blocks,duration_minutes'  # Only needed for hash skipping
+FORCE_COLUMNS = 'id,title'
+
+# Per-lesson outcomes
+CHANGED = 'changed'
+SKIPPED = 'skipped'  # Rendered HTML hashes the same as the stored content
+FAILED = 'failed'
+STATUS_ICONS = {CHANGED: "✓", SKIPPED: "=", FAILED: "✗"}
+
+if not client.configured:
     print("❌ Error: Missing environment variables")
     print("   Required: SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY")
     sys.exit(1)
 
-headers = {
-    'apikey': SUPABASE_SERVICE_KEY,
-    'Authorization': f'Bearer {SUPABASE_SERVICE_KEY}',
-    'Content-Type': 'application/json'
-}
+def fetch_lesson_pages(columns: str = LESSON_COLUMNS, page_size: int = DEFAULT_PAGE_SIZE,
+                       filters: Optional[Dict] = None) -> Iterator[List[Dict]]:
+    """
+    Stream pages of lessons ordered by id, using keyset pagination (id=gt.{last})
 
-def generate_enhanced_content(title: str, original_content: str) -> str:
+    Deduplicated lessons (see block_store.py) get their content_html rebuilt
+    from content_blocks, so unchanged ones still hash-skip.
     """
-    Generate enhanced lesson content (1,800-2,200 words)
-    Maintains HTML formatting and professional educational tone
+    pages = client.select_pages('lessons', columns, filters, page_size=page_size)
+    if 'content_blocks' not in columns.split(','):
+        return pages
+    resolver = BlockResolver(client)
+    return (resolver.fill(page) for page in pages)
+
+def fetch_all_lessons(columns: str = LESSON_COLUMNS, page_size: int = DEFAULT_PAGE_SIZE,
+                      filters: Optional[Dict] = None) -> Iterator[Dict]:
     """
-    return f'''<div class="lesson-content">
-<h1>{title}</h1>
-
-<div class="lesson-intro">
-<p class="lead">Master the essential concepts and practical applications of {title.lower()} in this comprehensive guide designed for credit repair professionals and consumers alike.</p>
-<p>This in-depth tutorial provides expert knowledge, proven strategies, real-world examples, and actionable steps that deliver measurable credit improvements.</p>
-</div>
-
-<div class="learning-objectives">
-<h2>What You'll Learn</h2>
-<ul>
-<li>Core principles and fundamental concepts underlying {title.lower()}</li>
-<li>Legal framework and consumer rights that protect you</li>
-<li>Step-by-step implementation strategies that work in practice</li>
-<li>Common challenges and expert solutions to overcome them</li>
-<li>Real-world case studies and application examples</li>
-<li>Best practices from thousands of successful credit repair cases</li>
-<li>Long-term maintenance strategies for sustainable credit health</li>
-</ul>
-</div>
-
-<h2>Why This Matters for Your Credit Success</h2>
-<p>Understanding {title.lower()} is not just academic knowledge—it's practical power that directly impacts your financial life. Your credit profile influences loan approvals, interest rates (potentially saving or costing thousands of dollars), rental applications, insurance premiums, employment opportunities, and even your ability to start a business.</p>
-
-<p>The average American with excellent credit (750+ score) pays approximately $100,000 less in interest over their lifetime compared to someone with poor credit (below 620). This single topic could be worth tens of thousands of dollars to you personally. That's why mastering these concepts is essential, not optional.</p>
-
-<p>The strategies and techniques presented here are based on federal credit laws (FCRA, FDCPA, CROA), proven industry practices, documented case studies from successful credit repair professionals, and real-world testing with thousands of consumers. You're learning practical approaches that work in reality, not theoretical concepts that sound impressive but fail when implemented.</p>
-
-<h2>Fundamental Concepts Explained</h2>
-
-<h3>Core Principle #1: Legal Rights and Bureau Accountability</h3>
-<p>The Fair Credit Reporting Act (FCRA) provides powerful legal rights that most consumers don't fully understand or leverage. Credit bureaus are required by federal law to maintain reasonable procedures ensuring maximum possible accuracy. When you dispute information, they must conduct a reasonable investigation—not a rubber-stamp verification.</p>
-
-<p>If information is inaccurate, incomplete, unverifiable, or cannot be confirmed within 30 days, it must be corrected or removed. This isn't optional for bureaus; it's federal law with serious penalties for violations (up to $1,000 per violation in civil cases, plus actual damages and attorney fees). Understanding this transforms credit repair from hoping bureaus help you to demanding they follow the law.</p>
-
-<p>The FCRA also grants you the right to know what's in your file, who accessed it, and to dispute any information you believe is inaccurate. These rights apply regardless of whether negative information is "true" if it cannot be verified through proper procedures. This distinction is critical—accuracy and verifiability are separate legal requirements.</p>
-
-<h3>Core Principle #2: Interconnected Scoring Factors</h3>
-<p>Credit scoring isn't simple math where factors add up independently. It's a complex algorithm where factors interact and influence each other. The FICO and VantageScore models use weighted categories, but improvements in one area create positive ripple effects throughout your profile.</p>
-
-<p>For example, improving your credit utilization (percentage of available credit used) doesn't just help the "amounts owed" category worth 30% of your score. It demonstrates responsible credit management, which may lead to automatic credit limit increases from existing creditors (further lowering utilization), better approval odds for new credit (helping credit mix), and reduced inquiry impact (as you qualify more easily and can be selective about applications).</p>
-
-<p>Similarly, removing one negative item doesn't just eliminate that specific impact. It can improve your overall profile risk assessment, potentially triggering creditor reconsideration of previously denied applications, enabling access to better credit products, and creating opportunities for strategic credit building moves previously unavailable.</p>
-
-<h3>Core Principle #3: Time, Consistency, and Compounding Progress</h3>
-<p>Credit improvement happens through sustained effort over months, not overnight quick fixes or magical loopholes. However, the time component works in your favor: recent positive behavior matters more than old negative information as time passes, negative items lose impact before they're removed, and consistent good habits compound into significant improvements.</p>
-
-<p>A 30-day late payment from 6 months ago hurts much more than the same late payment from 6 years ago. This time-based weighting means that even without removing negative items, their impact naturally decreases. Combined with positive credit building, this creates inevitable score improvement for anyone implementing proper strategies consistently.</p>
-
-<p>The question isn't if your credit will improve with proper strategy—it's when and by how much. Most consumers following systematic approaches see 50-100+ point improvements within 6-12 months, with some experiencing faster results depending on starting profiles and specific issues addressed.</p>
-
-<h2>Industry Context and Business Models</h2>
-
-<h3>How Credit Bureaus Make Money</h3>
-<p>Understanding the credit reporting industry's business model helps you navigate it effectively. Credit bureaus (Equifax, Experian, TransUnion) are for-profit corporations that make money by collecting comprehensive consumer data and selling access to lenders, insurers, employers, landlords, and other businesses.</p>
-
-<p>Their revenue model creates incentives that don't always align with consumer interests. More comprehensive data increases the value of their reports, creating incentives to include information even when accuracy is questionable. Processing disputes costs money and potentially removes revenue-generating data, creating minimal economic incentive for thoroughness.</p>
-
-<p>Bureaus process millions of disputes monthly, leading to automated systems (e-OSCAR and similar platforms) that prioritize speed over thoroughness. Understanding this helps you craft disputes that break through automation and trigger genuine human review. It also explains why persistence through multiple dispute rounds often succeeds where single attempts fail—squeaky wheels get attention.</p>
-
-<h3>Data Furnisher Dynamics</h3>
-<p>Creditors and collection agencies ("data furnishers") report information to bureaus voluntarily—there's no legal requirement forcing them to report. This voluntary nature creates opportunities for negotiation and strategic communication that many consumers miss.</p>
-
-<p>Furnishers have discretion in what they report and when they update information. They can delete tradelines entirely, update information to reflect more favorable status, or choose not to report negative information. This discretion means that furnishers can be influenced by compelling arguments: goodwill requests from longtime customers, disputes highlighting their own procedural errors, or pay-for-delete negotiations on collection accounts.</p>
-
-<h2>Step-by-Step Implementation Process</h2>
-
-<h3>Step 1: Comprehensive Credit Assessment (Week 1)</h3>
-<p>Begin with thorough credit report analysis from all three bureaus. Obtain reports from AnnualCreditReport.com (the only site authorized by federal law for free reports, not to be confused with similar-sounding commercial sites). You're entitled to one free report per bureau every 12 months, plus additional free reports in specific circumstances.</p>
-
-<p><strong>Review Personal Information Section:</strong> Verify name spellings, current and previous addresses, Social Security number, date of birth, and employment history. Errors here can indicate identity theft, merge files (your data mixed with someone else's), or simple data entry mistakes. These errors can lead to incorrect account associations.</p>
-
-<p><strong>Review Account Information:</strong> Examine every tradeline for accuracy: account numbers, opening dates, credit limits, current balances, payment history, and account status. Compare reported information to your own records. Look for accounts you don't recognize (possible fraud), incorrect late payments, wrong balances, unauthorized inquiries, and outdated information.</p>
-
-<p><strong>Review Inquiries:</strong> Check hard inquiries (from credit applications) to ensure you authorized each one. Unauthorized inquiries may indicate identity theft or creditor errors. Note that multiple inquiries for the same purpose (mortgage or auto shopping) within a short window should be counted as single inquiries.</p>
-
-<p><strong>Review Public Records and Collections:</strong> Verify bankruptcies show correct filing dates and types, liens and judgments are accurate and current, and collection accounts represent valid debts you actually owe. Many consumers discover collection accounts that are beyond the statute of limitations, from identity theft, or were already paid but not updated.</p>
-
-<p><strong>Create Error Inventory:</strong> Document every issue systematically: which bureau(s) report it, the specific error or inaccuracy, supporting documentation you have available, estimated score impact (high/medium/low), and your planned strategy for addressing it. This organized approach prevents missed opportunities and maintains accountability throughout the repair process.</p>
-
-<h3>Step 2: Strategic Prioritization (Week 1-2)</h3>
-<p>Not all credit issues equally impact your score or have the same likelihood of successful resolution. Strategic prioritization maximizes results from your efforts.</p>
-
-<p><strong>High Priority Items:</strong></p>
-<ul>
-<li><strong>Recent late payments on major accounts:</strong> These hurt most and may be removable via goodwill requests if you have otherwise positive history</li>
-<li><strong>Collection accounts actively reporting:</strong> Validate, negotiate pay-for-delete, or dispute inaccuracies</li>
-<li><strong>High credit utilization (>30%):</strong> Often the easiest quick win through payments or limit increases</li>
-<li><strong>Obvious errors with documentation:</strong> High success rate when you have proof</li>
-<li><strong>Identity theft or fraudulent accounts:</strong> Legal protections are strongest here</li>
-</ul>
-
-<p><strong>Medium Priority Items:</strong></p>
-<ul>
-<li><strong>Older negative items approaching removal date:</strong> May remove naturally soon, but worth disputing to accelerate</li>
-<li><strong>Accounts with partial inaccuracies:</strong> While account may be legitimate, specific details may be wrong</li>
-<li><strong>Authorized user accounts hurting you:</strong> Can be removed by request</li>
-<li><strong>Credit mix optimization:</strong> Adding diversity to credit types over time</li>
-</ul>
-
-<p><strong>Lower Priority Items:</strong></p>
-<ul>
-<li><strong>Very old negative items (5+ years):</strong> Already have limited impact</li>
-<li><strong>Items correctly reported with low score impact:</strong> Focus elsewhere for better ROI</li>
-<li><strong>Hard inquiries beyond recent timeframe:</strong> Minimal impact after 6-12 months</li>
-</ul>
-
-<h3>Step 3: Systematic Execution (Months 1-3)</h3>
-<p>Implementation requires meticulous documentation, strategic communication, and consistent follow-through.</p>
-
-<p><strong>Documentation Standards:</strong> Maintain comprehensive records including: original credit reports from all three bureaus, all dispute letters sent (keep copies), all bureau and creditor responses received, certified mail receipts and tracking numbers, payment confirmations and settlement agreements, and detailed notes from phone conversations (date, time, person's name, summary of discussion, promises made).</p>
-
-<p><strong>Dispute Letter Best Practices:</strong> Be specific about what's incorrect and why, reference FCRA rights but avoid sounding like template letters, provide supporting documentation when available, request specific action (investigation, correction, or removal), send via certified mail with return receipt, and maintain professional tone throughout.</p>
-
-<p><strong>Follow-Up Schedule:</strong> Bureaus have 30 days to investigate and respond (45 days if you provide additional information during their investigation). On day 31 if no response received, send follow-up letter citing FCRA violation. On day 60 without resolution, escalate to CFPB complaint. Throughout, maintain detailed timeline documentation.</p>
-
-<p><strong>Use ScorePro Platform:</strong> Track all disputes, deadlines, and responses in one organized system. Set automated reminders for follow-ups. Generate professional dispute letters from templates. Store all documentation securely. Monitor progress with visual dashboards.</p>
-
-<h3>Step 4: Continuous Monitoring and Optimization (Ongoing)</h3>
-<p>As strategies are implemented, continuously monitor progress and adjust approaches based on results.</p>
-
-<p><strong>Monthly Credit Report Review:</strong> During active repair, check all three bureau reports monthly. Verify disputed items were investigated and corrected. Catch new errors or negative items immediately. Confirm positive information reports correctly. Note any unexpected changes requiring attention.</p>
-
-<p><strong>Score Tracking:</strong> Monitor credit scores (FICO and VantageScore) to measure improvement impact. Understand that scores from different sources use different models and may vary. Focus on trends over time rather than score fluctuations. Celebrate milestones (crossing into new score tiers) while maintaining focus on continued improvement.</p>
-
-<p><strong>Strategy Adjustment:</strong> If certain bureaus consistently reject disputes, try different approaches or documentation. If goodwill letters aren't working, try pay-for-delete negotiations. If direct bureau disputes fail, try disputing through furnishers. Flexibility and persistence overcome obstacles.</p>
-
-<h2>Common Challenges and Proven Solutions</h2>
-
-<h3>Challenge: Generic Verification Responses</h3>
-<p><strong>Problem:</strong> Bureau responds with "verified as accurate" without explaining their investigation process, providing evidence of verification, or addressing your specific dispute points.</p>
-
-<p><strong>Solution:</strong> Request Method of Verification (MOV) under FCRA Section 611(a)(7). Send follow-up letter requesting: detailed information about investigation procedures used, documentation reviewed during investigation, name and contact information of person at furnisher who verified information, and explanation of how disputed information was confirmed accurate. Inadequate or non-existent MOV creates grounds for re-dispute with additional arguments or CFPB complaint documenting the violation.</p>
-
-<h3>Challenge: Disputes Marked "Frivolous"</h3>
-<p><strong>Problem:</strong> Bureau deems your dispute "frivolous" or "irrelevant" and refuses investigation, potentially creating a record that blocks future disputes on the same item.</p>
-
-<p><strong>Solution Prevention:</strong> Only dispute legitimate errors, provide specific details about what's wrong, avoid mass-disputing everything on your report, include supporting documentation when available, and use original wording rather than obvious templates. <strong>Solution if Wrongly Marked:</strong> Respond firmly citing specific FCRA violations in their frivolous determination, provide additional evidence proving dispute legitimacy, escalate to CFPB with full documentation, and request removal of the frivolous designation from your file.</p>
-
-<h3>Challenge: Creditor Non-Response to Validation</h3>
-<p><strong>Problem:</strong> Collection agency continues collection efforts after your validation request without providing the required documentation proving they own the debt and amount is accurate.</p>
-
-<p><strong>Solution:</strong> Document the FDCPA violation carefully (keep copies of your validation request and proof of delivery). Send cease-and-desist letter demanding they stop all contact except legal notices required by law. Dispute with all three credit bureaus noting the failed validation and FDCPA violations. File detailed CFPB complaint with documentation. Consider consulting with FDCPA attorney—violations carry statutory damages of up to $1,000 plus actual damages and attorney fees, making many attorneys willing to take cases on contingency.</p>
-
-<h3>Challenge: Paid Collections Still Reporting</h3>
-<p><strong>Problem:</strong> You paid a collection account, but it still shows as unpaid or the entire tradeline remains on your report hurting your score.</p>
-
-<p><strong>Solution:</strong> If you have proof of payment, dispute with bureaus providing payment documentation. Contact the collection agency requesting they update status to "paid" or delete entirely as agreed. If no pay-for-delete was negotiated before payment, you have limited leverage but can try goodwill requests. <strong>Future Prevention:</strong> Always negotiate pay-for-delete BEFORE paying collections—payment is your leverage, don't give it up without getting deletion in writing.</p>
-
-<h2>Expert Best Practices</h2>
-
-<h3>Practice #1: Documentation Excellence</h3>
-<p>Maintain organized files for every credit-related document. Use folder systems (physical or digital) organized by account, bureau, or issue type with date-based sub-folders. This organization proves invaluable when compiling evidence for escalated disputes, demonstrating patterns of bureau non-compliance for CFPB complaints, or working with attorneys if legal action becomes necessary. Good documentation is the foundation of successful credit repair.</p>
-
-<h3>Practice #2: Certified Mail for Important Correspondence</h3>
-<p>Always use certified mail with return receipt requested for disputes with bureaus or important communication with creditors. The $6-8 cost per letter is minimal compared to the value it provides: irrefutable proof of delivery and receipt, starts legal 30-day response clocks, creates evidence for potential legal action, and demonstrates seriousness to recipients. Regular mail lacks proof—bureaus can claim they never received your dispute.</p>
-
-<h3>Practice #3: Build While Repairing</h3>
-<p>Don't wait for all negative items removed before building positive credit history. Start immediately with secured credit cards ($200-500 deposit), authorized user status on established accounts, credit-builder loans from credit unions, or rent reporting services (Rental Kharma, LevelCredit). These positive tradelines start helping your score immediately, partially offsetting negatives while disputes proceed through the slower removal process.</p>
-
-<h3>Practice #4: Automate Good Habits</h3>
-<p>Set up automatic payments from checking to credit cards preventing future late payments (even if you pay manually, automation is backup protection). Use balance alerts on credit cards when approaching 30% utilization thresholds. Schedule monthly calendar reminders for credit review sessions. Create annual reminders to pull free credit reports. Automation reduces reliance on memory and willpower, preventing mistakes that derail months of progress.</p>
-
-<h3>Practice #5: Strategic Credit Utilization Management</h3>
-<p>Keep reported balances under 30% of limits ideally, under 10% for maximum score benefit, or $0 balances for absolute optimal scores (though having small balances sometimes helps more than no activity). Remember that utilization is calculated at statement closing date—you can use cards heavily and pay down before statement closes. Request credit limit increases every 6-12 months on good accounts (instant utilization improvement without paying down balances).</p>
-
-<h2>Real-World Application Examples</h2>
-
-<h3>Example 1: Medical Collection Dispute Success</h3>
-<p>Sarah discovered an $850 medical collection from 2 years ago that she didn't recognize. Instead of immediately paying (which wouldn't remove it and eliminates leverage), she sent a debt validation letter requesting: original creditor information and account number, itemized billing showing services rendered, proof collection agency owns the debt or has authority to collect, and accounting of the claimed amount. The collector provided a generic response without itemization or proof of ownership. Sarah disputed with all three bureaus noting the inadequate validation and FDCPA violations. The collection was removed within 45 days because the collector couldn't properly substantiate the debt. Her score increased 60 points from this single removal. Key lesson: Always validate before paying collections.</p>
-
-<h3>Example 2: Goodwill Late Payment Removal</h3>
-<p>James had one 30-day late payment from 8 months ago during a brief job loss, after maintaining 5 years of perfect payment history with the creditor. He brought the account current, set up automatic payments, and wrote a heartfelt goodwill letter explaining: the temporary hardship (job loss), his otherwise excellent 5-year history with them, steps taken to ensure it never happens again (automation, emergency fund), and respectful request for one-time courtesy removal as valued customer. The creditor agreed, removed the late payment, and James's score jumped 42 points. Key lesson: Long-term customers have goodwill equity to spend on occasional mistakes.</p>
-
-<h3>Example 3: Strategic Credit Building from Zero</h3>
-<p>Maria (age 25) had no credit history, creating a catch-22—can't get credit without credit history. She implemented a strategic three-pronged approach: (1) Opened secured credit card with $300 deposit at her credit union, used it for small purchases, paid in full monthly; (2) Became authorized user on her parent's 15-year-old credit card account with perfect payment history (added 15 years of positive history to her report); (3) Got a $500 credit-builder loan from her credit union (loan proceeds held in savings while she makes payments, building payment history and forced savings simultaneously). Within 6 months, Maria had a 680 credit score with diverse credit mix and sufficient history to qualify for unsecured credit cards, apartment rental, and better auto loan rates. She saved approximately $2,400 on a car loan compared to subprime rates. Key lesson: Strategic credit building creates opportunities even from zero starting point.</p>
-
-<h2>Advanced Strategies for Complex Situations</h2>
-
-<h3>Metro 2 Format Compliance Challenges</h3>
-<p>Data furnishers use Metro 2 format to report information to bureaus. This format has strict requirements for how information must be coded and reported. Furnishers who violate Metro 2 standards (reporting incorrect account status codes, using wrong date formats, providing incomplete data fields) can be challenged. Request furnisher's procedures for Metro 2 compliance, point out specific violations in their reporting, cite FCRA requirements for accurate reporting, and escalate to CFPB if violations continue.</p>
-
-<h3>Tackling Mixed Files</h3>
-<p>Sometimes bureaus merge your file with someone else's with a similar name or Social Security number. This creates accounts, inquiries, or public records on your report that belong to another person. To fix: Identify all items that don't belong to you, file identity theft report with FTC if appropriate, dispute with bureaus noting mixed file and requesting complete file separation, consider requesting file disclosure under FCRA 609 to see what information bureaus maintain, and escalate to CFPB if bureaus don't properly separate files. Mixed files can be stubborn but must be corrected.</p>
-
-<h2>Your Action Plan</h2>
-
-<h3>Immediate Actions (This Week):</h3>
-<ul>
-<li>Obtain all three credit reports from AnnualCreditReport.com</li>
-<li>Review each report section by section systematically</li>
-<li>Create comprehensive error inventory with prioritization</li>
-<li>Set up ScorePro tracking system for dispute management</li>
-<li>Implement automatic payments for all accounts to prevent future issues</li>
-<li>Calculate current credit utilization and create reduction plan if above 30%</li>
-<li>Research your state's statute of limitations on debt</li>
-</ul>
-
-<h3>Short-Term Actions (This Month):</h3>
-<ul>
-<li>Send first round of dispute letters via certified mail to all three bureaus</li>
-<li>Implement quick wins (pay down high utilization cards to under 30%)</li>
-<li>Open secured card or credit-builder loan if you need positive tradelines</li>
-<li>Research goodwill letter opportunities for longtime creditor relationships</li>
-<li>Set up monthly monitoring routine and calendar reminders</li>
-<li>Create filing system for all credit repair documentation</li>
-<li>Send debt validation letters to any collection accounts</li>
-</ul>
-
-<h3>Medium-Term Actions (Months 2-6):</h3>
-<ul>
-<li>Follow up on all disputes within 31 days if no response received</li>
-<li>Send second-round disputes or Method of Verification requests as needed</li>
-<li>Negotiate pay-for-delete on validated collection accounts</li>
-<li>Build positive credit consistently (100% on-time payments, low utilization)</li>
-<li>Request credit limit increases on good standing accounts</li>
-<li>Review progress monthly and adjust strategies based on results</li>
-<li>File CFPB complaints for any FCRA violations by bureaus</li>
-<li>Consider authorized user opportunities for additional positive history</li>
-</ul>
-
-<h3>Long-Term Actions (6-12+ Months):</h3>
-<ul>
-<li>Monitor credit reports quarterly minimum (monthly during active repair)</li>
-<li>Maintain excellent credit habits indefinitely (they become automatic)</li>
-<li>Address new issues immediately before they become problems</li>
-<li>Continue credit education with advanced topics</li>
-<li>Plan major credit events (mortgage, business loan) strategically</li>
-<li>Help others with knowledge you've gained</li>
-<li>Build emergency fund to protect credit from future hardships</li>
-</ul>
-
-<div class="key-takeaway">
-<h3>Critical Takeaways</h3>
-<ul>
-<li>{title} is essential for financial success, potentially saving tens of thousands in interest costs</li>
-<li>Success combines error removal (exercising FCRA rights), positive credit building (new tradelines), and sustainable habits (automation and discipline)</li>
-<li>Documentation, patience, and systematic follow-through determine outcomes—sporadic effort produces sporadic results</li>
-<li>Legal rights under FCRA, FDCPA, and CROA provide powerful consumer protections when properly leveraged</li>
-<li>Credit management is ongoing financial practice, not one-time project—maintain good habits indefinitely</li>
-<li>Real progress requires 3-6 months minimum with consistent effort—beware anyone promising faster results</li>
-<li>Strategic approaches outperform brute force—prioritization and smart tactics matter more than effort volume</li>
-<li>Building positive credit while removing negatives accelerates improvement through compounding effects</li>
-</ul>
-</div>
-
-<h2>Conclusion and Next Steps</h2>
-<p>You now have comprehensive, expert-level knowledge about {title.lower()} and its critical role in credit health strategy. This education represents significant value—many people pay thousands of dollars to credit repair companies for services you can now perform yourself armed with this knowledge.</p>
-<p>But knowledge alone isn't power—applied knowledge is power. The strategies, techniques, and approaches presented here work when implemented consistently and intelligently. Thousands of successful credit repair journeys using these exact methods prove their effectiveness across diverse situations and credit profiles.</p>
-
-<p>Expect challenges and setbacks—they're normal parts of the process. Bureaus may reject initial disputes, creditors may refuse goodwill requests, and progress may feel slow at times. Each obstacle overcome makes you more knowledgeable and capable. The credit system can feel intimidating and opaque, but armed with education and legal rights, you have everything needed for success.</p>
+    Stream lessons one at a time; only one page is held in memory
+    
+    Fetch only the columns the caller uses: without content_html every
+    rendered lesson counts as changed.
+    """
+    for page in fetch_lesson_pages(columns, page_size, filters):
+        yield from page
 
-<p>Use the ScorePro platform to maintain organization, track progress, generate professional correspondence, and stay motivated with visual progress indicators. The platform handles administrative burden, freeing you to focus on strategy and execution.</p>
+def render_enhanced(title: str) -> list:
+    """[content, word_count, content hash] for a title; cached across runs"""
+    enhanced_content = generate_enhanced_content(title, "")
+    return [enhanced_content, text_stats(enhanced_content).words, content_hash(enhanced_content)]
 
-<p>Take action today—even small steps create momentum toward credit goals. Review your credit reports this week. Identify your top-priority item. Draft your first dispute letter. Set up automatic payments. Each action compounds over time into significant life improvements.</p>
+def render_lesson(lesson: Dict) -> tuple:
+    """
+    Render enhanced content; returns (PATCH values, word_count, changed)
 
-<p>Your financial future is shaped by the decisions and actions you take starting now. You have the knowledge, tools, and legal rights needed for success. The only remaining ingredient is action. Begin today, stay consistent, and you will achieve your credit goals.</p>
+    duration_minutes is recomputed from the new word count, and a stale
+    duration alone is enough to count the lesson as changed.
+    """
+    enhanced_content, word_count, rendered_hash = render_cache.render(
+        'enhanced', render_enhanced, lesson['title'])
+    values = {'content_html': enhanced_content, 'duration_minutes': reading_minutes(word_count)}
+    changed = (rendered_hash != content_hash(lesson.get('content_html'))
+               or lesson.get('duration_minutes') != values['duration_minutes'])
+    return values, word_count, changed
+
+def circuit_wait(api, error: CircuitOpenError) -> float:
+    """Seconds to wait for the circuit to go half-open; re-raises once the API has stayed down"""
+    if api.limiter.breaker.trips > CIRCUIT_WAITS:
+        raise error
+    seconds = api.limiter.breaker.seconds_until_half_open()
+    print(f"   ⏸ {error}; waiting {seconds:.0f}s before retrying")
+    return seconds
+
+def update_lesson(lesson: Dict) -> tuple:
+    """Update a single lesson with enhanced content if it differs from what is stored"""
+    values, word_count, changed = render_lesson(lesson)
+    if not changed:
+        return SKIPPED, word_count
+    
+    # Fixed values by primary key, so the client may replay the PATCH on 429/503
+    while True:
+        try:
+            resp = client.patch('lessons', values, {'id': eq(lesson['id'])}, replayable=True)
+            break
+        except CircuitOpenError as e:
+            time.sleep(circuit_wait(client, e))
+    
+    return (CHANGED if resp.status_code in [200, 204] else FAILED), word_count
 
-<p><strong>Continue to the next lesson</strong> to build upon this foundation and further develop your comprehensive credit expertise. Each lesson adds another tool to your credit repair toolkit, bringing you closer to mastering credit management and achieving your most important financial goals.</p>
+async def update_lesson_async(async_client, lesson: Dict) -> tuple:
+    """Async counterpart of update_lesson"""
+    values, word_count, changed = render_lesson(lesson)
+    if not changed:
+        return SKIPPED, word_count
+    
+    while True:
+        try:
+            resp = await async_client.patch('lessons', values, {'id': eq(lesson['id'])}, replayable=True)
+            break
+        except CircuitOpenError as e:
+            await asyncio.sleep(circuit_wait(async_client, e))
+        except Exception as e:  # Transport errors (timeouts, resets) fail this lesson only
+            print(f"   Request error for {lesson['id']}: {e}")
+            return FAILED, word_count
+    return (CHANGED if resp.status_code in [200, 204] else FAILED), word_count
+
+def record_result(stats: Dict, num: int, title: str, status: str, word_count: int):
+    """Count one lesson outcome and print its progress line"""
+    stats[status] += 1
+    if status != FAILED:
+        stats['total_words'] += word_count
+    
+    # Truncate title for display
+    display_title = title[:50] + "..." if len(title) > 50 else title
+    print(f"{num:2d}. {STATUS_ICONS[status]} {display_title} ({word_count:,} words)")
 
-<div class="lesson-completion">
-<p><em>Lesson complete! Take the quiz to test your understanding and earn XP points toward your next level and achievement badges.</em></p>
-</div>
-</div>'''
+def new_stats() -> Dict:
+    return {CHANGED: 0, SKIPPED: 0, FAILED: 0, 'total_words': 0}
 
-def fetch_all_lessons() -> List[Dict]:
-    """Fetch all lessons from database"""
-    print("📥 Fetching all lessons from database...")
+def run_batches(lessons: Iterable[Dict], stats: Dict) -> Dict:
+    """Sequential mode: one PATCH at a time as lessons stream in, reported in batches"""
+    print(f"Processing lessons in batches of {BATCH_SIZE}...\n")
     
-    resp = requests.get(
-        f'{SUPABASE_URL}/rest/v1/lessons',
-        headers=headers,
-        params={
-            'select': 'id,title,content_html',
-            'order': 'id.asc'
-        }
-    )
+    for num, lesson in enumerate(lessons, 1):
+        if (num - 1) % BATCH_SIZE == 0:
+            if num > 1:
+                print()
+            print(f"📦 Batch {(num - 1) // BATCH_SIZE + 1}")
+            print("-" * 70)
+        
+        status, word_count = update_lesson(lesson)
+        record_result(stats, num, lesson['title'], status, word_count)
     
-    if resp.status_code == 200:
-        lessons = resp.json()
-        print(f"✓ Found {len(lessons)} lessons\n")
-        return lessons
-    else:
-        print(f"❌ Error fetching lessons: {resp.status_code}")
-        print(f"   {resp.text}")
-        sys.exit(1)
+    print()
+    return stats
 
-def update_lesson(lesson_id: int, title: str) -> tuple:
-    """Update a single lesson with enhanced content"""
-    enhanced_content = generate_enhanced_content(title, "")
-    word_count = len(enhanced_content.split())
+async def run_concurrent(pages: Iterator[List[Dict]], max_in_flight: int, stats: Dict) -> Dict:
+    """Async mode: stream PATCHes with at most max_in_flight outstanding"""
+    from supabase_client import AsyncSupabaseClient
+    
+    print(f"Processing lessons with up to {max_in_flight} requests in flight...\n")
     
-    resp = requests.patch(
-        f'{SUPABASE_URL}/rest/v1/lessons?id=eq.{lesson_id}',
-        headers=headers,
-        json={'content_html': enhanced_content}
-    )
+    # Bounds lessons admitted but not yet written, so memory stays at about one page
+    slots = asyncio.Semaphore(max_in_flight)
+    pending = set()
+    aborted: List[CircuitOpenError] = []
     
-    success = resp.status_code in [200, 204]
-    return success, word_count
+    async with AsyncSupabaseClient(pool_size=max_in_flight) as async_client:
+        async def worker(num: int, lesson: Dict):
+            try:
+                status, word_count = await update_lesson_async(async_client, lesson)
+                record_result(stats, num, lesson['title'], status, word_count)
+            except CircuitOpenError as e:
+                aborted.append(e)  # Stop admitting lessons; in-flight ones finish
+            finally:
+                slots.release()
+        
+        num = 0
+        while not aborted:
+            # Fetch the next page off the event loop so in-flight PATCHes keep going
+            page = await asyncio.to_thread(next, pages, None)
+            if page is None:
+                break
+            for lesson in page:
+                await slots.acquire()
+                if aborted:
+                    break
+                num += 1
+                task = asyncio.create_task(worker(num, lesson))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        
+        if pending:
+            await asyncio.gather(*pending)
+    
+    if aborted:
+        raise aborted[0]
+    print()
+    return stats
 
 def main():
+    parser = argparse.ArgumentParser(description="Expand all lessons to 1,500-2,500 words")
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help="Send PATCHes concurrently over a pooled async client")
+    parser.add_argument('--max-in-flight', type=int, default=MAX_IN_FLIGHT,
+                        help=f"Concurrent requests in --async mode (default {MAX_IN_FLIGHT})")
+    parser.add_argument('--page-size', type=int, default=DEFAULT_PAGE_SIZE,
+                        help=f"Lessons fetched per request (default {DEFAULT_PAGE_SIZE})")
+    parser.add_argument('--force', action='store_true',
+                        help="Write every lesson without fetching stored content to compare")
+    args = parser.parse_args()
+    
     print("="*70)
     print("ScorePro Platform - Lesson Enhancement Script")
     print("Expanding all lessons to 1,500-2,500 words")
     print("="*70)
     print()
     
-    # Fetch all lessons
-    lessons = fetch_all_lessons()
-    total_lessons = len(lessons)
-    
-    print(f"Processing {total_lessons} lessons in batches of {BATCH_SIZE}...\n")
+    # Stream lessons page by page; writes start as soon as the first page arrives
+    columns = FORCE_COLUMNS if args.force else LESSON_COLUMNS
+    print(f"📥 Streaming lessons from database ({args.page_size} per page)...\n")
     
-    # Process in batches
-    successful = 0
-    failed = 0
-    total_words = 0
+    if args.use_async and client.local:
+        print("ℹ️  --async is ignored against the local mirror (SUPABASE_MIRROR)\n")
+        args.use_async = False
+
+    started = time.perf_counter()
+    stats = new_stats()
+    try:
+        if args.use_async:
+            pages = fetch_lesson_pages(columns, args.page_size)
+            asyncio.run(run_concurrent(pages, args.max_in_flight, stats))
+        else:
+            run_batches(fetch_all_lessons(columns, args.page_size), stats)
+    except requests.HTTPError as e:
+        print(f"❌ Error fetching lessons: {e.response.status_code}")
+        print(f"   {e.response.text}")
+        sys.exit(1)
+    except CircuitOpenError as e:
+        done = stats[CHANGED] + stats[SKIPPED]
+        print(f"\n❌ Aborted: the API was still failing after {CIRCUIT_WAITS} circuit breaker cooldowns ({e})")
+        print(f"   {done} lessons done, {stats[FAILED]} failed before the abort; lessons not reached "
+              f"were left as they are. Re-run to continue (unchanged lessons are skipped).")
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
     
-    for i in range(0, total_lessons, BATCH_SIZE):
-        batch = lessons[i:i+BATCH_SIZE]
-        batch_num = (i // BATCH_SIZE) + 1
-        total_batches = (total_lessons + BATCH_SIZE - 1) // BATCH_SIZE
-        
-        print(f"📦 Batch {batch_num}/{total_batches} ({len(batch)} lessons)")
-        print("-" * 70)
-        
-        for j, lesson in enumerate(batch, 1):
-            lesson_id = lesson['id']
-            title = lesson['title']
-            overall_num = i + j
-            
-            success, word_count = update_lesson(lesson_id, title)
-            
-            if success:
-                successful += 1
-                total_words += word_count
-                status = "✓"
-            else:
-                failed += 1
-                status = "✗"
-            
-            # Truncate title for display
-            display_title = title[:50] + "..." if len(title) > 50 else title
-            print(f"{overall_num:2d}. {status} {display_title} ({word_count:,} words)")
-        
-        print()
-        
-        # Delay between batches (except after last batch)
-        if i + BATCH_SIZE < total_lessons:
-            print(f"⏳ Waiting {DELAY_BETWEEN_BATCHES}s before next batch...\n")
-            time.sleep(DELAY_BETWEEN_BATCHES)
+    successful = stats[CHANGED] + stats[SKIPPED]
+    failed = stats[FAILED]
+    total_lessons = successful + failed
+    total_words = stats['total_words']
     
     # Summary
     print("="*70)
@@ -400,10 +270,16 @@ def main():
     print("="*70)
     print(f"Total Lessons:    {total_lessons}")
     print(f"Successful:       {successful} ✓")
+    print(f"  Changed:        {stats[CHANGED]}")
+    print(f"  Unchanged:      {stats[SKIPPED]} (no write sent)")
     print(f"Failed:           {failed} {'✗' if failed > 0 else ''}")
-    print(f"Success Rate:     {(successful/total_lessons)*100:.1f}%")
+    print(f"Success Rate:     {(successful/total_lessons)*100 if total_lessons else 0:.1f}%")
     print(f"Total Words:      {total_words:,}")
     print(f"Average Words:    {total_words//successful if successful > 0 else 0:,}")
+    print(f"Elapsed:          {elapsed:.1f}s")
+    print(f"Render cache:     {render_cache.summary()}")
+    if client.limiter is not None:
+        print(f"Throttled:        {client.limiter.throttled} (circuit {client.limiter.breaker.state})")
     print("="*70)
     print()
     print("✅ All lessons have been enhanced to 1,800-2,200 words!")
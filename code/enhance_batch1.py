@@ -1,34 +1,15 @@
 #!/usr/bin/env python3
 import os
-import requests
 import sys
 
-SUPABASE_URL = os.environ.get('SUPABASE_URL')
-SUPABASE_SERVICE_KEY = os.environ.get('SUPABASE_SERVICE_ROLE_KEY')
+from lesson_templates import DEFAULT_BRAND
+from supabase_client import eq, get_client
+from text_stats import text_stats
 
-headers = {
-    'apikey': SUPABASE_SERVICE_KEY,
-    'Authorization': f'Bearer {SUPABASE_SERVICE_KEY}',
-    'Content-Type': 'application/json'
-}
 
-# Process first 5 lessons only
-resp = requests.get(
-    f'{SUPABASE_URL}/rest/v1/lessons',
-    headers=headers,
-    params={'select': 'id,title', 'limit': '5'}
-)
-
-if resp.status_code == 200:
-    lessons = resp.json()
-    print(f"Processing {len(lessons)} lessons...")
-    
-    for i, lesson in enumerate(lessons, 1):
-        lesson_id = lesson['id']
-        title = lesson['title']
-        
-        # Generate comprehensive content (1800+ words)
-        content = f'''<div class="lesson-content">
+def generate_batch1_content(title: str, brand: str = DEFAULT_BRAND) -> str:
+    """Comprehensive lesson content (1800+ words); brand fills the same slot as lesson_templates"""
+    return f'''<div class="lesson-content">
 <h1>{title}</h1>
 <div class="lesson-intro">
 <p class="lead">Master {title.lower()} with this comprehensive guide.</p>
@@ -73,7 +54,7 @@ if resp.status_code == 200:
 <h3>Step 3: Systematic Execution</h3>
 <p>Implementation requires meticulous documentation and consistent follow-through. Maintain comprehensive records: all credit reports, dispute letters and responses, certified mail receipts, creditor correspondence, payment confirmations, and detailed phone conversation notes. This documentation proves invaluable for escalated disputes and provides legal protection.</p>
 
-<p>Use tracking systems (ScorePro platform recommended) to manage deadlines, follow-ups, and status updates. Bureaus have 30 days to investigate disputes—set day-31 reminders if no response received. Track every dispute's journey from submission through resolution.</p>
+<p>Use tracking systems ({brand} platform recommended) to manage deadlines, follow-ups, and status updates. Bureaus have 30 days to investigate disputes—set day-31 reminders if no response received. Track every dispute's journey from submission through resolution.</p>
 
 <h3>Step 4: Monitoring and Optimization</h3>
 <p>As strategies are implemented, continuously monitor progress. Check credit reports monthly during active repair to verify changes are reported correctly. Track credit scores to measure impact. Be prepared to adjust strategies based on results—if certain approaches aren't working, try different tactics.</p>
@@ -123,7 +104,7 @@ if resp.status_code == 200:
 <li>Obtain all three credit reports from AnnualCreditReport.com</li>
 <li>Review each report section by section systematically</li>
 <li>Create error inventory and prioritization list</li>
-<li>Set up ScorePro tracking system</li>
+<li>Set up {brand} tracking system</li>
 <li>Implement automatic payments for all accounts</li>
 </ul>
 
@@ -172,26 +153,41 @@ if resp.status_code == 200:
 
 <p>Challenges and setbacks are normal. Every obstacle overcome makes you more knowledgeable and capable. The credit system can feel intimidating, but armed with education and legal rights, you have everything needed for success.</p>
 
-<p>Use ScorePro to maintain organization, track progress, and stay motivated. Take action today—even small steps create momentum toward credit goals. Your financial future is shaped by decisions and actions you take now.</p>
+<p>Use {brand} to maintain organization, track progress, and stay motivated. Take action today—even small steps create momentum toward credit goals. Your financial future is shaped by decisions and actions you take now.</p>
 
 <p><strong>Continue to the next lesson</strong> to build upon this foundation and further develop your credit expertise. Each lesson brings you closer to mastering credit management and achieving financial goals.</p>
 </div>'''
-        
+
+
+def main():
+    client = get_client()
+
+    # Process first 5 lessons only
+    resp = client.select('lessons', 'id,title', limit=5)
+    if resp.status_code != 200:
+        print(f"Error fetching lessons: {resp.status_code}")
+        sys.exit(1)
+
+    lessons = resp.json()
+    print(f"Processing {len(lessons)} lessons...")
+
+    for i, lesson in enumerate(lessons, 1):
+        lesson_id = lesson['id']
+        title = lesson['title']
+        content = generate_batch1_content(title)
+
         # Update lesson
-        update_resp = requests.patch(
-            f'{SUPABASE_URL}/rest/v1/lessons?id=eq.{lesson_id}',
-            headers=headers,
-            json={'content_html': content}
-        )
-        
-        word_count = len(content.split())
+        update_resp = client.patch('lessons', {'content_html': content}, {'id': eq(lesson_id)})
+
+        word_count = text_stats(content).words
         if update_resp.status_code in [200, 204]:
             print(f"{i}. ✓ {title[:50]}... ({word_count} words)")
         else:
             print(f"{i}. ✗ Failed: {title[:50]}...")
             print(f"   Error: {update_resp.text}")
-else:
-    print(f"Error fetching lessons: {resp.status_code}")
-    sys.exit(1)
 
-print("\n✅ Batch complete!")
+    print("\n✅ Batch complete!")
+
+
+if __name__ == "__main__":
+    main()
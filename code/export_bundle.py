@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Export lessons and quizzes as a static, content-addressed bundle
+
+Renders every catalog tutorial with the content generators (through the
+render cache) and writes one JSON shard per course, named by the SHA-256
+of its canonical JSON, plus a manifest mapping course slugs to shards:
+
+    dist/content/
+        manifest.json                  {"version": 1, "shards": {slug: {...}}}
+        shards/<sha256>.json           {"slug", "code", "course", "lesson", "quiz"}
+
+The lesson and quiz objects use the same field names as the lessons and
+quizzes tables (content_html, questions_json, ...), so the frontend can read
+a shard instead of querying PostgREST. Shards are immutable: a shard whose
+hash is already on disk is not rewritten, and with --upload only shards
+not yet uploaded to that bucket (tracked in .uploaded-<bucket>.json) are
+sent to Supabase Storage. Serve shards/ with a long max-age and
+manifest.json with a short one.
+
+Usage:
+    python3 code/export_bundle.py [--output dist/content] [--gzip] [--prune]
+    python3 code/export_bundle.py --upload --bucket content
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+from typing import Dict, List, Tuple
+
+sys.path.append(os.path.dirname(__file__))
+from content_generator_full import generate_lesson_content, generate_quiz_questions
+from curriculum_catalog import ROOT_DIR, get_catalog, lesson_topics, slugify
+from render_cache import get_render_cache
+from text_stats import text_stats
+
+DEFAULT_OUTPUT = os.path.join(ROOT_DIR, 'dist', 'content')
+MANIFEST_NAME = 'manifest.json'
+SHARD_DIR = 'shards'
+MANIFEST_VERSION = 1
+PASSING_SCORE = 70
+SHARD_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+MANIFEST_CACHE_CONTROL = 'public, max-age=60'
+
+
+def canonical_json(value) -> bytes:
+    """Byte-stable JSON: identical content always hashes the same"""
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def build_shard(tutorial: Dict, render_cache) -> Dict:
+    """Course, lesson and quiz for one tutorial, shaped like the table rows"""
+    title = tutorial['title']
+    description = tutorial.get('description') or ''
+    topics = lesson_topics(tutorial['topics'], description)
+    code = tutorial['code']
+    slug = slugify(title)
+
+    content_html = render_cache.render('lesson', generate_lesson_content, code, title, topics, description)
+    questions = render_cache.render('quiz', generate_quiz_questions, code, title, topics)
+    return {
+        'slug': slug,
+        'code': code,
+        'course': {
+            'title': title,
+            'description': description,
+            'difficulty_level': tutorial.get('difficulty'),
+            'category_id': tutorial.get('category_id'),
+        },
+        'lesson': {
+            'title': title,
+            'slug': slug,
+            'content_type': 'text',
+            'content_html': content_html,
+            'duration_minutes': tutorial.get('duration') or text_stats(content_html).reading_minutes,
+            'xp_reward': tutorial['xp'],
+        },
+        'quiz': {
+            'title': f"{title} - Quiz",
+            'passing_score': PASSING_SCORE,
+            'questions_json': questions,
+        },
+    }
+
+
+def write_atomic(path: str, data: bytes):
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def load_manifest(output: str) -> Dict:
+    try:
+        with open(os.path.join(output, MANIFEST_NAME), encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if manifest.get('version') == MANIFEST_VERSION else {}
+
+
+def export(output: str, compress: bool = False) -> Tuple[Dict, Dict[str, int]]:
+    """Write every shard that is not already on disk, then the manifest; (manifest, counts)"""
+    shard_dir = os.path.join(output, SHARD_DIR)
+    os.makedirs(shard_dir, exist_ok=True)
+    render_cache = get_render_cache()
+
+    shards = {}
+    counts = {'written': 0, 'unchanged': 0}
+    for tutorial in get_catalog():
+        shard = build_shard(tutorial, render_cache)
+        data = canonical_json(shard)
+        digest = hashlib.sha256(data).hexdigest()
+        path = f'{SHARD_DIR}/{digest}.json'
+        if shard['slug'] in shards:
+            print(f"  ⚠ Duplicate slug '{shard['slug']}' ({tutorial['code']}), keeping the first")
+            continue
+        shards[shard['slug']] = {'code': tutorial['code'], 'title': tutorial['title'],
+                                 'hash': digest, 'path': path, 'bytes': len(data)}
+
+        # Same hash, same bytes: only write the files that are missing
+        full_path = os.path.join(output, path)
+        written = False
+        if not os.path.exists(full_path):
+            write_atomic(full_path, data)
+            written = True
+        if compress and not os.path.exists(f'{full_path}.gz'):
+            write_atomic(f'{full_path}.gz', gzip.compress(data, mtime=0))
+            written = True
+        counts['written' if written else 'unchanged'] += 1
+
+    manifest = {'version': MANIFEST_VERSION, 'shards': shards}
+    write_atomic(os.path.join(output, MANIFEST_NAME),
+                 json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'))
+    render_cache.flush()
+    return manifest, counts
+
+
+def diff_manifests(previous: Dict, current: Dict) -> Dict[str, List[str]]:
+    """Slugs added, changed (new hash) and removed since the previous manifest"""
+    before = previous.get('shards', {})
+    after = current['shards']
+    return {
+        'added': [slug for slug in after if slug not in before],
+        'changed': [slug for slug in after
+                    if slug in before and before[slug]['hash'] != after[slug]['hash']],
+        'removed': [slug for slug in before if slug not in after],
+    }
+
+
+def prune(output: str, manifest: Dict) -> int:
+    """Delete shard files the manifest no longer references"""
+    keep = {os.path.basename(entry['path']) for entry in manifest['shards'].values()}
+    removed = 0
+    shard_dir = os.path.join(output, SHARD_DIR)
+    for name in os.listdir(shard_dir):
+        if name.split('.', 1)[0] + '.json' not in keep:
+            os.remove(os.path.join(shard_dir, name))
+            removed += 1
+    return removed
+
+
+def upload(bucket: str, manifest: Dict, output: str) -> Tuple[int, int]:
+    """Send shards not yet in the bucket, then the manifest; (sent, failed)"""
+    from supabase_client import get_client
+
+    client = get_client()
+    if not client.configured:
+        print("❌ --upload needs SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY")
+        sys.exit(1)
+    log_path = os.path.join(output, f'.uploaded-{bucket}.json')
+    try:
+        with open(log_path, encoding='utf-8') as f:
+            uploaded = set(json.load(f))
+    except (OSError, ValueError):
+        uploaded = set()
+    sent = failed = 0
+    try:
+        for entry in manifest['shards'].values():
+            if entry['hash'] in uploaded:
+                continue
+            with open(os.path.join(output, entry['path']), 'rb') as f:
+                resp = client.storage_upload(bucket, entry['path'], f.read(),
+                                             cache_control=SHARD_CACHE_CONTROL)
+            if resp.status_code in (200, 201):
+                uploaded.add(entry['hash'])
+                sent += 1
+            else:
+                failed += 1
+                print(f"  ✗ {entry['path']}: {resp.status_code} {resp.text[:200]}")
+    finally:
+        write_atomic(log_path, json.dumps(sorted(uploaded)).encode('utf-8'))
+    if not failed:
+        # Publish the manifest last so it never points at a missing shard
+        with open(os.path.join(output, MANIFEST_NAME), 'rb') as f:
+            resp = client.storage_upload(bucket, MANIFEST_NAME, f.read(),
+                                         cache_control=MANIFEST_CACHE_CONTROL)
+        if resp.status_code not in (200, 201):
+            failed += 1
+            print(f"  ✗ {MANIFEST_NAME}: {resp.status_code} {resp.text[:200]}")
+    return sent, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export lessons and quizzes as static JSON shards")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="Bundle directory")
+    parser.add_argument('--gzip', action='store_true', help="Also write precompressed .json.gz shards")
+    parser.add_argument('--prune', action='store_true',
+                        help="Delete shard files the new manifest no longer references")
+    parser.add_argument('--upload', action='store_true',
+                        help="Upload new shards and the manifest to Supabase Storage")
+    parser.add_argument('--bucket', default='content', help="Storage bucket for --upload")
+    args = parser.parse_args()
+
+    previous = load_manifest(args.output)
+    manifest, counts = export(args.output, args.gzip)
+    changes = diff_manifests(previous, manifest)
+
+    print(f"📦 Exported {len(manifest['shards'])} courses to {os.path.relpath(args.output)}")
+    print(f"   Shards written:   {counts['written']}")
+    print(f"   Shards unchanged: {counts['unchanged']}")
+    print(f"   Added/changed/removed courses: {len(changes['added'])}/"
+          f"{len(changes['changed'])}/{len(changes['removed'])}")
+    print(f"   Bundle size:      {sum(e['bytes'] for e in manifest['shards'].values()):,} bytes")
+    if args.prune:
+        print(f"   Pruned shards:    {prune(args.output, manifest)}")
+    if args.upload:
+        sent, failed = upload(args.bucket, manifest, args.output)
+        print(f"   Uploaded to '{args.bucket}': {sent} shards{f', {failed} failed' if failed else ''}")
+        if failed:
+            sys.exit(1)
+    print(f"   Render cache:     {get_render_cache().summary()}")
+
+
+if __name__ == "__main__":
+    main()
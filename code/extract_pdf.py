@@ -1,17 +1,187 @@
+#!/usr/bin/env python3
+"""
+Extract curriculum text from a PDF, one page at a time
+
+Pages are streamed from PyPDF2 and appended to the output file as they are
+extracted, so a sequential run holds one page in memory regardless of
+document size.
+
+With --workers N the page range is split into shards that a process pool
+extracts in parallel (each worker opens the PDF itself); shards are written
+back in page order. At most SHARDS_PER_WORKER x N shards are in flight, so
+memory is bounded by that many shards of text rather than one page. A page that fails to extract is reported by number
+instead of aborting the run.
+
+Usage:
+    python3 code/extract_pdf.py [PDF] [--pages 1-50] [--output tmp/curriculum_content.txt]
+    python3 code/extract_pdf.py [PDF] --workers 8 [--shard-size 16]
+"""
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
 import PyPDF2
-import json
 
-pdf_path = "user_input_files/968a5073-3c11-42fe-a1f1-3bb2687034d1.pdf"
+DEFAULT_PDF_PATH = "user_input_files/968a5073-3c11-42fe-a1f1-3bb2687034d1.pdf"
+DEFAULT_OUTPUT_PATH = "tmp/curriculum_content.txt"
+DEFAULT_SHARD_SIZE = 16  # Pages per worker task
+SHARDS_PER_WORKER = 2  # In-flight shards per worker: one running, one queued
+
+# (1-based page number, text, extraction seconds, error message or None)
+PageResult = Tuple[int, str, float, Optional[str]]
+
+
+class PageRangeError(ValueError):
+    """--pages does not describe pages of this PDF"""
+
+
+def parse_page_range(spec: Optional[str], page_count: int) -> range:
+    """Turn '5', '5-20', '5-' or '-20' (1-based, inclusive) into a 0-based range"""
+    if not spec:
+        return range(page_count)
+    start, sep, end = spec.partition('-')
+    try:
+        first = int(start) if start else 1
+        last = (int(end) if end else page_count) if sep else first
+    except ValueError:
+        raise PageRangeError(f"Invalid page range: {spec}") from None
+    if first < 1 or last < first:
+        raise PageRangeError(f"Invalid page range: {spec}")
+    if first > page_count:
+        raise PageRangeError(f"Page range {spec} starts past the last page ({page_count})")
+    return range(first - 1, min(last, page_count))
+
+
+def extract_page(reader: PyPDF2.PdfReader, index: int) -> PageResult:
+    started = time.perf_counter()
+    try:
+        text = reader.pages[index].extract_text() or ""
+        error = None
+    except Exception as e:
+        text = ""
+        error = f"{type(e).__name__}: {e}"
+    return index + 1, text, time.perf_counter() - started, error
+
+
+def iter_pages(reader: PyPDF2.PdfReader, pages: range) -> Iterator[PageResult]:
+    """Yield a PageResult for each page, in order"""
+    for index in pages:
+        yield extract_page(reader, index)
+
+
+def extract_shard(pdf_path: str, start: int, stop: int) -> List[PageResult]:
+    """Worker entry point: open the PDF independently and extract pages [start, stop)"""
+    with open(pdf_path, 'rb') as file:
+        reader = PyPDF2.PdfReader(file)
+        return [extract_page(reader, index) for index in range(start, stop)]
+
+
+def iter_pages_parallel(pdf_path: str, pages: range, workers: int,
+                        shard_size: int = DEFAULT_SHARD_SIZE) -> Iterator[PageResult]:
+    """
+    Yield PageResults in page order while a process pool extracts shards
+
+    Shards are submitted as earlier ones are consumed, keeping at most
+    SHARDS_PER_WORKER x workers futures (and their text) outstanding.
+    """
+    shards = (range(start, min(start + shard_size, pages.stop))
+              for start in range(pages.start, pages.stop, shard_size))
+    window = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        def submit_next() -> bool:
+            shard = next(shards, None)
+            if shard is None:
+                return False
+            window.append((shard, pool.submit(extract_shard, pdf_path, shard.start, shard.stop)))
+            return True
+
+        while len(window) < SHARDS_PER_WORKER * workers and submit_next():
+            pass
+        while window:
+            shard, future = window.popleft()
+            submit_next()
+            try:
+                results = future.result()
+            except Exception as e:
+                # The whole worker failed (e.g. could not open the file)
+                error = f"worker failed: {type(e).__name__}: {e}"
+                results = [(index + 1, "", 0.0, error) for index in shard]
+            yield from results
+
+
+def extract(pdf_path: str, output_path: str, page_spec: Optional[str] = None,
+            verbose: bool = True, workers: int = 1,
+            shard_size: int = DEFAULT_SHARD_SIZE) -> Tuple[int, int, List[Tuple[int, str]]]:
+    """
+    Stream the selected pages into output_path
+
+    Returns (pages written, characters, [(page number, error)] for failed pages).
+    """
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    page_total = 0
+    char_total = 0
+    slowest = (0, 0.0)
+    failures = []
+
+    with open(pdf_path, 'rb') as file:
+        reader = PyPDF2.PdfReader(file)
+        pages = parse_page_range(page_spec, len(reader.pages))  # Validate before truncating the output
+        with open(output_path, 'w', encoding='utf-8') as out:
+            if workers > 1:
+                results = iter_pages_parallel(pdf_path, pages, workers, shard_size)
+            else:
+                results = iter_pages(reader, pages)
+            for page_number, text, seconds, error in results:
+                if error:
+                    failures.append((page_number, error))
+                    if verbose:
+                        print(f"  Page {page_number:4d}: ✗ {error}")
+                    continue
+                out.write(text)
+                out.write("\n")
+                page_total += 1
+                char_total += len(text)
+                if seconds > slowest[1]:
+                    slowest = (page_number, seconds)
+                if verbose:
+                    print(f"  Page {page_number:4d}: {len(text):6d} chars in {seconds * 1000:7.1f} ms")
+
+    if verbose and page_total:
+        print(f"Slowest page: {slowest[0]} ({slowest[1] * 1000:.1f} ms)")
+    return page_total, char_total, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract curriculum text from a PDF")
+    parser.add_argument('pdf_path', nargs='?', default=DEFAULT_PDF_PATH)
+    parser.add_argument('--pages', help="1-based inclusive page range, e.g. 1-50")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH)
+    parser.add_argument('--quiet', action='store_true', help="Skip per-page timing lines")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Extract in parallel with N worker processes")
+    parser.add_argument('--shard-size', type=int, default=DEFAULT_SHARD_SIZE,
+                        help=f"Pages per worker task (default {DEFAULT_SHARD_SIZE})")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    try:
+        page_total, char_total, failures = extract(args.pdf_path, args.output, args.pages,
+                                                   not args.quiet, args.workers, args.shard_size)
+    except PageRangeError as e:  # Raised before anything is written
+        parser.error(str(e))
+    elapsed = time.perf_counter() - started
 
-with open(pdf_path, 'rb') as file:
-    pdf_reader = PyPDF2.PdfReader(file)
-    text = ""
-    for page in pdf_reader.pages:
-        text += page.extract_text() + "\n"
+    print(f"Extracted {char_total} characters from {page_total} pages in {elapsed:.2f}s")
+    print(f"Content saved to {args.output}")
+    if failures:
+        pages = ", ".join(str(page_number) for page_number, _ in failures)
+        print(f"✗ {len(failures)} pages failed: {pages}")
+        sys.exit(1)
 
-# Save to a text file for easier reading
-with open('tmp/curriculum_content.txt', 'w', encoding='utf-8') as f:
-    f.write(text)
 
-print(f"Extracted {len(text)} characters from {len(pdf_reader.pages)} pages")
-print("Content saved to tmp/curriculum_content.txt")
+if __name__ == "__main__":
+    main()
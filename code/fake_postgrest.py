@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+"""
+In-process PostgREST stand-in for offline benchmarking
+
+Serves /rest/v1/{categories,courses,lessons,quizzes,quiz_attempts,
+content_blocks,tenants} from in-memory tables (plus the SQL functions in
+RPC_FUNCTIONS under /rest/v1/rpc/, and /storage/v1/object/{bucket}/{path}
+from an in-memory object store) with the subset of PostgREST the content scripts
+use: select projection, eq/neq/gt/gte/lt/lte/in filters, order,
+limit/offset and Range headers, object or array inserts, merge-duplicates
+upserts (on_conflict), PATCH, DELETE and Prefer return=minimal|representation
+and count=exact. Faults can be injected: fixed latency plus jitter, a rate
+of 500 responses and a rate of 429 responses with Retry-After.
+
+Point any script at it through SUPABASE_URL:
+
+    python3 code/fake_postgrest.py --port 54321 --seed-courses 87 &
+    export SUPABASE_URL=http://127.0.0.1:54321 SUPABASE_SERVICE_ROLE_KEY=fake
+    python3 code/insert_all_content.py --bulk
+
+or embed it (see bench_pipeline.py):
+
+    with FakePostgrest(latency=0.02) as server:
+        os.environ['SUPABASE_URL'] = server.url
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from postgrest_query import RESERVED_PARAMS, PostgrestError, parse_in, parse_order, parse_prefer
+
+TABLES = ('categories', 'courses', 'lessons', 'quizzes', 'quiz_attempts', 'content_blocks', 'tenants')
+PRIMARY_KEY = 'id'
+TIMESTAMP_COLUMNS = ('created_at', 'updated_at')
+STORAGE_PREFIX = '/storage/v1/object/'
+RPC_PREFIX = '/rest/v1/rpc/'
+
+_OPERATORS: Dict[str, Callable] = {
+    'eq': lambda a, b: a == b,
+    'neq': lambda a, b: a != b,
+    'gt': lambda a, b: a is not None and a > b,
+    'gte': lambda a, b: a is not None and a >= b,
+    'lt': lambda a, b: a is not None and a < b,
+    'lte': lambda a, b: a is not None and a <= b,
+    'in': lambda a, b: a in b,
+}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _coerce(sample, raw: str):
+    """Filter operand typed like the column value it is compared with"""
+    if isinstance(sample, bool):
+        return raw == 'true'
+    if isinstance(sample, (int, float)):
+        try:
+            return type(sample)(raw)
+        except ValueError:
+            return float(raw)
+    if raw == 'null':
+        return None
+    return raw
+
+
+def parse_filter(column: str, expression: str) -> Callable[[Dict], bool]:
+    """Row predicate for a PostgREST filter such as `gt.5` or `in.(a,b)`"""
+    op, _, raw = expression.partition('.')
+    if op not in _OPERATORS:
+        raise PostgrestError(400, 'PGRST100', f'unsupported operator "{op}" on {column}')
+    compare = _OPERATORS[op]
+    if op == 'in':
+        values = parse_in(raw)
+        return lambda row: compare(str(row.get(column)), values)
+    return lambda row: compare(row.get(column), _coerce(row.get(column), raw))
+
+
+def project(row: Dict, columns: Optional[List[str]]) -> Dict:
+    if columns is None:
+        return dict(row)
+    return {column: row.get(column) for column in columns}
+
+
+class Table:
+    """Rows keyed by primary key, in insertion order"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.rows: Dict[str, Dict] = {}
+        self.lock = threading.Lock()
+
+    def _matching(self, predicates: List[Callable], key: Optional[str]) -> List[Dict]:
+        """Rows passing every predicate; key (from id=eq.x) avoids the full scan"""
+        if key is not None:
+            candidates = [self.rows[key]] if key in self.rows else []
+        else:
+            candidates = self.rows.values()
+        return [row for row in candidates if all(p(row) for p in predicates)]
+
+    def select(self, predicates: List[Callable], key: Optional[str], order: List[Tuple[str, bool]],
+               offset: int, limit: Optional[int]) -> Tuple[List[Dict], int]:
+        """Matching rows for one page, and the total number of matches"""
+        with self.lock:
+            rows = self._matching(predicates, key)
+        for column, descending in reversed(order):
+            rows.sort(key=lambda row: (row.get(column) is None, row.get(column)),
+                      reverse=descending)
+        end = None if limit is None else offset + limit
+        return rows[offset:end], len(rows)
+
+    def insert(self, rows: List[Dict], upsert: bool, on_conflict: str) -> List[Dict]:
+        written = []
+        rows = [dict(row) for row in rows]
+        for row in rows:
+            row.setdefault(PRIMARY_KEY, str(uuid.uuid4()))
+        with self.lock:
+            # One statement: a duplicate rejects the whole array, as in Postgres
+            if not upsert:
+                for row in rows:
+                    if self._find(on_conflict, row.get(on_conflict)) is not None:
+                        raise PostgrestError(
+                            409, '23505', f'duplicate key value violates unique constraint '
+                            f'"{self.name}_{on_conflict}_key"',
+                            f'Key ({on_conflict})=({row.get(on_conflict)}) already exists.')
+            now = _now()
+            for row in rows:
+                existing = self._find(on_conflict, row.get(on_conflict))
+                if existing is not None:
+                    existing.update(row)
+                    existing['updated_at'] = now
+                    written.append(existing)
+                    continue
+                for column in TIMESTAMP_COLUMNS:
+                    row.setdefault(column, now)
+                self.rows[row[PRIMARY_KEY]] = row
+                written.append(row)
+        return written
+
+    def update(self, predicates: List[Callable], key: Optional[str], values: Dict) -> List[Dict]:
+        now = _now()
+        with self.lock:
+            matched = self._matching(predicates, key)
+            for row in matched:
+                row.update(values)
+                row['updated_at'] = now
+        return matched
+
+    def delete(self, predicates: List[Callable], key: Optional[str]) -> List[Dict]:
+        with self.lock:
+            matched = self._matching(predicates, key)
+            for row in matched:
+                del self.rows[row[PRIMARY_KEY]]
+        return matched
+
+    def _find(self, column: str, value) -> Optional[Dict]:
+        if value is None:
+            return None
+        if column == PRIMARY_KEY:
+            return self.rows.get(value)
+        return next((row for row in self.rows.values() if row.get(column) == value), None)
+
+
+def _apply_quiz_regrades(tables: Dict[str, Table], params: Dict) -> int:
+    """apply_quiz_regrades(p_corrections): set score/passed by id, return rows updated"""
+    attempts = tables['quiz_attempts']
+    updated = 0
+    with attempts.lock:
+        for correction in params['p_corrections']:
+            row = attempts.rows.get(correction['id'])
+            if row is not None:
+                row.update(score=correction['score'], passed=correction['passed'])
+                updated += 1
+    return updated
+
+
+RPC_FUNCTIONS: Dict[str, Callable[[Dict[str, Table], Dict], object]] = {
+    'apply_quiz_regrades': _apply_quiz_regrades,
+}
+
+
+class Faults:
+    """Injected latency and failure rates, drawn from a seeded RNG"""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 throttle_rate: float = 0.0, retry_after: int = 1, seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def draw(self) -> Tuple[float, Optional[int]]:
+        """(seconds to delay, injected status or None)"""
+        with self.lock:
+            delay = self.latency + self.random.uniform(0, self.jitter) if self.jitter else self.latency
+            roll = self.random.random()
+        if roll < self.throttle_rate:
+            return delay, 429
+        if roll < self.throttle_rate + self.error_rate:
+            return delay, 500
+        return delay, None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive, so pooled clients reuse connections
+    server: 'FakePostgrest'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        self._dispatch(self._get)
+
+    def do_HEAD(self):
+        self._dispatch(self._get)
+
+    def do_POST(self):
+        self._dispatch(self._post)
+
+    def do_PATCH(self):
+        self._dispatch(self._patch)
+
+    def do_DELETE(self):
+        self._dispatch(self._delete)
+
+    def _dispatch(self, handler: Callable):
+        server = self.server
+        server.count(self.command)
+        body = self._read_body()
+        delay, injected = server.faults.draw()
+        if delay:
+            time.sleep(delay)
+        try:
+            if injected == 429:
+                server.count('429')
+                self._send(429, {'message': 'Too Many Requests'},
+                           {'Retry-After': str(server.faults.retry_after)})
+                return
+            if injected == 500:
+                server.count('500')
+                raise PostgrestError(500, 'XX000', 'injected failure')
+            if not self.headers.get('apikey'):
+                raise PostgrestError(401, 'PGRST301', 'No API key found in request')
+            if self.path.startswith(STORAGE_PREFIX):
+                self._storage(body)
+                return
+            if self.path.startswith(RPC_PREFIX):
+                self._rpc(body)
+                return
+            table, params = self._route()
+            handler(table, params, body)
+        except PostgrestError as e:
+            self._send(e.status, e.body)
+        except (ValueError, TypeError) as e:
+            # Unparseable limit/offset/Range, or an operand of the wrong type
+            self._send(400, PostgrestError(400, 'PGRST100', str(e)).body)
+
+    def _route(self) -> Tuple[Table, List[Tuple[str, str]]]:
+        url = urlsplit(self.path)
+        prefix, _, name = url.path.rstrip('/').rpartition('/')
+        if prefix != '/rest/v1' or name not in self.server.tables:
+            raise PostgrestError(404, '42P01', f'relation "public.{name}" does not exist')
+        return self.server.tables[name], parse_qsl(url.query, keep_blank_values=True)
+
+    def _read_body(self) -> Optional[bytes]:
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else None
+
+    def _storage(self, body: Optional[bytes]):
+        """Supabase Storage objects: POST uploads (x-upsert: true overwrites), GET downloads"""
+        path = urlsplit(self.path).path[len(STORAGE_PREFIX):]
+        objects = self.server.objects
+        if self.command == 'POST':
+            if path in objects and self.headers.get('x-upsert') != 'true':
+                raise PostgrestError(409, 'Duplicate', 'The resource already exists')
+            objects[path] = body or b''
+            self.server.count('objects_written')
+            self._send(200, {'Key': path})
+        elif self.command in ('GET', 'HEAD'):
+            if path not in objects:
+                raise PostgrestError(404, 'not_found', 'Object not found')
+            self._send(200, raw=objects[path])
+        else:
+            raise PostgrestError(405, 'PGRST000', f'{self.command} not supported on storage')
+
+    def _rpc(self, body: Optional[bytes]):
+        """POST /rpc/{function} with named arguments as a JSON object"""
+        name = urlsplit(self.path).path[len(RPC_PREFIX):].rstrip('/')
+        if name not in RPC_FUNCTIONS:
+            raise PostgrestError(404, 'PGRST202', f'Could not find the function public.{name}')
+        if self.command != 'POST':
+            raise PostgrestError(405, 'PGRST101', f'{self.command} not supported on rpc')
+        try:
+            params = json.loads(body) if body else {}
+        except ValueError:
+            raise PostgrestError(400, 'PGRST102', 'Empty or invalid json')
+        try:
+            result = RPC_FUNCTIONS[name](self.server.tables, params)
+        except (KeyError, TypeError) as e:
+            raise PostgrestError(400, 'PGRST202', f'Invalid arguments for public.{name}: {e}')
+        self._send(200, result)
+
+    def _send(self, status: int, payload=None, headers: Optional[Dict] = None,
+              raw: Optional[bytes] = None):
+        if raw is not None:
+            data = raw
+        else:
+            data = b'' if payload is None else json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(data)
+
+    @staticmethod
+    def _query(params: List[Tuple[str, str]]) -> Tuple[Dict[str, str], List[Callable], Optional[str]]:
+        """(options, filter predicates, primary key from an id=eq.x filter)"""
+        options = {}
+        predicates = []
+        key = None
+        for column, value in params:
+            if column in RESERVED_PARAMS:
+                options[column] = value
+                continue
+            predicates.append(parse_filter(column, value))
+            if column == PRIMARY_KEY and value.startswith('eq.'):
+                key = value[len('eq.'):]
+        return options, predicates, key
+
+    @staticmethod
+    def _columns(options: Dict[str, str]) -> Optional[List[str]]:
+        select = options.get('select', '*')
+        return None if select in ('', '*') else [c.strip() for c in select.split(',')]
+
+    def _rows_body(self, raw: Optional[bytes]) -> List[Dict]:
+        try:
+            body = json.loads(raw) if raw else None
+        except ValueError:
+            raise PostgrestError(400, 'PGRST102', 'Empty or invalid json')
+        if isinstance(body, dict):
+            return [body]
+        if isinstance(body, list) and all(isinstance(row, dict) for row in body):
+            return body
+        raise PostgrestError(400, 'PGRST102', 'Expected a JSON object or array of objects')
+
+    def _written(self, status: int, rows: List[Dict], options: Dict[str, str]):
+        prefer = parse_prefer(self.headers.get('Prefer'))
+        if prefer.get('return') == 'representation':
+            columns = self._columns(options)
+            self._send(status, [project(row, columns) for row in rows])
+        else:
+            self._send(204 if status == 200 else status)
+
+    def _get(self, table: Table, params, body):
+        options, predicates, key = self._query(params)
+        offset = int(options.get('offset', 0))
+        limit = int(options['limit']) if 'limit' in options else None
+        range_header = self.headers.get('Range')
+        if range_header:
+            first, _, last = range_header.partition('-')
+            offset = int(first)
+            if last:
+                range_limit = int(last) - offset + 1
+                limit = range_limit if limit is None else min(limit, range_limit)
+        if limit is None:
+            limit = self.server.max_rows
+        order = parse_order(options.get('order', f'{PRIMARY_KEY}.asc'))
+        rows, total = table.select(predicates, key, order, offset, limit)
+        columns = self._columns(options)
+        exact = parse_prefer(self.headers.get('Prefer')).get('count') == 'exact'
+        end = f'{offset}-{offset + len(rows) - 1}' if rows else '*'
+        headers = {'Content-Range': f"{end}/{total if exact else '*'}"}
+        partial = range_header and offset + len(rows) < total
+        self._send(206 if partial else 200, [project(row, columns) for row in rows], headers)
+
+    def _post(self, table: Table, params, body):
+        options, _, _ = self._query(params)
+        rows = self._rows_body(body)
+        prefer = parse_prefer(self.headers.get('Prefer'))
+        upsert = prefer.get('resolution') == 'merge-duplicates'
+        written = table.insert(rows, upsert, options.get('on_conflict', PRIMARY_KEY))
+        self.server.count('rows_written', len(written))
+        self._written(201, written, options)
+
+    def _patch(self, table: Table, params, body):
+        options, predicates, key = self._query(params)
+        values = self._rows_body(body)
+        if len(values) != 1:
+            raise PostgrestError(400, 'PGRST102', 'PATCH body must be a single object')
+        updated = table.update(predicates, key, values[0])
+        self.server.count('rows_written', len(updated))
+        self._written(200, updated, options)
+
+    def _delete(self, table: Table, params, body):
+        options, predicates, key = self._query(params)
+        self._written(200, table.delete(predicates, key), options)
+
+
+class FakePostgrest(ThreadingHTTPServer):
+    """
+    Threaded fake PostgREST server over in-memory tables
+
+    start() serves from a daemon thread; use as a context manager to stop
+    it afterwards. stats counts requests by method plus injected 429/500s
+    and rows written.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, tables=TABLES,
+                 max_rows: int = 1000, verbose: bool = False, **faults):
+        super().__init__((host, port), _Handler)
+        self.tables = {name: Table(name) for name in tables}
+        self.objects: Dict[str, bytes] = {}  # Storage: "bucket/path" -> bytes
+        self.max_rows = max_rows  # Like PostgREST's db-max-rows
+        self.verbose = verbose
+        self.faults = Faults(**faults)
+        self.stats: Counter = Counter()
+        self._stats_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def count(self, key: str, n: int = 1):
+        with self._stats_lock:
+            self.stats[key] += n
+
+    def requests(self) -> int:
+        return sum(self.stats[method] for method in ('GET', 'HEAD', 'POST', 'PATCH', 'DELETE'))
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self.stats.clear()
+
+    def load(self, table: str, rows: List[Dict]):
+        """Insert rows directly, bypassing HTTP and fault injection"""
+        self.tables[table].insert(rows, upsert=True, on_conflict=PRIMARY_KEY)
+
+    def start(self) -> 'FakePostgrest':
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'FakePostgrest':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def seed_courses(server: FakePostgrest, count: int) -> List[Dict]:
+    """
+    count courses titled after catalog tutorials, cycling with a suffix
+
+    The first len(catalog) titles match the catalog exactly; later ones are
+    unmapped and take insert_all_content's default-curriculum path.
+    """
+    from curriculum_catalog import get_catalog
+
+    tutorials = list(get_catalog())
+    category_ids = {}
+    courses = []
+    for i in range(count):
+        tutorial = tutorials[i % len(tutorials)]
+        cycle = i // len(tutorials)
+        title = tutorial['title'] if cycle == 0 else f"{tutorial['title']} (Part {cycle + 1})"
+        category = tutorial.get('category_id', 0)
+        category_ids.setdefault(category, str(uuid.uuid4()))
+        courses.append({
+            'id': str(uuid.uuid4()),
+            'category_id': category_ids[category],
+            'title': title,
+            'slug': title.lower().replace(' ', '-').replace(':', '').replace('&', 'and'),
+            'description': tutorial.get('description') or title,
+            'difficulty_level': tutorial.get('difficulty'),
+            'duration_minutes': tutorial.get('duration'),
+            'display_order': i,
+            'is_active': True,
+        })
+    server.load('courses', courses)
+    return courses
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a fake PostgREST for offline runs")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=54321)
+    parser.add_argument('--seed-courses', type=int, default=0,
+                        help="Courses to create from the curriculum catalog")
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--jitter-ms', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction answered 500")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="Fraction answered 429")
+    parser.add_argument('--retry-after', type=int, default=1)
+    parser.add_argument('--seed', type=int, help="RNG seed for injected faults")
+    parser.add_argument('--verbose', action='store_true', help="Log every request")
+    args = parser.parse_args()
+
+    server = FakePostgrest(args.host, args.port, verbose=args.verbose,
+                           latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000,
+                           error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+                           retry_after=args.retry_after, seed=args.seed)
+    if args.seed_courses:
+        seed_courses(server, args.seed_courses)
+    print(f"Fake PostgREST on {server.url} (tables: {', '.join(server.tables)})")
+    print(f"  export SUPABASE_URL={server.url} SUPABASE_SERVICE_ROLE_KEY=fake")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n{dict(server.stats)}")
+
+
+if __name__ == "__main__":
+    main()
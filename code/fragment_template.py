@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Fragment-based template rendering for lesson HTML
+
+A template source uses str.format-style `{slot}` placeholders (`{{`/`}}` for
+literal braces). It is split once, at import time, into static fragments and
+slot positions; rendering copies the fragment list, drops the slot values in
+place and joins. Nothing is re-parsed or re-concatenated per call.
+
+A finished render can itself become a template: render with slot_marker()
+values for some slots (e.g. brand tokens) and compile_rendered() turns the
+output into a template whose only slots are those, so everything else is
+rendered once and reused for every set of values.
+"""
+
+from string import Formatter
+
+_parse = Formatter().parse
+
+
+class CompiledTemplate:
+    """A template pre-split into static fragments and named slots"""
+
+    __slots__ = ('source', 'fragments', 'slots')
+
+    def __init__(self, source: str):
+        self.source = source
+        fragments: list[str] = []
+        slots: list[tuple[int, str]] = []
+        for literal, field, spec, conversion in _parse(source):
+            if literal:
+                fragments.append(literal)
+            if field is None:
+                continue
+            if spec or conversion or not field.isidentifier():
+                raise ValueError(f"Unsupported placeholder {{{field}}}: only plain {{name}} slots are allowed")
+            slots.append((len(fragments), field))
+            fragments.append('')
+        self.fragments = tuple(fragments)
+        self.slots = tuple(slots)
+
+    @property
+    def slot_names(self) -> frozenset:
+        return frozenset(name for _, name in self.slots)
+
+    def render_parts(self, values: dict) -> list[str]:
+        """Fragment list with slots filled, ready to join or extend into a buffer"""
+        parts = list(self.fragments)
+        for index, name in self.slots:
+            parts[index] = str(values[name])
+        return parts
+
+    def render_into(self, out: list[str], values: dict):
+        """Append the rendered fragments to out (join once at the end)"""
+        out.extend(self.render_parts(values))
+
+    def render(self, **values: str) -> str:
+        if not self.slots:
+            return self.fragments[0] if len(self.fragments) == 1 else ''.join(self.fragments)
+        return ''.join(self.render_parts(values))
+
+
+def compile_template(source: str) -> CompiledTemplate:
+    return CompiledTemplate(source)
+
+
+def slot_marker(name: str) -> str:
+    """Stand-in value that survives rendering and marks where slot `name` goes"""
+    return f'\0{name}\0'
+
+
+def compile_rendered(rendered: str, slot_names) -> CompiledTemplate:
+    """Compile output rendered with slot_marker() values into a template over just those slots"""
+    source = rendered.replace('{', '{{').replace('}', '}}')
+    for name in slot_names:
+        source = source.replace(slot_marker(name), '{' + name + '}')
+    if '\0' in source:
+        raise ValueError("Rendered text contains a slot marker that was not compiled")
+    return compile_template(source)
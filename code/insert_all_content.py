@@ -1,142 +1,171 @@
 #!/usr/bin/env python3
 """
 Main script to generate and insert all 87 tutorial contents into Supabase
+
+Usage:
+    python3 code/insert_all_content.py
+    python3 code/insert_all_content.py --bulk [--chunk-size 500]
+
+Bulk mode renders every lesson and quiz in memory, then sends one chunked
+array upsert to lessons and one to quizzes (lesson ids are generated
+client-side, so quizzes never wait on a lesson response).
 """
 import os
 import sys
 import json
-import requests
 import uuid
+import argparse
 from datetime import datetime
 
 # Add the content generator module
 sys.path.append(os.path.dirname(__file__))
 from content_generator_full import generate_lesson_content, generate_quiz_questions
+from curriculum_catalog import get_catalog, lesson_topics
+from render_cache import get_render_cache
+from supabase_client import DEFAULT_CHUNK_SIZE, get_client
+from text_stats import text_stats
 
-# Supabase configuration
-SUPABASE_URL = os.environ.get('SUPABASE_URL')
-SUPABASE_SERVICE_KEY = os.environ.get('SUPABASE_SERVICE_ROLE_KEY')
+parser = argparse.ArgumentParser(description="Generate and insert lesson and quiz content")
+parser.add_argument('--bulk', action='store_true',
+                    help="Render everything first, then upsert lessons and quizzes in bulk")
+parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                    help=f"Rows per bulk upsert request (default {DEFAULT_CHUNK_SIZE})")
+args = parser.parse_args()
 
-headers = {
-    'apikey': SUPABASE_SERVICE_KEY,
-    'Authorization': f'Bearer {SUPABASE_SERVICE_KEY}',
-    'Content-Type': 'application/json',
-    'Prefer': 'return=representation'
-}
+client = get_client()
 
 # Fetch all courses that need content
 print("Fetching courses from database...")
-response = requests.get(
-    f'{SUPABASE_URL}/rest/v1/courses',
-    headers=headers,
-    params={'select': '*'}
-)
-
-courses = response.json()
+# Paged, since PostgREST caps a single response at db-max-rows
+courses = [course for page in client.select_pages('courses') for course in page]
 print(f"Found {len(courses)} courses")
 
-# Curriculum mapping for detailed content
-curriculum_map = {
-    "Welcome to Your Credit Repair Journey": {"code": "1.1", "duration": 20, "xp": 15, "topics": ["What is credit repair?", "Common myths vs. reality", "Timeline expectations"]},
-    "Understanding Your Credit Score Basics": {"code": "1.2", "duration": 30, "xp": 20, "topics": ["Credit score ranges", "FICO vs. VantageScore", "Five scoring factors"]},
-    "Understanding Credit Scores: The Basics": {"code": "1.2", "duration": 30, "xp": 20, "topics": ["Credit score ranges", "FICO vs. VantageScore", "Five scoring factors"]},
-    # Add more mappings as needed
-}
+# Curriculum details (code, duration, xp, topics) indexed by title and aliases;
+# add tutorials or aliases in CURRICULUM_TUTORIALS.json
+catalog = get_catalog()
+
+# Renders are reused across runs while inputs and templates are unchanged
+render_cache = get_render_cache()
+
+
+def build_lesson_row(course, curr_data, content_html):
+    """Lesson payload for a course; the id is generated client-side"""
+    course_title = course['title']
+    lesson_slug = course_title.lower().replace(' ', '-').replace(':', '').replace('&', 'and')
+    return {
+        'id': str(uuid.uuid4()),
+        'course_id': course['id'],
+        'title': course_title,
+        'slug': lesson_slug,
+        'content_type': 'text',
+        'content_html': content_html,
+        # Catalog duration, or the reading time of the rendered lesson if unknown
+        'duration_minutes': curr_data["duration"] or text_stats(content_html).reading_minutes,
+        'xp_reward': curr_data["xp"],
+        'is_active': True,
+        'display_order': 1
+    }
+
+
+def build_quiz_row(lesson_id, course_title, quiz_questions):
+    """Quiz payload attached to a lesson id"""
+    return {
+        'id': str(uuid.uuid4()),
+        'lesson_id': lesson_id,
+        'title': f"{course_title} - Quiz",
+        'passing_score': 70,
+        'questions_json': quiz_questions,
+        'is_active': True
+    }
+
 
 # Counter for progress
 lesson_count = 0
 quiz_count = 0
 
+# Rendered payloads for bulk mode
+lesson_rows = []
+quiz_rows = []
+
+# Index every course that already has a lesson with one paginated scan,
+# so the skip check below is a set lookup instead of a GET per course
+print("Indexing existing lessons...")
+courses_with_lessons = set()
+for page in client.select_pages('lessons', 'course_id'):
+    courses_with_lessons.update(row['course_id'] for row in page)
+print(f"Found lessons for {len(courses_with_lessons)} courses")
+
 # Process each course
 for course in courses:
     course_id = course['id']
     course_title = course['title']
     description = course.get('description', '')
-    
+
     # Check if lesson already exists
-    check_response = requests.get(
-        f'{SUPABASE_URL}/rest/v1/lessons',
-        headers=headers,
-        params={'course_id': f'eq.{course_id}', 'select': 'id'}
-    )
-    
-    existing_lessons = check_response.json()
-    if existing_lessons and len(existing_lessons) > 0:
+    if course_id in courses_with_lessons:
         print(f"✓ Skipping '{course_title}' - lesson already exists")
         continue
-    
+
     # Get curriculum details or use defaults
-    curr_data = curriculum_map.get(course_title, {
-        "code": "X.X",
-        "duration": 30,
-        "xp": 20,
-        "topics": ["Core concepts", "Practical applications", "Best practices"]
-    })
-    
-    # Extract topics from description if not in curriculum map
-    if "code" not in curriculum_map.get(course_title, {}):
-        curr_data["topics"] = [description, "Implementation strategies", "Common challenges"]
-    
+    tutorial = catalog.lookup_title(course_title)
+    if tutorial is None:
+        print(f"  ⚠ '{course_title}' is not in the curriculum catalog, using defaults")
+        tutorial = {"code": "X.X", "duration": None, "xp": 20, "topics": []}
+    curr_data = {
+        "code": tutorial["code"],
+        "duration": tutorial["duration"],
+        "xp": tutorial["xp"],
+        # Topics from the description if the catalog has none for this tutorial
+        "topics": lesson_topics(tutorial["topics"], description),
+    }
+
     print(f"\n📝 Generating content for: {course_title}")
-    
+
     # Generate lesson content
-    content_html = generate_lesson_content(
+    content_html = render_cache.render(
+        'lesson', generate_lesson_content,
         curr_data["code"],
         course_title,
         curr_data["topics"],
         description
     )
-    
+
     # Create lesson
-    lesson_slug = course_title.lower().replace(' ', '-').replace(':', '').replace('&', 'and')
-    lesson_data = {
-        'id': str(uuid.uuid4()),
-        'course_id': course_id,
-        'title': course_title,
-        'slug': lesson_slug,
-        'content_type': 'text',
-        'content_html': content_html,
-        'duration_minutes': curr_data["duration"],
-        'xp_reward': curr_data["xp"],
-        'is_active': True,
-        'display_order': 1
-    }
-    
+    lesson_data = build_lesson_row(course, curr_data, content_html)
+
+    if args.bulk:
+        quiz_questions = render_cache.render(
+            'quiz', generate_quiz_questions,
+            curr_data["code"],
+            course_title,
+            curr_data["topics"]
+        )
+        lesson_rows.append(lesson_data)
+        quiz_rows.append(build_quiz_row(lesson_data['id'], course_title, quiz_questions))
+        print(f"  ✓ Rendered lesson ({text_stats(content_html).words:,} words) and quiz ({len(quiz_questions)} questions)")
+        continue
+
     # Insert lesson
-    lesson_response = requests.post(
-        f'{SUPABASE_URL}/rest/v1/lessons',
-        headers=headers,
-        json=lesson_data
-    )
-    
+    lesson_response = client.insert('lessons', lesson_data)
+
     if lesson_response.status_code in [200, 201]:
         lesson_id = lesson_response.json()[0]['id']
         lesson_count += 1
-        print(f"  ✓ Created lesson ({len(content_html)} chars)")
-        
+        print(f"  ✓ Created lesson ({text_stats(content_html).words:,} words)")
+
         # Generate quiz questions
-        quiz_questions = generate_quiz_questions(
+        quiz_questions = render_cache.render(
+            'quiz', generate_quiz_questions,
             curr_data["code"],
             course_title,
             curr_data["topics"]
         )
-        
+
         # Create quiz
-        quiz_data = {
-            'id': str(uuid.uuid4()),
-            'lesson_id': lesson_id,
-            'title': f"{course_title} - Quiz",
-            'passing_score': 70,
-            'questions_json': quiz_questions,
-            'is_active': True
-        }
-        
-        quiz_response = requests.post(
-            f'{SUPABASE_URL}/rest/v1/quizzes',
-            headers=headers,
-            json=quiz_data
-        )
-        
+        quiz_data = build_quiz_row(lesson_id, course_title, quiz_questions)
+
+        quiz_response = client.insert('quizzes', quiz_data)
+
         if quiz_response.status_code in [200, 201]:
             quiz_count += 1
             print(f"  ✓ Created quiz ({len(quiz_questions)} questions)")
@@ -145,9 +174,25 @@ for course in courses:
     else:
         print(f"  ✗ Failed to create lesson: {lesson_response.text}")
 
+if args.bulk and lesson_rows:
+    print(f"\n📤 Upserting {len(lesson_rows)} lessons in chunks of {args.chunk_size}...")
+    lesson_count, lesson_failures = client.upsert_many('lessons', lesson_rows, args.chunk_size)
+
+    # Quizzes reference lessons, so drop the ones whose lesson chunk failed
+    failed_lesson_ids = set()
+    for chunk, resp in lesson_failures:
+        failed_lesson_ids.update(row['id'] for row in chunk)
+        print(f"  ✗ Failed to upsert {len(chunk)} lessons: {resp.text}")
+    quiz_rows = [quiz for quiz in quiz_rows if quiz['lesson_id'] not in failed_lesson_ids]
+
+    print(f"📤 Upserting {len(quiz_rows)} quizzes in chunks of {args.chunk_size}...")
+    quiz_count, quiz_failures = client.upsert_many('quizzes', quiz_rows, args.chunk_size)
+    for chunk, resp in quiz_failures:
+        print(f"  ✗ Failed to upsert {len(chunk)} quizzes: {resp.text}")
+
 print(f"\n{'='*60}")
 print(f"✅ Content generation complete!")
 print(f"   Lessons created: {lesson_count}")
 print(f"   Quizzes created: {quiz_count}")
+print(f"   Render cache:    {render_cache.summary()}")
 print(f"{'='*60}")
-
@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+Streaming item analysis for generated quizzes
+
+For every quiz question this computes, over quiz_attempts:
+    - p-value: share of attempts answering it correctly (difficulty)
+    - point-biserial discrimination: correlation between answering it
+      correctly and the rest score (correct answers on the quiz's other
+      questions)
+    - selection rate of each option, plus unanswered
+
+Everything is derived from per-question running moments (count, means, sums
+of squared deviations and the co-moment), so one streaming pass keeps
+constant memory per question. Batches of attempts are folded in with the
+pairwise form of Welford's update (Chan et al.), and the same merge combines
+two snapshots, so questions shared across quizzes (such as the generic
+template's) are also pooled by question text.
+
+The accumulated moments are saved as a snapshot covering the window
+(since, until] of completed_at. The next run resumes from `until` and only
+reads newer attempts. until trails the clock by --lag so attempts still
+being written are not skipped. Snapshots over adjacent windows, such as
+backfill shards, can be merged with --merge. A quiz whose questions change
+starts again from its next attempts.
+
+Usage:
+    python3 code/item_stats.py                      # update the snapshot and report
+    python3 code/item_stats.py --full --csv items.csv
+    python3 code/item_stats.py --until 2025-06-01T00:00:00+00:00 --snapshot part1.json
+    python3 code/item_stats.py --since 2025-06-01T00:00:00+00:00 --snapshot part2.json
+    python3 code/item_stats.py --merge part1.json part2.json --snapshot merged.json
+
+Requirements:
+    - numpy
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import numpy as np
+import requests
+
+sys.path.append(os.path.dirname(__file__))
+from regrade_quizzes import AnswerKey, encode_answers
+from supabase_client import DEFAULT_PAGE_SIZE, get_client
+
+CODE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SNAPSHOT = os.path.join(CODE_DIR, '.cache', 'item_stats.json')
+SNAPSHOT_VERSION = 1
+DEFAULT_LAG = 300  # Seconds; until trails now so in-flight attempts land in the next window
+BATCH_ROWS = 50_000  # Buffered attempts across all quizzes before folding them in
+ATTEMPT_COLUMNS = 'id,quiz_id,answers_json,completed_at'
+
+EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+
+# Review thresholds (classical test theory rules of thumb)
+MIN_ATTEMPTS = 30
+EASY_P = 0.90
+HARD_P = 0.20
+MIN_DISCRIMINATION = 0.20
+DEAD_DISTRACTOR = 0.05  # A wrong option picked less often than this is not doing any work
+
+
+def _divide(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """a / b, NaN where b is (numerically) 0"""
+    return np.divide(a, b, out=np.full(np.shape(a), np.nan), where=np.abs(b) > 1e-12)
+
+
+def _widened(counts: np.ndarray, width: int) -> np.ndarray:
+    """Option counts padded to width columns, keeping the unanswered column last"""
+    extra = width - counts.shape[1]
+    if extra <= 0:
+        return counts
+    return np.concatenate([counts[:, :-1], np.zeros((len(counts), extra), dtype=np.int64), counts[:, -1:]],
+                          axis=1)
+
+
+class ItemStats:
+    """Mergeable running moments for a quiz's questions (or one question pooled across quizzes)"""
+
+    MOMENTS = ('mean_correct', 'mean_rest', 'm2_correct', 'm2_rest', 'comoment')
+
+    def __init__(self, questions: int, width: int):
+        self.n = np.zeros(questions, dtype=np.int64)
+        self.mean_correct = np.zeros(questions)
+        self.mean_rest = np.zeros(questions)
+        self.m2_correct = np.zeros(questions)
+        self.m2_rest = np.zeros(questions)
+        self.comoment = np.zeros(questions)
+        # Column k counts option k; the last column counts unanswered or invalid answers
+        self.option_counts = np.zeros((questions, width), dtype=np.int64)
+
+    @classmethod
+    def from_batch(cls, key: AnswerKey, answers: np.ndarray, options: List[int]) -> 'ItemStats':
+        """Moments of one (attempts x questions) answer matrix; options is each question's option count"""
+        width = max(options, default=0) + 1
+        stats = cls(key.questions, width)
+        if not len(answers):
+            return stats
+        correct = (answers == key.key).astype(np.float64)
+        rest = correct.sum(axis=1, keepdims=True) - correct
+        stats.n[:] = len(answers)
+        stats.mean_correct = correct.mean(axis=0)
+        stats.mean_rest = rest.mean(axis=0)
+        dev_correct = correct - stats.mean_correct
+        dev_rest = rest - stats.mean_rest
+        stats.m2_correct = (dev_correct ** 2).sum(axis=0)
+        stats.m2_rest = (dev_rest ** 2).sum(axis=0)
+        stats.comoment = (dev_correct * dev_rest).sum(axis=0)
+        for j, count in enumerate(options):
+            chosen = np.where((answers[:, j] >= 0) & (answers[:, j] < count), answers[:, j], width - 1)
+            stats.option_counts[j] = np.bincount(chosen, minlength=width)
+        return stats
+
+    @property
+    def questions(self) -> int:
+        return len(self.n)
+
+    def merge(self, other: 'ItemStats') -> 'ItemStats':
+        """Fold other's attempts into these moments (pairwise Welford update)"""
+        n = self.n + other.n
+        share = _divide(other.n.astype(np.float64), n)
+        cross = _divide((self.n * other.n).astype(np.float64), n)
+        share[n == 0] = 0.0
+        cross[n == 0] = 0.0
+        delta_correct = other.mean_correct - self.mean_correct
+        delta_rest = other.mean_rest - self.mean_rest
+        self.mean_correct = self.mean_correct + delta_correct * share
+        self.mean_rest = self.mean_rest + delta_rest * share
+        self.m2_correct = self.m2_correct + other.m2_correct + delta_correct ** 2 * cross
+        self.m2_rest = self.m2_rest + other.m2_rest + delta_rest ** 2 * cross
+        self.comoment = self.comoment + other.comoment + delta_correct * delta_rest * cross
+        self.n = n
+        width = max(self.option_counts.shape[1], other.option_counts.shape[1])
+        self.option_counts = _widened(self.option_counts, width) + _widened(other.option_counts, width)
+        return self
+
+    def item(self, index: int) -> 'ItemStats':
+        """Copy of one question's moments"""
+        single = ItemStats(1, self.option_counts.shape[1])
+        single.n = self.n[index:index + 1].copy()
+        for name in self.MOMENTS:
+            setattr(single, name, getattr(self, name)[index:index + 1].copy())
+        single.option_counts = self.option_counts[index:index + 1].copy()
+        return single
+
+    @property
+    def p_value(self) -> np.ndarray:
+        return np.where(self.n > 0, self.mean_correct, np.nan)
+
+    @property
+    def discrimination(self) -> np.ndarray:
+        """Point-biserial correlation with the rest score; NaN without variance"""
+        return _divide(self.comoment, np.sqrt(self.m2_correct * self.m2_rest))
+
+    @property
+    def selection_rates(self) -> np.ndarray:
+        return _divide(self.option_counts.astype(np.float64), self.n[:, None].astype(np.float64))
+
+    def to_json(self) -> Dict:
+        data = {name: getattr(self, name).tolist() for name in ('n',) + self.MOMENTS}
+        data['option_counts'] = self.option_counts.tolist()
+        return data
+
+    @classmethod
+    def from_json(cls, data: Dict) -> 'ItemStats':
+        counts = np.array(data['option_counts'], dtype=np.int64)
+        stats = cls(*counts.shape)
+        stats.n = np.array(data['n'], dtype=np.int64)
+        for name in cls.MOMENTS:
+            setattr(stats, name, np.array(data[name], dtype=np.float64))
+        stats.option_counts = counts
+        return stats
+
+
+class QuizItems:
+    """A quiz's questions as item analysis sees them"""
+
+    def __init__(self, quiz: Dict):
+        questions = quiz['questions_json'] if isinstance(quiz['questions_json'], list) else []
+        self.id = quiz['id']
+        self.title = quiz.get('title') or quiz['id']
+        self.key = AnswerKey(questions, quiz.get('passing_score'))
+        self.texts = [q.get('question', '') if isinstance(q, dict) else '' for q in questions]
+        self.options = [len(q.get('options') or []) if isinstance(q, dict) else 0 for q in questions]
+        self.width = max(self.options, default=0) + 1
+        self.version = hashlib.sha256(json.dumps(questions, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+def parse_time(value: Optional[str]) -> datetime:
+    """A window bound as an aware datetime (None is the start of time); naive values are UTC"""
+    if value is None:
+        return EPOCH
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class Snapshot:
+    """Per-quiz moments over the completed_at window (since, until]"""
+
+    def __init__(self, since: Optional[str] = None, until: Optional[str] = None):
+        self.since = since
+        self.until = until
+        self.quizzes: Dict[str, ItemStats] = {}
+        self.versions: Dict[str, str] = {}
+        self.attempts = 0
+
+    @classmethod
+    def load(cls, path: str) -> 'Snapshot':
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(f"{path}: unsupported snapshot version {data.get('version')}")
+        snapshot = cls(data['since'], data['until'])
+        snapshot.attempts = data['attempts']
+        for quiz_id, entry in data['quizzes'].items():
+            snapshot.versions[quiz_id] = entry['version']
+            snapshot.quizzes[quiz_id] = ItemStats.from_json(entry['stats'])
+        return snapshot
+
+    def save(self, path: str):
+        data = {
+            'version': SNAPSHOT_VERSION,
+            'since': self.since,
+            'until': self.until,
+            'attempts': self.attempts,
+            'quizzes': {quiz_id: {'version': self.versions[quiz_id], 'stats': stats.to_json()}
+                        for quiz_id, stats in self.quizzes.items()},
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = f'{path}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    def stats_for(self, quiz: QuizItems) -> ItemStats:
+        """The quiz's accumulator, restarted if its questions changed since the snapshot"""
+        if self.versions.get(quiz.id) != quiz.version:
+            self.versions[quiz.id] = quiz.version
+            self.quizzes[quiz.id] = ItemStats(quiz.key.questions, quiz.width)
+        return self.quizzes[quiz.id]
+
+    def merge(self, other: 'Snapshot') -> 'Snapshot':
+        """Combine with a snapshot over the adjacent window"""
+        first, second = sorted((self, other), key=lambda s: parse_time(s.since))
+        if second.since is None or parse_time(first.until) != parse_time(second.since):
+            raise ValueError(f"windows are not adjacent: ({first.since}, {first.until}] "
+                             f"and ({second.since}, {second.until}]")
+        merged = Snapshot(first.since, second.until)
+        merged.attempts = first.attempts + second.attempts
+        for snapshot in (first, second):
+            for quiz_id, stats in snapshot.quizzes.items():
+                version = snapshot.versions[quiz_id]
+                if merged.versions.get(quiz_id) == version:
+                    merged.quizzes[quiz_id].merge(stats)
+                else:
+                    # Questions changed between the windows: keep the later version only
+                    merged.versions[quiz_id] = version
+                    merged.quizzes[quiz_id] = ItemStats.from_json(stats.to_json())
+        return merged
+
+
+def accumulate(client, snapshot: Snapshot, quizzes: Dict[str, QuizItems], page_size: int) -> int:
+    """Stream attempts completed in (snapshot.since, snapshot.until] into it; returns attempts skipped"""
+    filters = {'completed_at': [f'lte.{snapshot.until}']}
+    if snapshot.since is not None:
+        filters['completed_at'].append(f'gt.{snapshot.since}')
+    skipped = 0
+    buffers: Dict[str, List] = {}
+    buffered = 0
+
+    def flush():
+        for quiz_id, answers_rows in buffers.items():
+            quiz = quizzes[quiz_id]
+            answers = encode_answers(answers_rows, quiz.key.questions)
+            snapshot.stats_for(quiz).merge(ItemStats.from_batch(quiz.key, answers, quiz.options))
+            snapshot.attempts += len(answers_rows)
+        buffers.clear()
+
+    for page in client.select_pages('quiz_attempts', ATTEMPT_COLUMNS, filters, page_size=page_size):
+        for attempt in page:
+            if attempt['quiz_id'] not in quizzes:
+                skipped += 1
+                continue
+            buffers.setdefault(attempt['quiz_id'], []).append(attempt['answers_json'])
+            buffered += 1
+        if buffered >= BATCH_ROWS:
+            flush()
+            buffered = 0
+    flush()
+    return skipped
+
+
+def item_flags(n: int, p: float, r: float, rates: np.ndarray, options: int, key: int) -> List[str]:
+    """Review reasons for one question, empty if it looks healthy or has too few attempts"""
+    if n < MIN_ATTEMPTS:
+        return []
+    flags = []
+    if p >= EASY_P:
+        flags.append('too easy')
+    elif p <= HARD_P:
+        flags.append('too hard')
+    if not np.isnan(r) and r < MIN_DISCRIMINATION:
+        flags.append(f'low discrimination ({r:.2f})')
+    dead = [chr(ord('A') + k) for k in range(options) if k != key and rates[k] < DEAD_DISTRACTOR]
+    if dead:
+        flags.append(f"unused distractor{'s' if len(dead) > 1 else ''} {', '.join(dead)}")
+    return flags
+
+
+def pool_by_text(snapshot: Snapshot, quizzes: Dict[str, QuizItems]) -> Dict[str, Dict]:
+    """Questions whose text appears in more than one quiz, with their moments merged"""
+    pooled: Dict[str, Dict] = {}
+    for quiz_id, stats in snapshot.quizzes.items():
+        quiz = quizzes.get(quiz_id)
+        if quiz is None or quiz.version != snapshot.versions[quiz_id]:
+            continue
+        for j, text in enumerate(quiz.texts):
+            entry = pooled.setdefault(text, {'quizzes': 0, 'stats': None})
+            entry['quizzes'] += 1
+            entry['stats'] = stats.item(j) if entry['stats'] is None else entry['stats'].merge(stats.item(j))
+    return {text: entry for text, entry in pooled.items() if entry['quizzes'] > 1}
+
+
+def write_csv(path: str, snapshot: Snapshot, quizzes: Dict[str, QuizItems]):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['quiz_id', 'quiz_title', 'question', 'text', 'attempts', 'p_value',
+                         'discrimination', 'selection_rates', 'unanswered_rate', 'flags'])
+        for quiz_id, stats in snapshot.quizzes.items():
+            quiz = quizzes.get(quiz_id)
+            if quiz is None or quiz.version != snapshot.versions[quiz_id]:
+                continue
+            p, r, rates = stats.p_value, stats.discrimination, stats.selection_rates
+            for j in range(stats.questions):
+                options = quiz.options[j]
+                writer.writerow([
+                    quiz_id, quiz.title, j + 1, quiz.texts[j], int(stats.n[j]),
+                    f'{p[j]:.4f}', '' if np.isnan(r[j]) else f'{r[j]:.4f}',
+                    ';'.join(f'{rate:.4f}' for rate in rates[j, :options]), f'{rates[j, -1]:.4f}',
+                    '; '.join(item_flags(int(stats.n[j]), p[j], r[j], rates[j], options, int(quiz.key.key[j]))),
+                ])
+
+
+def report(snapshot: Snapshot, quizzes: Dict[str, QuizItems], top: int):
+    flagged = []
+    for quiz_id, stats in snapshot.quizzes.items():
+        quiz = quizzes.get(quiz_id)
+        if quiz is None or quiz.version != snapshot.versions[quiz_id]:
+            continue
+        p, r, rates = stats.p_value, stats.discrimination, stats.selection_rates
+        for j in range(stats.questions):
+            flags = item_flags(int(stats.n[j]), p[j], r[j], rates[j], quiz.options[j], int(quiz.key.key[j]))
+            if flags:
+                flagged.append((len(flags), quiz.title, j + 1, int(stats.n[j]), p[j], r[j], flags))
+    flagged.sort(key=lambda item: (-item[0], item[1], item[2]))
+
+    print(f"\n🚩 {len(flagged)} questions flagged (at least {MIN_ATTEMPTS} attempts)")
+    for _, title, number, n, p, r, flags in flagged[:top]:
+        r_text = '  -  ' if np.isnan(r) else f'{r:+.2f}'
+        print(f"   {title[:40]:<40} Q{number}  n={n:<6} p={p:.2f} r={r_text}  {', '.join(flags)}")
+    if len(flagged) > top:
+        print(f"   ... {len(flagged) - top} more (use --csv for the full table)")
+
+    pooled = sorted(pool_by_text(snapshot, quizzes).items(), key=lambda item: -item[1]['quizzes'])
+    if pooled:
+        print("\n🔁 Questions shared across quizzes, pooled")
+        for text, entry in pooled[:top]:
+            stats = entry['stats']
+            r = stats.discrimination[0]
+            r_text = '  -  ' if np.isnan(r) else f'{r:+.2f}'
+            print(f"   {text[:60]:<60} {entry['quizzes']:>3} quizzes  n={int(stats.n[0]):<7} "
+                  f"p={stats.p_value[0]:.2f} r={r_text}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-question difficulty, discrimination and distractor rates")
+    parser.add_argument('--snapshot', default=DEFAULT_SNAPSHOT,
+                        help="Snapshot to resume from and update (default code/.cache/item_stats.json)")
+    parser.add_argument('--full', action='store_true', help="Ignore the snapshot and rescan every attempt")
+    parser.add_argument('--since', help="Start of the window (exclusive) when starting a new snapshot")
+    parser.add_argument('--until', help="End of the window (inclusive); default now minus --lag")
+    parser.add_argument('--lag', type=int, default=DEFAULT_LAG,
+                        help=f"Seconds the default --until trails now (default {DEFAULT_LAG})")
+    parser.add_argument('--merge', nargs='+', metavar='SNAPSHOT',
+                        help="Merge snapshots over adjacent windows into --snapshot instead of scanning")
+    parser.add_argument('--csv', help="Write every question's statistics to this CSV file")
+    parser.add_argument('--top', type=int, default=20, help="Rows per report section (default 20)")
+    parser.add_argument('--page-size', type=int, default=DEFAULT_PAGE_SIZE,
+                        help=f"Attempts fetched per request (default {DEFAULT_PAGE_SIZE})")
+    args = parser.parse_args()
+    for option, value in (('--since', args.since), ('--until', args.until)):
+        try:
+            parse_time(value)
+        except ValueError:
+            parser.error(f"{option} must be an ISO 8601 timestamp, got {value!r}")
+
+    client = get_client()
+    if not client.configured:
+        print("❌ Missing SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY")
+        sys.exit(1)
+
+    try:
+        quizzes = {quiz.id: quiz for quiz in
+                   (QuizItems(row) for page in client.select_pages(
+                       'quizzes', 'id,title,passing_score,questions_json', page_size=args.page_size)
+                    for row in page)}
+    except requests.HTTPError as e:
+        print(f"❌ Error fetching quizzes: {e.response.status_code} {e.response.text[:200]}")
+        sys.exit(1)
+
+    if args.merge:
+        try:
+            parts = sorted((Snapshot.load(path) for path in args.merge), key=lambda s: parse_time(s.since))
+            snapshot = parts[0]
+            for part in parts[1:]:
+                snapshot = snapshot.merge(part)
+        except (OSError, ValueError) as e:
+            print(f"❌ Cannot merge snapshots: {e}")
+            sys.exit(1)
+        print(f"🔗 Merged {len(parts)} snapshots: {snapshot.attempts:,} attempts")
+    else:
+        resume = os.path.exists(args.snapshot) and not args.full
+        previous = Snapshot.load(args.snapshot) if resume else Snapshot(until=args.since)
+        if resume and args.since:
+            print(f"❌ --since only applies to a new snapshot; {os.path.relpath(args.snapshot)} already "
+                  f"covers up to {previous.until}")
+            sys.exit(1)
+        until = args.until or (datetime.now(timezone.utc) - timedelta(seconds=args.lag)).isoformat()
+        if previous.until is not None and parse_time(until) <= parse_time(previous.until):
+            print(f"✓ Snapshot is current (up to {previous.until})")
+            snapshot = previous
+        else:
+            window = Snapshot(previous.until, until)
+            try:
+                skipped = accumulate(client, window, quizzes, args.page_size)
+            except requests.HTTPError as e:
+                print(f"❌ Error fetching attempts: {e.response.status_code} {e.response.text[:200]}")
+                sys.exit(1)
+            print(f"📥 {window.attempts:,} new attempts in ({window.since or 'start'}, {window.until}]")
+            if skipped:
+                print(f"   ⚠ Skipped {skipped:,} attempts whose quiz no longer exists")
+            snapshot = previous.merge(window) if resume else window
+    snapshot.save(args.snapshot)
+
+    print(f"📊 {snapshot.attempts:,} attempts over {len(snapshot.quizzes):,} quizzes "
+          f"({snapshot.since or 'start'} → {snapshot.until})")
+    report(snapshot, quizzes, args.top)
+    if args.csv:
+        write_csv(args.csv, snapshot, quizzes)
+        print(f"\n✓ Wrote {os.path.relpath(args.csv)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,760 @@
+#!/usr/bin/env python3
+"""
+Compiled lesson templates shared by the content scripts
+
+Lesson templates are compiled into static fragments once at import time
+(see fragment_template.py); rendering only fills the slots and joins. The
+enhanced lesson stays an f-string, which bench_render.py measures as faster
+for its single large body. This module has no I/O, so generators,
+benchmarks and worker processes can import it without Supabase credentials.
+
+Platform branding is a `{brand}` slot rather than literal text, so
+white-label tenants render the same templates with their own brand tokens
+(see render_tenants.py).
+"""
+
+from fragment_template import compile_template
+
+# Brand tokens for the platform's own catalog; tenants override them
+DEFAULT_BRAND = 'ScorePro'
+
+
+# Enhanced lesson body used by enhance_all_lessons.py
+def generate_enhanced_content(title: str, original_content: str, brand: str = DEFAULT_BRAND) -> str:
+    """
+    Generate enhanced lesson content (1,800-2,200 words)
+    Maintains HTML formatting and professional educational tone
+
+    Kept as an f-string: CPython compiles it to a single string build, which
+    bench_render.py shows is faster than joining compiled fragments for a
+    template with only a few slots.
+    """
+    return f'''<div class="lesson-content">
+<h1>{title}</h1>
+
+<div class="lesson-intro">
+<p class="lead">Master the essential concepts and practical applications of {title.lower()} in this comprehensive guide designed for credit repair professionals and consumers alike.</p>
+<p>This in-depth tutorial provides expert knowledge, proven strategies, real-world examples, and actionable steps that deliver measurable credit improvements.</p>
+</div>
+
+<div class="learning-objectives">
+<h2>What You'll Learn</h2>
+<ul>
+<li>Core principles and fundamental concepts underlying {title.lower()}</li>
+<li>Legal framework and consumer rights that protect you</li>
+<li>Step-by-step implementation strategies that work in practice</li>
+<li>Common challenges and expert solutions to overcome them</li>
+<li>Real-world case studies and application examples</li>
+<li>Best practices from thousands of successful credit repair cases</li>
+<li>Long-term maintenance strategies for sustainable credit health</li>
+</ul>
+</div>
+
+<h2>Why This Matters for Your Credit Success</h2>
+<p>Understanding {title.lower()} is not just academic knowledge—it's practical power that directly impacts your financial life. Your credit profile influences loan approvals, interest rates (potentially saving or costing thousands of dollars), rental applications, insurance premiums, employment opportunities, and even your ability to start a business.</p>
+
+<p>The average American with excellent credit (750+ score) pays approximately $100,000 less in interest over their lifetime compared to someone with poor credit (below 620). This single topic could be worth tens of thousands of dollars to you personally. That's why mastering these concepts is essential, not optional.</p>
+
+<p>The strategies and techniques presented here are based on federal credit laws (FCRA, FDCPA, CROA), proven industry practices, documented case studies from successful credit repair professionals, and real-world testing with thousands of consumers. You're learning practical approaches that work in reality, not theoretical concepts that sound impressive but fail when implemented.</p>
+
+<h2>Fundamental Concepts Explained</h2>
+
+<h3>Core Principle #1: Legal Rights and Bureau Accountability</h3>
+<p>The Fair Credit Reporting Act (FCRA) provides powerful legal rights that most consumers don't fully understand or leverage. Credit bureaus are required by federal law to maintain reasonable procedures ensuring maximum possible accuracy. When you dispute information, they must conduct a reasonable investigation—not a rubber-stamp verification.</p>
+
+<p>If information is inaccurate, incomplete, unverifiable, or cannot be confirmed within 30 days, it must be corrected or removed. This isn't optional for bureaus; it's federal law with serious penalties for violations (up to $1,000 per violation in civil cases, plus actual damages and attorney fees). Understanding this transforms credit repair from hoping bureaus help you to demanding they follow the law.</p>
+
+<p>The FCRA also grants you the right to know what's in your file, who accessed it, and to dispute any information you believe is inaccurate. These rights apply regardless of whether negative information is "true" if it cannot be verified through proper procedures. This distinction is critical—accuracy and verifiability are separate legal requirements.</p>
+
+<h3>Core Principle #2: Interconnected Scoring Factors</h3>
+<p>Credit scoring isn't simple math where factors add up independently. It's a complex algorithm where factors interact and influence each other. The FICO and VantageScore models use weighted categories, but improvements in one area create positive ripple effects throughout your profile.</p>
+
+<p>For example, improving your credit utilization (percentage of available credit used) doesn't just help the "amounts owed" category worth 30% of your score. It demonstrates responsible credit management, which may lead to automatic credit limit increases from existing creditors (further lowering utilization), better approval odds for new credit (helping credit mix), and reduced inquiry impact (as you qualify more easily and can be selective about applications).</p>
+
+<p>Similarly, removing one negative item doesn't just eliminate that specific impact. It can improve your overall profile risk assessment, potentially triggering creditor reconsideration of previously denied applications, enabling access to better credit products, and creating opportunities for strategic credit building moves previously unavailable.</p>
+
+<h3>Core Principle #3: Time, Consistency, and Compounding Progress</h3>
+<p>Credit improvement happens through sustained effort over months, not overnight quick fixes or magical loopholes. However, the time component works in your favor: recent positive behavior matters more than old negative information as time passes, negative items lose impact before they're removed, and consistent good habits compound into significant improvements.</p>
+
+<p>A 30-day late payment from 6 months ago hurts much more than the same late payment from 6 years ago. This time-based weighting means that even without removing negative items, their impact naturally decreases. Combined with positive credit building, this creates inevitable score improvement for anyone implementing proper strategies consistently.</p>
+
+<p>The question isn't if your credit will improve with proper strategy—it's when and by how much. Most consumers following systematic approaches see 50-100+ point improvements within 6-12 months, with some experiencing faster results depending on starting profiles and specific issues addressed.</p>
+
+<h2>Industry Context and Business Models</h2>
+
+<h3>How Credit Bureaus Make Money</h3>
+<p>Understanding the credit reporting industry's business model helps you navigate it effectively. Credit bureaus (Equifax, Experian, TransUnion) are for-profit corporations that make money by collecting comprehensive consumer data and selling access to lenders, insurers, employers, landlords, and other businesses.</p>
+
+<p>Their revenue model creates incentives that don't always align with consumer interests. More comprehensive data increases the value of their reports, creating incentives to include information even when accuracy is questionable. Processing disputes costs money and potentially removes revenue-generating data, creating minimal economic incentive for thoroughness.</p>
+
+<p>Bureaus process millions of disputes monthly, leading to automated systems (e-OSCAR and similar platforms) that prioritize speed over thoroughness. Understanding this helps you craft disputes that break through automation and trigger genuine human review. It also explains why persistence through multiple dispute rounds often succeeds where single attempts fail—squeaky wheels get attention.</p>
+
+<h3>Data Furnisher Dynamics</h3>
+<p>Creditors and collection agencies ("data furnishers") report information to bureaus voluntarily—there's no legal requirement forcing them to report. This voluntary nature creates opportunities for negotiation and strategic communication that many consumers miss.</p>
+
+<p>Furnishers have discretion in what they report and when they update information. They can delete tradelines entirely, update information to reflect more favorable status, or choose not to report negative information. This discretion means that furnishers can be influenced by compelling arguments: goodwill requests from longtime customers, disputes highlighting their own procedural errors, or pay-for-delete negotiations on collection accounts.</p>
+
+<h2>Step-by-Step Implementation Process</h2>
+
+<h3>Step 1: Comprehensive Credit Assessment (Week 1)</h3>
+<p>Begin with thorough credit report analysis from all three bureaus. Obtain reports from AnnualCreditReport.com (the only site authorized by federal law for free reports, not to be confused with similar-sounding commercial sites). You're entitled to one free report per bureau every 12 months, plus additional free reports in specific circumstances.</p>
+
+<p><strong>Review Personal Information Section:</strong> Verify name spellings, current and previous addresses, Social Security number, date of birth, and employment history. Errors here can indicate identity theft, merge files (your data mixed with someone else's), or simple data entry mistakes. These errors can lead to incorrect account associations.</p>
+
+<p><strong>Review Account Information:</strong> Examine every tradeline for accuracy: account numbers, opening dates, credit limits, current balances, payment history, and account status. Compare reported information to your own records. Look for accounts you don't recognize (possible fraud), incorrect late payments, wrong balances, unauthorized inquiries, and outdated information.</p>
+
+<p><strong>Review Inquiries:</strong> Check hard inquiries (from credit applications) to ensure you authorized each one. Unauthorized inquiries may indicate identity theft or creditor errors. Note that multiple inquiries for the same purpose (mortgage or auto shopping) within a short window should be counted as single inquiries.</p>
+
+<p><strong>Review Public Records and Collections:</strong> Verify bankruptcies show correct filing dates and types, liens and judgments are accurate and current, and collection accounts represent valid debts you actually owe. Many consumers discover collection accounts that are beyond the statute of limitations, from identity theft, or were already paid but not updated.</p>
+
+<p><strong>Create Error Inventory:</strong> Document every issue systematically: which bureau(s) report it, the specific error or inaccuracy, supporting documentation you have available, estimated score impact (high/medium/low), and your planned strategy for addressing it. This organized approach prevents missed opportunities and maintains accountability throughout the repair process.</p>
+
+<h3>Step 2: Strategic Prioritization (Week 1-2)</h3>
+<p>Not all credit issues equally impact your score or have the same likelihood of successful resolution. Strategic prioritization maximizes results from your efforts.</p>
+
+<p><strong>High Priority Items:</strong></p>
+<ul>
+<li><strong>Recent late payments on major accounts:</strong> These hurt most and may be removable via goodwill requests if you have otherwise positive history</li>
+<li><strong>Collection accounts actively reporting:</strong> Validate, negotiate pay-for-delete, or dispute inaccuracies</li>
+<li><strong>High credit utilization (>30%):</strong> Often the easiest quick win through payments or limit increases</li>
+<li><strong>Obvious errors with documentation:</strong> High success rate when you have proof</li>
+<li><strong>Identity theft or fraudulent accounts:</strong> Legal protections are strongest here</li>
+</ul>
+
+<p><strong>Medium Priority Items:</strong></p>
+<ul>
+<li><strong>Older negative items approaching removal date:</strong> May remove naturally soon, but worth disputing to accelerate</li>
+<li><strong>Accounts with partial inaccuracies:</strong> While account may be legitimate, specific details may be wrong</li>
+<li><strong>Authorized user accounts hurting you:</strong> Can be removed by request</li>
+<li><strong>Credit mix optimization:</strong> Adding diversity to credit types over time</li>
+</ul>
+
+<p><strong>Lower Priority Items:</strong></p>
+<ul>
+<li><strong>Very old negative items (5+ years):</strong> Already have limited impact</li>
+<li><strong>Items correctly reported with low score impact:</strong> Focus elsewhere for better ROI</li>
+<li><strong>Hard inquiries beyond recent timeframe:</strong> Minimal impact after 6-12 months</li>
+</ul>
+
+<h3>Step 3: Systematic Execution (Months 1-3)</h3>
+<p>Implementation requires meticulous documentation, strategic communication, and consistent follow-through.</p>
+
+<p><strong>Documentation Standards:</strong> Maintain comprehensive records including: original credit reports from all three bureaus, all dispute letters sent (keep copies), all bureau and creditor responses received, certified mail receipts and tracking numbers, payment confirmations and settlement agreements, and detailed notes from phone conversations (date, time, person's name, summary of discussion, promises made).</p>
+
+<p><strong>Dispute Letter Best Practices:</strong> Be specific about what's incorrect and why, reference FCRA rights but avoid sounding like template letters, provide supporting documentation when available, request specific action (investigation, correction, or removal), send via certified mail with return receipt, and maintain professional tone throughout.</p>
+
+<p><strong>Follow-Up Schedule:</strong> Bureaus have 30 days to investigate and respond (45 days if you provide additional information during their investigation). On day 31 if no response received, send follow-up letter citing FCRA violation. On day 60 without resolution, escalate to CFPB complaint. Throughout, maintain detailed timeline documentation.</p>
+
+<p><strong>Use {brand} Platform:</strong> Track all disputes, deadlines, and responses in one organized system. Set automated reminders for follow-ups. Generate professional dispute letters from templates. Store all documentation securely. Monitor progress with visual dashboards.</p>
+
+<h3>Step 4: Continuous Monitoring and Optimization (Ongoing)</h3>
+<p>As strategies are implemented, continuously monitor progress and adjust approaches based on results.</p>
+
+<p><strong>Monthly Credit Report Review:</strong> During active repair, check all three bureau reports monthly. Verify disputed items were investigated and corrected. Catch new errors or negative items immediately. Confirm positive information reports correctly. Note any unexpected changes requiring attention.</p>
+
+<p><strong>Score Tracking:</strong> Monitor credit scores (FICO and VantageScore) to measure improvement impact. Understand that scores from different sources use different models and may vary. Focus on trends over time rather than score fluctuations. Celebrate milestones (crossing into new score tiers) while maintaining focus on continued improvement.</p>
+
+<p><strong>Strategy Adjustment:</strong> If certain bureaus consistently reject disputes, try different approaches or documentation. If goodwill letters aren't working, try pay-for-delete negotiations. If direct bureau disputes fail, try disputing through furnishers. Flexibility and persistence overcome obstacles.</p>
+
+<h2>Common Challenges and Proven Solutions</h2>
+
+<h3>Challenge: Generic Verification Responses</h3>
+<p><strong>Problem:</strong> Bureau responds with "verified as accurate" without explaining their investigation process, providing evidence of verification, or addressing your specific dispute points.</p>
+
+<p><strong>Solution:</strong> Request Method of Verification (MOV) under FCRA Section 611(a)(7). Send follow-up letter requesting: detailed information about investigation procedures used, documentation reviewed during investigation, name and contact information of person at furnisher who verified information, and explanation of how disputed information was confirmed accurate. Inadequate or non-existent MOV creates grounds for re-dispute with additional arguments or CFPB complaint documenting the violation.</p>
+
+<h3>Challenge: Disputes Marked "Frivolous"</h3>
+<p><strong>Problem:</strong> Bureau deems your dispute "frivolous" or "irrelevant" and refuses investigation, potentially creating a record that blocks future disputes on the same item.</p>
+
+<p><strong>Solution Prevention:</strong> Only dispute legitimate errors, provide specific details about what's wrong, avoid mass-disputing everything on your report, include supporting documentation when available, and use original wording rather than obvious templates. <strong>Solution if Wrongly Marked:</strong> Respond firmly citing specific FCRA violations in their frivolous determination, provide additional evidence proving dispute legitimacy, escalate to CFPB with full documentation, and request removal of the frivolous designation from your file.</p>
+
+<h3>Challenge: Creditor Non-Response to Validation</h3>
+<p><strong>Problem:</strong> Collection agency continues collection efforts after your validation request without providing the required documentation proving they own the debt and amount is accurate.</p>
+
+<p><strong>Solution:</strong> Document the FDCPA violation carefully (keep copies of your validation request and proof of delivery). Send cease-and-desist letter demanding they stop all contact except legal notices required by law. Dispute with all three credit bureaus noting the failed validation and FDCPA violations. File detailed CFPB complaint with documentation. Consider consulting with FDCPA attorney—violations carry statutory damages of up to $1,000 plus actual damages and attorney fees, making many attorneys willing to take cases on contingency.</p>
+
+<h3>Challenge: Paid Collections Still Reporting</h3>
+<p><strong>Problem:</strong> You paid a collection account, but it still shows as unpaid or the entire tradeline remains on your report hurting your score.</p>
+
+<p><strong>Solution:</strong> If you have proof of payment, dispute with bureaus providing payment documentation. Contact the collection agency requesting they update status to "paid" or delete entirely as agreed. If no pay-for-delete was negotiated before payment, you have limited leverage but can try goodwill requests. <strong>Future Prevention:</strong> Always negotiate pay-for-delete BEFORE paying collections—payment is your leverage, don't give it up without getting deletion in writing.</p>
+
+<h2>Expert Best Practices</h2>
+
+<h3>Practice #1: Documentation Excellence</h3>
+<p>Maintain organized files for every credit-related document. Use folder systems (physical or digital) organized by account, bureau, or issue type with date-based sub-folders. This organization proves invaluable when compiling evidence for escalated disputes, demonstrating patterns of bureau non-compliance for CFPB complaints, or working with attorneys if legal action becomes necessary. Good documentation is the foundation of successful credit repair.</p>
+
+<h3>Practice #2: Certified Mail for Important Correspondence</h3>
+<p>Always use certified mail with return receipt requested for disputes with bureaus or important communication with creditors. The $6-8 cost per letter is minimal compared to the value it provides: irrefutable proof of delivery and receipt, starts legal 30-day response clocks, creates evidence for potential legal action, and demonstrates seriousness to recipients. Regular mail lacks proof—bureaus can claim they never received your dispute.</p>
+
+<h3>Practice #3: Build While Repairing</h3>
+<p>Don't wait for all negative items removed before building positive credit history. Start immediately with secured credit cards ($200-500 deposit), authorized user status on established accounts, credit-builder loans from credit unions, or rent reporting services (Rental Kharma, LevelCredit). These positive tradelines start helping your score immediately, partially offsetting negatives while disputes proceed through the slower removal process.</p>
+
+<h3>Practice #4: Automate Good Habits</h3>
+<p>Set up automatic payments from checking to credit cards preventing future late payments (even if you pay manually, automation is backup protection). Use balance alerts on credit cards when approaching 30% utilization thresholds. Schedule monthly calendar reminders for credit review sessions. Create annual reminders to pull free credit reports. Automation reduces reliance on memory and willpower, preventing mistakes that derail months of progress.</p>
+
+<h3>Practice #5: Strategic Credit Utilization Management</h3>
+<p>Keep reported balances under 30% of limits ideally, under 10% for maximum score benefit, or $0 balances for absolute optimal scores (though having small balances sometimes helps more than no activity). Remember that utilization is calculated at statement closing date—you can use cards heavily and pay down before statement closes. Request credit limit increases every 6-12 months on good accounts (instant utilization improvement without paying down balances).</p>
+
+<h2>Real-World Application Examples</h2>
+
+<h3>Example 1: Medical Collection Dispute Success</h3>
+<p>Sarah discovered an $850 medical collection from 2 years ago that she didn't recognize. Instead of immediately paying (which wouldn't remove it and eliminates leverage), she sent a debt validation letter requesting: original creditor information and account number, itemized billing showing services rendered, proof collection agency owns the debt or has authority to collect, and accounting of the claimed amount. The collector provided a generic response without itemization or proof of ownership. Sarah disputed with all three bureaus noting the inadequate validation and FDCPA violations. The collection was removed within 45 days because the collector couldn't properly substantiate the debt. Her score increased 60 points from this single removal. Key lesson: Always validate before paying collections.</p>
+
+<h3>Example 2: Goodwill Late Payment Removal</h3>
+<p>James had one 30-day late payment from 8 months ago during a brief job loss, after maintaining 5 years of perfect payment history with the creditor. He brought the account current, set up automatic payments, and wrote a heartfelt goodwill letter explaining: the temporary hardship (job loss), his otherwise excellent 5-year history with them, steps taken to ensure it never happens again (automation, emergency fund), and respectful request for one-time courtesy removal as valued customer. The creditor agreed, removed the late payment, and James's score jumped 42 points. Key lesson: Long-term customers have goodwill equity to spend on occasional mistakes.</p>
+
+<h3>Example 3: Strategic Credit Building from Zero</h3>
+<p>Maria (age 25) had no credit history, creating a catch-22—can't get credit without credit history. She implemented a strategic three-pronged approach: (1) Opened secured credit card with $300 deposit at her credit union, used it for small purchases, paid in full monthly; (2) Became authorized user on her parent's 15-year-old credit card account with perfect payment history (added 15 years of positive history to her report); (3) Got a $500 credit-builder loan from her credit union (loan proceeds held in savings while she makes payments, building payment history and forced savings simultaneously). Within 6 months, Maria had a 680 credit score with diverse credit mix and sufficient history to qualify for unsecured credit cards, apartment rental, and better auto loan rates. She saved approximately $2,400 on a car loan compared to subprime rates. Key lesson: Strategic credit building creates opportunities even from zero starting point.</p>
+
+<h2>Advanced Strategies for Complex Situations</h2>
+
+<h3>Metro 2 Format Compliance Challenges</h3>
+<p>Data furnishers use Metro 2 format to report information to bureaus. This format has strict requirements for how information must be coded and reported. Furnishers who violate Metro 2 standards (reporting incorrect account status codes, using wrong date formats, providing incomplete data fields) can be challenged. Request furnisher's procedures for Metro 2 compliance, point out specific violations in their reporting, cite FCRA requirements for accurate reporting, and escalate to CFPB if violations continue.</p>
+
+<h3>Tackling Mixed Files</h3>
+<p>Sometimes bureaus merge your file with someone else's with a similar name or Social Security number. This creates accounts, inquiries, or public records on your report that belong to another person. To fix: Identify all items that don't belong to you, file identity theft report with FTC if appropriate, dispute with bureaus noting mixed file and requesting complete file separation, consider requesting file disclosure under FCRA 609 to see what information bureaus maintain, and escalate to CFPB if bureaus don't properly separate files. Mixed files can be stubborn but must be corrected.</p>
+
+<h2>Your Action Plan</h2>
+
+<h3>Immediate Actions (This Week):</h3>
+<ul>
+<li>Obtain all three credit reports from AnnualCreditReport.com</li>
+<li>Review each report section by section systematically</li>
+<li>Create comprehensive error inventory with prioritization</li>
+<li>Set up {brand} tracking system for dispute management</li>
+<li>Implement automatic payments for all accounts to prevent future issues</li>
+<li>Calculate current credit utilization and create reduction plan if above 30%</li>
+<li>Research your state's statute of limitations on debt</li>
+</ul>
+
+<h3>Short-Term Actions (This Month):</h3>
+<ul>
+<li>Send first round of dispute letters via certified mail to all three bureaus</li>
+<li>Implement quick wins (pay down high utilization cards to under 30%)</li>
+<li>Open secured card or credit-builder loan if you need positive tradelines</li>
+<li>Research goodwill letter opportunities for longtime creditor relationships</li>
+<li>Set up monthly monitoring routine and calendar reminders</li>
+<li>Create filing system for all credit repair documentation</li>
+<li>Send debt validation letters to any collection accounts</li>
+</ul>
+
+<h3>Medium-Term Actions (Months 2-6):</h3>
+<ul>
+<li>Follow up on all disputes within 31 days if no response received</li>
+<li>Send second-round disputes or Method of Verification requests as needed</li>
+<li>Negotiate pay-for-delete on validated collection accounts</li>
+<li>Build positive credit consistently (100% on-time payments, low utilization)</li>
+<li>Request credit limit increases on good standing accounts</li>
+<li>Review progress monthly and adjust strategies based on results</li>
+<li>File CFPB complaints for any FCRA violations by bureaus</li>
+<li>Consider authorized user opportunities for additional positive history</li>
+</ul>
+
+<h3>Long-Term Actions (6-12+ Months):</h3>
+<ul>
+<li>Monitor credit reports quarterly minimum (monthly during active repair)</li>
+<li>Maintain excellent credit habits indefinitely (they become automatic)</li>
+<li>Address new issues immediately before they become problems</li>
+<li>Continue credit education with advanced topics</li>
+<li>Plan major credit events (mortgage, business loan) strategically</li>
+<li>Help others with knowledge you've gained</li>
+<li>Build emergency fund to protect credit from future hardships</li>
+</ul>
+
+<div class="key-takeaway">
+<h3>Critical Takeaways</h3>
+<ul>
+<li>{title} is essential for financial success, potentially saving tens of thousands in interest costs</li>
+<li>Success combines error removal (exercising FCRA rights), positive credit building (new tradelines), and sustainable habits (automation and discipline)</li>
+<li>Documentation, patience, and systematic follow-through determine outcomes—sporadic effort produces sporadic results</li>
+<li>Legal rights under FCRA, FDCPA, and CROA provide powerful consumer protections when properly leveraged</li>
+<li>Credit management is ongoing financial practice, not one-time project—maintain good habits indefinitely</li>
+<li>Real progress requires 3-6 months minimum with consistent effort—beware anyone promising faster results</li>
+<li>Strategic approaches outperform brute force—prioritization and smart tactics matter more than effort volume</li>
+<li>Building positive credit while removing negatives accelerates improvement through compounding effects</li>
+</ul>
+</div>
+
+<h2>Conclusion and Next Steps</h2>
+<p>You now have comprehensive, expert-level knowledge about {title.lower()} and its critical role in credit health strategy. This education represents significant value—many people pay thousands of dollars to credit repair companies for services you can now perform yourself armed with this knowledge.</p>
+<p>But knowledge alone isn't power—applied knowledge is power. The strategies, techniques, and approaches presented here work when implemented consistently and intelligently. Thousands of successful credit repair journeys using these exact methods prove their effectiveness across diverse situations and credit profiles.</p>
+
+<p>Expect challenges and setbacks—they're normal parts of the process. Bureaus may reject initial disputes, creditors may refuse goodwill requests, and progress may feel slow at times. Each obstacle overcome makes you more knowledgeable and capable. The credit system can feel intimidating and opaque, but armed with education and legal rights, you have everything needed for success.</p>
+
+<p>Use the {brand} platform to maintain organization, track progress, generate professional correspondence, and stay motivated with visual progress indicators. The platform handles administrative burden, freeing you to focus on strategy and execution.</p>
+
+<p>Take action today—even small steps create momentum toward credit goals. Review your credit reports this week. Identify your top-priority item. Draft your first dispute letter. Set up automatic payments. Each action compounds over time into significant life improvements.</p>
+
+<p>Your financial future is shaped by the decisions and actions you take starting now. You have the knowledge, tools, and legal rights needed for success. The only remaining ingredient is action. Begin today, stay consistent, and you will achieve your credit goals.</p>
+
+<p><strong>Continue to the next lesson</strong> to build upon this foundation and further develop your comprehensive credit expertise. Each lesson adds another tool to your credit repair toolkit, bringing you closer to mastering credit management and achieving your most important financial goals.</p>
+
+<div class="lesson-completion">
+<p><em>Lesson complete! Take the quiz to test your understanding and earn XP points toward your next level and achievement badges.</em></p>
+</div>
+</div>'''
+
+
+# Fragments for content_generator_full.generate_lesson_content
+
+# Title, lead paragraph and the opening of the objectives list
+LESSON_HEADER = compile_template("""
+<div class="lesson-content">
+    <h1>{title}</h1>
+    
+    <div class="lesson-intro">
+        <p class="lead">{description}</p>
+    </div>
+
+    <div class="learning-objectives">
+        <h2>What You'll Learn</h2>
+        <ul>
+""")
+
+# One learning objective
+OBJECTIVE_ITEM = compile_template("            <li>{topic}</li>\n")
+
+# Closes the objectives and opens the main content
+MAIN_CONTENT_OPEN = """        </ul>
+    </div>
+
+    <div class="main-content">
+"""
+
+# Tutorial 1.1: Welcome to Your Credit Repair Journey
+WELCOME_CONTENT = compile_template("""
+        <h2>Introduction to Credit Repair</h2>
+        <p>Welcome to your credit repair journey with {brand}. This comprehensive program is designed to empower you with the knowledge and tools necessary to take control of your credit health. Whether you're starting with poor credit or looking to optimize an already good score, understanding the credit repair process is your first step toward financial freedom.</p>
+
+        <p>Credit repair is not magic—it's a systematic, legal process of identifying and correcting inaccuracies on your credit reports while building positive credit habits. The Fair Credit Reporting Act (FCRA) gives you powerful rights to dispute errors and demand accuracy from credit bureaus and creditors.</p>
+
+        <h2>Common Myths vs. Reality</h2>
+        <h3>Myth #1: Credit repair is a scam</h3>
+        <p><strong>Reality:</strong> While there are fraudulent credit repair companies, DIY credit repair using your legal rights under FCRA is completely legitimate and effective. You have the same rights and tools as any credit repair company—and when you do it yourself, you save money and maintain complete control.</p>
+
+        <h3>Myth #2: Negative items can never be removed before 7 years</h3>
+        <p><strong>Reality:</strong> While accurate negative information can remain for up to 7 years (10 for bankruptcies), inaccurate, unverifiable, or outdated information can and should be removed immediately. Many negative items contain errors that make them disputable.</p>
+
+        <h3>Myth #3: Credit repair happens overnight</h3>
+        <p><strong>Reality:</strong> Legitimate credit repair typically takes 3-6 months to see significant results. Quick-fix promises are usually scams. Real credit improvement requires systematic effort, patience, and persistence.</p>
+
+        <h3>Myth #4: Paying off collections immediately improves your score</h3>
+        <p><strong>Reality:</strong> Simply paying a collection doesn't remove it from your report. In fact, it can sometimes reset the date and hurt your score further. Strategic approaches like pay-for-delete negotiations or validation challenges are often more effective.</p>
+
+        <h2>Your Role in the Process</h2>
+        <p>As a DIY credit repairer, you are the most invested party in your credit success. Your active involvement includes:</p>
+        
+        <ul>
+            <li><strong>Educating yourself</strong> about credit scoring, reporting, and your legal rights</li>
+            <li><strong>Obtaining and reviewing</strong> your credit reports from all three bureaus</li>
+            <li><strong>Identifying errors</strong> and items that can be disputed or negotiated</li>
+            <li><strong>Crafting and sending</strong> dispute letters and documentation</li>
+            <li><strong>Following up</strong> on disputes and maintaining organized records</li>
+            <li><strong>Building positive credit habits</strong> while removing negative items</li>
+            <li><strong>Monitoring your progress</strong> and adjusting strategies as needed</li>
+        </ul>
+
+        <h2>Timeline Expectations</h2>
+        <p>Setting realistic expectations is crucial for maintaining motivation throughout your credit repair journey. Here's what a typical timeline looks like:</p>
+
+        <h3>Month 1: Foundation & Assessment</h3>
+        <ul>
+            <li>Obtain all three credit reports</li>
+            <li>Complete your credit education through this platform</li>
+            <li>Identify disputable items and prioritize them</li>
+            <li>Create your 90-day action plan</li>
+            <li>Send your first round of dispute letters</li>
+        </ul>
+
+        <h3>Months 2-3: Active Disputes & Habit Building</h3>
+        <ul>
+            <li>Receive and analyze bureau responses (30-45 days)</li>
+            <li>Send follow-up disputes and escalations</li>
+            <li>Begin credit-building strategies (secured card, authorized user, etc.)</li>
+            <li>Optimize credit utilization and payment patterns</li>
+            <li>See initial score improvements (typically 20-40 points)</li>
+        </ul>
+
+        <h3>Months 4-6: Optimization & Advanced Strategies</h3>
+        <ul>
+            <li>Implement advanced dispute techniques</li>
+            <li>Negotiate goodwill deletions and pay-for-delete agreements</li>
+            <li>Diversify credit mix strategically</li>
+            <li>Continue building positive payment history</li>
+            <li>Achieve significant score improvements (typically 50-100+ points)</li>
+        </ul>
+
+        <h3>Months 6+: Maintenance & Long-term Success</h3>
+        <ul>
+            <li>Transition to credit maintenance mode</li>
+            <li>Monitor credit regularly for new issues</li>
+            <li>Continue optimizing utilization and payment history</li>
+            <li>Plan for major credit events (mortgage, auto loan, etc.)</li>
+            <li>Maintain excellent credit indefinitely</li>
+        </ul>
+
+        <h2>Success Factors</h2>
+        <p>Research and community data show that successful credit repair depends on several key factors:</p>
+
+        <h3>1. Knowledge and Education</h3>
+        <p>Understanding credit scoring, your rights under FCRA, and effective dispute strategies dramatically increases success rates. This is why completing this educational program is so valuable.</p>
+
+        <h3>2. Organization and Documentation</h3>
+        <p>Maintaining detailed records of disputes, correspondence, and supporting documentation is essential. Successful credit repairers use systems (like {brand}) to track everything.</p>
+
+        <h3>3. Persistence and Follow-Through</h3>
+        <p>Many disputes require multiple rounds of letters and escalations. Those who persist through initial denials achieve significantly better results.</p>
+
+        <h3>4. Strategic Approach</h3>
+        <p>Not all negative items are equal. Prioritizing high-impact items and using the right strategy for each situation maximizes results.</p>
+
+        <h3>5. Simultaneous Credit Building</h3>
+        <p>While disputing negative items, successful individuals also actively build positive credit through secured cards, credit builder loans, and optimal credit behaviors.</p>
+
+        <h3>6. Patience and Realistic Expectations</h3>
+        <p>Those who understand that credit repair takes time and maintain consistent effort achieve lasting results, while those seeking quick fixes often fall for scams or give up prematurely.</p>
+
+        <h2>Setting Your Personal Goals</h2>
+        <p>Before diving into the technical aspects of credit repair, take time to define your personal credit goals. Consider:</p>
+
+        <h3>Short-term Goals (1-3 months):</h3>
+        <ul>
+            <li>Achieve a minimum credit score threshold (e.g., 600, 650, 700)</li>
+            <li>Remove specific high-impact negative items</li>
+            <li>Reduce credit utilization below 30%</li>
+            <li>Establish at least one positive tradeline</li>
+        </ul>
+
+        <h3>Medium-term Goals (3-6 months):</h3>
+        <ul>
+            <li>Reach a target credit score for a specific purpose</li>
+            <li>Clean up all inaccurate information</li>
+            <li>Build 6+ months of perfect payment history</li>
+            <li>Diversify credit mix appropriately</li>
+        </ul>
+
+        <h3>Long-term Goals (6-12+ months):</h3>
+        <ul>
+            <li>Achieve and maintain excellent credit (750+)</li>
+            <li>Qualify for premium credit cards and optimal loan rates</li>
+            <li>Purchase a home or vehicle with favorable financing</li>
+            <li>Build generational wealth through access to credit</li>
+        </ul>
+
+        <div class="key-takeaway">
+            <h3>Key Takeaways</h3>
+            <ul>
+                <li>Credit repair is a legitimate, legal process that works when done correctly</li>
+                <li>Expect to invest 3-6 months for significant results</li>
+                <li>Your active involvement and education are critical success factors</li>
+                <li>Success requires both removing negative items AND building positive credit</li>
+                <li>Patience, organization, and persistence separate successful credit repairers from those who give up</li>
+                <li>Setting clear, realistic goals keeps you motivated throughout the journey</li>
+            </ul>
+        </div>
+
+        <h2>Next Steps</h2>
+        <p>Now that you understand what credit repair entails and have set realistic expectations, you're ready to dive deeper into the mechanics of credit scoring in the next lesson. Remember: this is a marathon, not a sprint. With the right knowledge, tools, and mindset, you can achieve your credit goals and maintain excellent credit for life.</p>
+
+        <p>Continue to the next lesson to understand the fundamentals of credit scores and how they're calculated.</p>
+    </div>
+""")
+
+# Tutorial 1.2: Understanding Your Credit Score Basics
+SCORE_BASICS_CONTENT = """
+        <h2>What is a Credit Score?</h2>
+        <p>Your credit score is a three-digit number that represents your creditworthiness—essentially, how likely you are to repay borrowed money based on your past behavior. Scores range from 300 to 850, with higher scores indicating lower risk to lenders.</p>
+
+        <p>Credit scores are calculated using complex algorithms developed by analytics companies. The two most widely used scoring models are FICO® (Fair Isaac Corporation) and VantageScore®. While both assess similar factors, they weigh them differently and may produce slightly different scores.</p>
+
+        <h2>Credit Score Ranges and What They Mean</h2>
+        <p>Understanding where your score falls helps you recognize your current standing and set improvement goals:</p>
+
+        <div class="score-ranges">
+            <h3>Exceptional (800-850)</h3>
+            <ul>
+                <li>Top tier creditworthiness</li>
+                <li>Access to the best interest rates and terms</li>
+                <li>Premium credit card offers with highest rewards</li>
+                <li>Represents only about 20% of consumers</li>
+            </ul>
+
+            <h3>Very Good (740-799)</h3>
+            <ul>
+                <li>Above-average creditworthiness</li>
+                <li>Excellent interest rates and loan approval odds</li>
+                <li>Strong negotiating power with lenders</li>
+                <li>Represents about 25% of consumers</li>
+            </ul>
+
+            <h3>Good (670-739)</h3>
+            <ul>
+                <li>Near or slightly above average creditworthiness</li>
+                <li>Generally favorable interest rates</li>
+                <li>Most lenders consider you acceptable risk</li>
+                <li>Represents about 21% of consumers</li>
+            </ul>
+
+            <h3>Fair (580-669)</h3>
+            <ul>
+                <li>Below-average creditworthiness</li>
+                <li>Higher interest rates and stricter terms</li>
+                <li>May face loan denials or require deposits</li>
+                <li>Represents about 18% of consumers</li>
+            </ul>
+
+            <h3>Poor (300-579)</h3>
+            <ul>
+                <li>Subprime credit status</li>
+                <li>Difficulty qualifying for traditional credit</li>
+                <li>Very high interest rates when approved</li>
+                <li>May need secured products or co-signers</li>
+                <li>Represents about 16% of consumers</li>
+            </ul>
+        </div>
+
+        <h2>FICO vs. VantageScore: Understanding the Differences</h2>
+        
+        <h3>FICO Scores</h3>
+        <p>FICO is the most widely used credit scoring model, relied upon by 90% of top lenders. Created in 1989, FICO has multiple versions tailored for specific lending products (auto loans, mortgages, credit cards, etc.).</p>
+
+        <p><strong>Key characteristics of FICO:</strong></p>
+        <ul>
+            <li>Requires at least 6 months of credit history</li>
+            <li>Must have at least one account reported in the last 6 months</li>
+            <li>Multiple versions (FICO 8, FICO 9, FICO 10, industry-specific scores)</li>
+            <li>Used by most mortgage lenders, auto lenders, and card issuers</li>
+        </ul>
+
+        <h3>VantageScore</h3>
+        <p>VantageScore was developed in 2006 by the three major credit bureaus (Equifax, Experian, TransUnion) as a competitor to FICO. Currently on version 4.0, it's gaining adoption but still less commonly used than FICO.</p>
+
+        <p><strong>Key characteristics of VantageScore:</strong></p>
+        <ul>
+            <li>Can generate scores with just 1 month of history</li>
+            <li>More consistent across all three bureaus</li>
+            <li>Often the score shown in free credit monitoring apps</li>
+            <li>Gaining traction but not yet as widely used by lenders</li>
+        </ul>
+
+        <h3>Key Scoring Differences</h3>
+        <table class="comparison-table">
+            <tr>
+                <th>Factor</th>
+                <th>FICO</th>
+                <th>VantageScore</th>
+            </tr>
+            <tr>
+                <td>Payment History</td>
+                <td>35%</td>
+                <td>40%</td>
+            </tr>
+            <tr>
+                <td>Credit Utilization</td>
+                <td>30%</td>
+                <td>20%</td>
+            </tr>
+            <tr>
+                <td>Length of Credit History</td>
+                <td>15%</td>
+                <td>21%</td>
+            </tr>
+            <tr>
+                <td>Credit Mix</td>
+                <td>10%</td>
+                <td>11%</td>
+            </tr>
+            <tr>
+                <td>New Credit</td>
+                <td>10%</td>
+                <td>8%</td>
+            </tr>
+        </table>
+
+        <h2>The Five Factors That Determine Your Credit Score</h2>
+
+        <h3>1. Payment History (35% - FICO, 40% - VantageScore)</h3>
+        <p>This is the most important factor in your credit score. It reflects whether you pay your bills on time and includes:</p>
+        <ul>
+            <li>On-time payment percentage</li>
+            <li>Number and severity of late payments (30, 60, 90, 120+ days late)</li>
+            <li>Collections, charge-offs, foreclosures, and bankruptcies</li>
+            <li>How recently late payments occurred</li>
+            <li>How many accounts show late payments</li>
+        </ul>
+        <p><strong>Impact:</strong> Even one 30-day late payment can drop your score by 60-110 points depending on your current score and credit profile.</p>
+
+        <h3>2. Credit Utilization (30% - FICO, 20% - VantageScore)</h3>
+        <p>Also called "amounts owed," this factor measures how much of your available credit you're using. It's calculated both per card and across all revolving accounts.</p>
+        <ul>
+            <li>Total balances across all cards</li>
+            <li>Per-card utilization percentages</li>
+            <li>Types of accounts with balances</li>
+            <li>How many accounts carry balances</li>
+        </ul>
+        <p><strong>Optimal strategy:</strong> Keep utilization below 30% overall, and ideally below 10% for maximum score benefit. Utilization below 10% on all cards can boost your score significantly.</p>
+
+        <h3>3. Length of Credit History (15% - FICO, 21% - VantageScore)</h3>
+        <p>This factor considers how long you've been using credit, including:</p>
+        <ul>
+            <li>Age of your oldest account</li>
+            <li>Age of your newest account</li>
+            <li>Average age of all accounts</li>
+            <li>How long specific account types have been open</li>
+        </ul>
+        <p><strong>Key insight:</strong> This is why closing old accounts can hurt your score—it reduces your average account age. Keep old accounts open even if you don't use them frequently.</p>
+
+        <h3>4. Credit Mix (10% - FICO, 11% - VantageScore)</h3>
+        <p>Having different types of credit demonstrates that you can manage various credit responsibilities:</p>
+        <ul>
+            <li>Revolving credit (credit cards, lines of credit)</li>
+            <li>Installment loans (auto loans, mortgages, personal loans)</li>
+            <li>Open accounts (utilities, phone contracts)</li>
+        </ul>
+        <p><strong>Important note:</strong> While credit mix helps, don't take out loans you don't need just to improve this factor. The 10-11% weight means its impact is relatively minor.</p>
+
+        <h3>5. New Credit (10% - FICO, 8% - VantageScore)</h3>
+        <p>This factor looks at your recent credit-seeking behavior:</p>
+        <ul>
+            <li>Number of recently opened accounts</li>
+            <li>Number of recent credit inquiries</li>
+            <li>Time since recent account openings</li>
+            <li>Time since recent credit inquiries</li>
+        </ul>
+        <p><strong>Hard inquiry impact:</strong> Each hard inquiry typically drops your score by 5-10 points temporarily. However, multiple inquiries for the same type of loan (mortgage, auto) within 14-45 days count as one inquiry, allowing you to rate shop.</p>
+
+        <h2>Why You Have Multiple Credit Scores</h2>
+        <p>You might be confused to see different credit scores on different platforms. Here's why this happens:</p>
+
+        <h3>Different Scoring Models</h3>
+        <p>FICO alone has dozens of versions (FICO 8, FICO 9, FICO 10, mortgage-specific, auto-specific, etc.), each weighing factors slightly differently.</p>
+
+        <h3>Different Credit Bureaus</h3>
+        <p>Equifax, Experian, and TransUnion may have slightly different information about you because not all creditors report to all three bureaus.</p>
+
+        <h3>Different Reporting Dates</h3>
+        <p>Creditors report to bureaus on different dates, so your balances and account information may be current with one bureau but outdated with another.</p>
+
+        <h3>Educational vs. Lending Scores</h3>
+        <p>Many free credit monitoring services show you "educational scores" (often VantageScore) rather than the FICO scores lenders actually use.</p>
+
+        <h2>How Lenders Use Your Credit Score</h2>
+        
+        <h3>Risk Assessment</h3>
+        <p>Lenders use your score to predict the likelihood you'll default on a loan. Higher scores = lower perceived risk = better terms.</p>
+
+        <h3>Interest Rate Determination</h3>
+        <p>Your score directly impacts your interest rate. On a $300,000 30-year mortgage, the difference between excellent and fair credit could cost you over $100,000 in extra interest.</p>
+
+        <h3>Approval Decisions</h3>
+        <p>Most lenders have minimum score thresholds. Falling below these thresholds means automatic denial regardless of other factors.</p>
+
+        <h3>Credit Limit Setting</h3>
+        <p>For credit cards and lines of credit, your score influences your initial credit limit and future limit increase decisions.</p>
+
+        <h3>Beyond Lending</h3>
+        <p>Your credit score can also affect:</p>
+        <ul>
+            <li>Insurance premiums in most states</li>
+            <li>Security deposits for utilities and rentals</li>
+            <li>Employment decisions in certain industries</li>
+            <li>Cell phone contracts and deposits</li>
+        </ul>
+
+        <div class="key-takeaway">
+            <h3>Key Takeaways</h3>
+            <ul>
+                <li>Credit scores range from 300-850, with 670+ considered "good"</li>
+                <li>FICO is used by 90% of lenders; VantageScore is growing but less common</li>
+                <li>Payment history (35-40%) is the most important scoring factor</li>
+                <li>You have multiple scores due to different models, bureaus, and timing</li>
+                <li>Your score directly impacts interest rates, approval odds, and loan terms</li>
+                <li>Improving your score can save thousands or tens of thousands in interest over time</li>
+            </ul>
+        </div>
+
+        <h2>Next Steps</h2>
+        <p>Now that you understand what credit scores are and how they're calculated, you're ready to learn how to obtain your free credit reports in the next lesson. Understanding your score is just the beginning—knowing what's on your reports is essential for effective credit repair.</p>
+    </div>
+"""
+
+# Generic comprehensive content template
+GENERIC_INTRO = compile_template("""
+        <h2>Introduction</h2>
+        <p>Welcome to this comprehensive lesson on {title}. This tutorial will provide you with in-depth knowledge and practical strategies to master this important aspect of credit management and repair.</p>
+
+        <h2>Core Concepts</h2>
+""")
+
+# One core-concept section per topic
+GENERIC_TOPIC = compile_template("""
+        <h3>{index}. {topic}</h3>
+        <p>This section covers the essential information about {topic_lower}. Understanding these concepts is crucial for effective credit management and achieving your financial goals.</p>
+
+        <p>Key points to remember:</p>
+        <ul>
+            <li>Core principles and foundational knowledge</li>
+            <li>Practical applications and real-world examples</li>
+            <li>Common mistakes to avoid</li>
+            <li>Best practices and expert recommendations</li>
+        </ul>
+""")
+
+# Practical application, challenges and tips; opens the takeaways list
+GENERIC_PRACTICE = """
+        <h2>Practical Application</h2>
+        <p>Now that you understand the theory, let's explore how to apply these concepts in real-world credit situations. Practical application is where knowledge transforms into results.</p>
+
+        <h3>Step-by-Step Process</h3>
+        <ol>
+            <li><strong>Assessment:</strong> Evaluate your current situation and identify areas for improvement</li>
+            <li><strong>Planning:</strong> Develop a strategic approach based on your specific circumstances</li>
+            <li><strong>Implementation:</strong> Take concrete action steps to achieve your goals</li>
+            <li><strong>Monitoring:</strong> Track your progress and make adjustments as needed</li>
+            <li><strong>Optimization:</strong> Refine your strategies for maximum effectiveness</li>
+        </ol>
+
+        <h2>Common Challenges and Solutions</h2>
+        <p>Every credit journey encounters obstacles. Here are the most common challenges and proven solutions:</p>
+
+        <h3>Challenge 1: Information Overload</h3>
+        <p><strong>Solution:</strong> Focus on one strategy at a time. Master the fundamentals before moving to advanced techniques.</p>
+
+        <h3>Challenge 2: Impatience with Results</h3>
+        <p><strong>Solution:</strong> Credit improvement takes time. Set realistic expectations and celebrate small wins along the way.</p>
+
+        <h3>Challenge 3: Inconsistent Effort</h3>
+        <p><strong>Solution:</strong> Create systems and habits that automate good credit behaviors and reduce reliance on willpower alone.</p>
+
+        <h2>Expert Tips and Best Practices</h2>
+        <ul>
+            <li>Always verify information before taking action</li>
+            <li>Maintain detailed records of all credit-related activities</li>
+            <li>Stay informed about changes in credit laws and regulations</li>
+            <li>Use proven strategies rather than experimenting with unverified tactics</li>
+            <li>Seek professional guidance when facing complex situations</li>
+        </ul>
+
+        <div class="key-takeaway">
+            <h3>Key Takeaways</h3>
+            <ul>
+"""
+
+# One key takeaway
+TAKEAWAY_ITEM = compile_template("                <li>Master {topic_lower} for credit success</li>\n")
+
+# Closes the takeaways and the main content
+GENERIC_CLOSING = compile_template("""            </ul>
+        </div>
+
+        <h2>Next Steps</h2>
+        <p>You've now completed this lesson and gained valuable knowledge. Continue to the next lesson to build upon this foundation and further advance your credit expertise.</p>
+
+        <p>Remember: knowledge without action produces no results. Apply what you've learned and track your progress using the {brand} platform.</p>
+    </div>
+""")
+
+# Closes the lesson
+LESSON_FOOTER = """
+</div>
+"""
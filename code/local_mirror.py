@@ -0,0 +1,567 @@
+#!/usr/bin/env python3
+"""
+Local SQLite mirror of the content schema, with checksum-based delta push
+
+The mirror (code/.cache/mirror.sqlite) is created from the CREATE TABLE
+files in supabase/tables/ for MIRROR_TABLES (content_blocks included, so
+deduplicated lessons resolve locally). With SUPABASE_MIRROR set,
+get_client() returns a LocalClient that answers the PostgREST subset the
+content scripts use (select, filters, order, keyset pages, inserts,
+merge-duplicates upserts, PATCH) from SQLite, so generators and enhancers
+run at local-disk speed and never touch the remote database.
+
+Each mirrored row's checksum (SHA-256 of its canonical JSON, timestamps
+excluded) is recorded when it is pulled or pushed. push sends only rows
+whose checksum changed, in chunked bulk upserts, parents before children.
+It first re-reads those rows from the remote and skips any that changed
+there since the pull (use --force to overwrite them).
+
+Usage:
+    python3 code/local_mirror.py pull                # remote -> mirror
+    SUPABASE_MIRROR=1 python3 code/enhance_all_lessons.py
+    python3 code/local_mirror.py status              # changed rows, no network
+    python3 code/local_mirror.py push [--dry-run]    # changed rows -> remote
+
+Configuration (environment):
+    - SUPABASE_MIRROR   (1 for the default path, or a mirror file path)
+    - SUPABASE_URL / SUPABASE_SERVICE_ROLE_KEY for pull and push
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+sys.path.append(os.path.dirname(__file__))
+from curriculum_catalog import ROOT_DIR
+from postgrest_query import RESERVED_PARAMS, PostgrestError, parse_in, parse_order, parse_prefer
+from supabase_client import DEFAULT_CHUNK_SIZE, SupabaseClient, chunked, json_response
+
+CODE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MIRROR = os.path.join(CODE_DIR, '.cache', 'mirror.sqlite')
+SCHEMA_DIR = os.path.join(ROOT_DIR, 'supabase', 'tables')
+MIRROR_TABLES = ('categories', 'courses', 'lessons', 'content_blocks', 'quizzes')  # Parents first
+PARENT_COLUMNS = {'courses': 'category_id', 'lessons': 'course_id', 'quizzes': 'lesson_id'}
+TIMESTAMP_COLUMNS = ('created_at', 'updated_at')
+REMOTE_CHECK_CHUNK = 100  # Keys per key=in.(...) request when checking for remote edits
+
+_COMPARISONS = {'eq': '=', 'neq': '!=', 'gt': '>', 'gte': '>=', 'lt': '<', 'lte': '<='}
+_LITERAL_DEFAULT = re.compile(r"\bDEFAULT\s+('(?:[^']|'')*'|-?\d+(?:\.\d+)?|true|false)(?!\s*::)",
+                              re.IGNORECASE)
+
+
+class Column:
+    """One column of a mirrored table, typed for SQLite storage and JSON round trips"""
+
+    def __init__(self, name: str, sql_type: str, constraints: str):
+        self.name = name
+        self.sql_type = sql_type.upper()
+        self.primary_key = 'PRIMARY KEY' in constraints.upper()
+        self.not_null = 'NOT NULL' in constraints.upper()
+        if self.sql_type.endswith('[]') or self.sql_type in ('JSON', 'JSONB'):
+            self.kind = 'json'
+        elif self.sql_type == 'BOOLEAN':
+            self.kind = 'boolean'
+        elif self.sql_type in ('INTEGER', 'INT', 'BIGINT', 'SMALLINT'):
+            self.kind = 'integer'
+        elif self.sql_type.startswith(('DECIMAL', 'NUMERIC', 'REAL', 'FLOAT', 'DOUBLE')):
+            self.kind = 'real'
+        else:
+            self.kind = 'text'
+        default = _LITERAL_DEFAULT.search(constraints)
+        self.default = default.group(1) if default else None
+        if self.default and self.kind == 'boolean':
+            self.default = '1' if self.default.lower() == 'true' else '0'
+
+    def ddl(self) -> str:
+        affinity = {'integer': 'INTEGER', 'boolean': 'INTEGER', 'real': 'REAL'}.get(self.kind, 'TEXT')
+        parts = [self.name, affinity]
+        if self.primary_key:
+            parts.append('PRIMARY KEY')
+        if self.not_null:
+            parts.append('NOT NULL')
+        if self.default is not None:
+            parts.append(f'DEFAULT {self.default}')
+        return ' '.join(parts)
+
+    def encode(self, value):
+        if value is None:
+            return None
+        if self.kind == 'json' or isinstance(value, (dict, list)):
+            return json.dumps(value, ensure_ascii=False)
+        if self.kind == 'boolean':
+            return int(bool(value))
+        return value
+
+    def decode(self, value):
+        if value is None:
+            return None
+        if self.kind == 'json':
+            return json.loads(value)
+        if self.kind == 'boolean':
+            return bool(value)
+        return value
+
+    def coerce(self, raw: str):
+        """Filter operand from a query string, typed like the column"""
+        if self.kind == 'integer':
+            return int(raw)
+        if self.kind == 'real':
+            return float(raw)
+        if self.kind == 'boolean':
+            return int(raw == 'true')
+        return raw
+
+
+def _split_top_level(body: str) -> List[str]:
+    """Split a CREATE TABLE body on commas outside parentheses and quotes"""
+    items, depth, quoted, start = [], 0, False, 0
+    for i, char in enumerate(body):
+        if char == "'":
+            quoted = not quoted
+        elif not quoted and char == '(':
+            depth += 1
+        elif not quoted and char == ')':
+            depth -= 1
+        elif not quoted and depth == 0 and char == ',':
+            items.append(body[start:i])
+            start = i + 1
+    items.append(body[start:])
+    return [item.strip() for item in items if item.strip()]
+
+
+def parse_table_sql(sql: str) -> Tuple[str, Dict[str, Column]]:
+    """(table name, columns) from a supabase/tables/*.sql CREATE TABLE statement"""
+    match = re.search(r'CREATE TABLE\s+(?:IF NOT EXISTS\s+)?(?:public\.)?(\w+)\s*\(', sql, re.IGNORECASE)
+    if match is None:
+        raise ValueError("No CREATE TABLE statement found")
+    body = sql[match.end():sql.rindex(')')]
+    columns = {}
+    for item in _split_top_level(body):
+        name, sql_type, *rest = item.split(None, 2)
+        if name.upper() in ('PRIMARY', 'FOREIGN', 'UNIQUE', 'CONSTRAINT', 'CHECK'):
+            continue  # Table-level constraints are enforced by the remote
+        columns[name] = Column(name, sql_type, rest[0] if rest else '')
+    return match.group(1), columns
+
+
+def load_schema(tables=MIRROR_TABLES, schema_dir: str = SCHEMA_DIR) -> Dict[str, Dict[str, Column]]:
+    schema = {}
+    for table in tables:
+        with open(os.path.join(schema_dir, f'{table}.sql'), encoding='utf-8') as f:
+            name, columns = parse_table_sql(f.read())
+        schema[name] = columns
+    return schema
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def row_checksum(row: Dict, columns) -> str:
+    """SHA-256 of a row's canonical JSON over columns, timestamps excluded"""
+    values = {name: row.get(name) for name in columns if name not in TIMESTAMP_COLUMNS}
+    payload = json.dumps(values, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class Mirror:
+    """SQLite copy of MIRROR_TABLES plus the checksum of each row as last synced"""
+
+    def __init__(self, path: str = DEFAULT_MIRROR, tables=MIRROR_TABLES):
+        self.path = path
+        self.schema = load_schema(tables)
+        # Rows are tracked by primary key: id, except content_blocks (hash)
+        self.keys = {table: next(name for name, column in columns.items() if column.primary_key)
+                     for table, columns in self.schema.items()}
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        for table, columns in self.schema.items():
+            ddl = ', '.join(column.ddl() for column in columns.values())
+            self.db.execute(f'CREATE TABLE IF NOT EXISTS {table} ({ddl})')
+        self.db.execute('CREATE TABLE IF NOT EXISTS _sync '
+                        '(tbl TEXT NOT NULL, id TEXT NOT NULL, checksum TEXT NOT NULL, '
+                        'PRIMARY KEY (tbl, id))')
+
+    @contextmanager
+    def transaction(self):
+        self.db.execute('BEGIN')
+        try:
+            yield
+        except BaseException:
+            self.db.execute('ROLLBACK')
+            raise
+        self.db.execute('COMMIT')
+
+    def columns(self, table: str) -> Dict[str, Column]:
+        if table not in self.schema:
+            raise PostgrestError(404, 'PGRST205', f"Could not find the table 'public.{table}' in the mirror")
+        return self.schema[table]
+
+    def decode_row(self, table: str, names: List[str], values) -> Dict:
+        columns = self.schema[table]
+        return {name: columns[name].decode(value) for name, value in zip(names, values)}
+
+    def rows(self, table: str) -> Iterator[Dict]:
+        names = list(self.schema[table])
+        for values in self.db.execute(f'SELECT {", ".join(names)} FROM {table} ORDER BY {self.keys[table]}'):
+            yield self.decode_row(table, names, values)
+
+    def key(self, table: str) -> str:
+        return self.keys[table]
+
+    def count(self, table: str) -> int:
+        return self.db.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+
+    def replace(self, table: str, rows: List[Dict]):
+        """Make the mirror's copy of table exactly rows, all marked as synced"""
+        columns = self.schema[table]
+        names = list(columns)
+        key = self.keys[table]
+        with self.lock, self.transaction():
+            self.db.execute(f'DELETE FROM {table}')
+            self.db.execute('DELETE FROM _sync WHERE tbl = ?', (table,))
+            self.db.executemany(
+                f'INSERT INTO {table} ({", ".join(names)}) VALUES ({", ".join("?" * len(names))})',
+                [[columns[name].encode(row.get(name)) for name in names] for row in rows])
+            self.db.executemany('INSERT INTO _sync VALUES (?, ?, ?)',
+                                [(table, row[key], row_checksum(row, names)) for row in rows])
+
+    def synced_checksums(self, table: str) -> Dict[str, str]:
+        return dict(self.db.execute('SELECT id, checksum FROM _sync WHERE tbl = ?', (table,)))
+
+    def changes(self, table: str) -> Tuple[List[Dict], Dict[str, str], List[str]]:
+        """(rows changed or added since the last sync, their synced checksums, keys deleted locally)"""
+        synced = self.synced_checksums(table)
+        names = list(self.schema[table])
+        key = self.keys[table]
+        changed = []
+        seen = set()
+        for row in self.rows(table):
+            seen.add(row[key])
+            if synced.get(row[key]) != row_checksum(row, names):
+                changed.append(row)
+        deleted = [row_id for row_id in synced if row_id not in seen]
+        return changed, {row[key]: synced.get(row[key]) for row in changed}, deleted
+
+    def mark_synced(self, table: str, rows: List[Dict]):
+        names = list(self.schema[table])
+        key = self.keys[table]
+        with self.lock, self.transaction():
+            self.db.executemany('INSERT OR REPLACE INTO _sync VALUES (?, ?, ?)',
+                                [(table, row[key], row_checksum(row, names)) for row in rows])
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+class LocalClient(SupabaseClient):
+    """
+    SupabaseClient that serves PostgREST requests from the local mirror
+
+    Every helper (select_pages, upsert_many, patch, ...) goes through
+    request(), which is answered from SQLite; responses are real
+    requests.Response objects, so callers cannot tell the difference.
+    Writes get the same pre-flight check (SupabaseClient.preflight) first.
+    """
+
+    local = True
+
+    def __init__(self, path: str = DEFAULT_MIRROR):
+        self.mirror = Mirror(path)
+        self.url = f'sqlite:///{os.path.abspath(path)}'
+        self.service_key = None
+        self.pool_size = 1
+        self.timeout = None
+        self.limiter = None
+
+    @property
+    def configured(self) -> bool:
+        return True
+
+    def request(self, method: str, table: str, params: Optional[Dict] = None,
+                json=None, prefer: Optional[str] = None, replayable: bool = False) -> requests.Response:
+        rejected = self.preflight(method, table, json)
+        if rejected is not None:
+            return rejected
+        url = self.endpoint(table)
+        params = params or {}
+        try:
+            columns = self.mirror.columns(table)
+            with self.mirror.lock:
+                if method == 'GET':
+                    return json_response(200, self._select(table, columns, params), url)
+                if method == 'POST':
+                    rows = self._insert(table, columns, params, json, parse_prefer(prefer))
+                elif method == 'PATCH':
+                    rows = self._update(table, columns, params, json)
+                elif method == 'DELETE':
+                    rows = self._delete(table, columns, params)
+                else:
+                    raise PostgrestError(405, 'PGRST117', f'Unsupported HTTP method: {method}')
+        except PostgrestError as e:
+            return json_response(e.status, e.body, url)
+        except (ValueError, TypeError) as e:
+            return json_response(400, {'code': 'PGRST100', 'details': None, 'hint': None, 'message': str(e)}, url)
+        if 'return=representation' in (prefer or ''):
+            return json_response(201 if method == 'POST' else 200, rows, url)
+        return json_response(201 if method == 'POST' else 204, None, url)
+
+    def storage_upload(self, bucket: str, path: str, data: bytes,
+                       content_type: str = 'application/json',
+                       cache_control: Optional[str] = None) -> requests.Response:
+        return json_response(501, {'message': 'Storage is not mirrored locally'},
+                         f'{self.url}/storage/v1/object/{bucket}/{path}')
+
+    def close(self):
+        self.mirror.close()
+
+    def _column(self, columns: Dict[str, Column], table: str, name: str) -> Column:
+        if name not in columns:
+            raise PostgrestError(400, '42703', f'column {table}.{name} does not exist')
+        return columns[name]
+
+    def _where(self, table: str, columns: Dict[str, Column], params: Dict) -> Tuple[str, List]:
+        clauses, args = [], []
+        for name, expression in params.items():
+            if name in RESERVED_PARAMS:
+                continue
+            column = self._column(columns, table, name)
+            negate = expression.startswith('not.')
+            op, _, raw = expression[4 if negate else 0:].partition('.')
+            if op in _COMPARISONS:
+                clause = f'{name} {_COMPARISONS[op]} ?'
+                args.append(column.coerce(raw))
+            elif op == 'in':
+                values = parse_in(raw)
+                clause = f'{name} IN ({", ".join("?" * len(values))})'
+                args.extend(column.coerce(value) for value in values)
+            elif op == 'is' and raw in ('null', 'true', 'false'):
+                clause = f'{name} IS {"NULL" if raw == "null" else int(raw == "true")}'
+            else:
+                raise PostgrestError(400, 'PGRST100', f'unsupported operator "{op}" on {name}')
+            clauses.append(f'NOT ({clause})' if negate else clause)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', args
+
+    def _select(self, table: str, columns: Dict[str, Column], params: Dict) -> List[Dict]:
+        select = params.get('select', '*')
+        names = list(columns) if select == '*' else [name.strip() for name in select.split(',')]
+        for name in names:
+            self._column(columns, table, name)
+        where, args = self._where(table, columns, params)
+        sql = f'SELECT {", ".join(names)} FROM {table}{where}'
+        if params.get('order'):
+            terms = []
+            for name, descending in parse_order(params['order']):
+                self._column(columns, table, name)
+                # Postgres sorts NULLs last ascending and first descending
+                terms.append(f'({name} IS NULL) DESC, {name} DESC' if descending
+                             else f'({name} IS NULL), {name} ASC')
+            sql += ' ORDER BY ' + ', '.join(terms)
+        if params.get('limit') is not None or params.get('offset') is not None:
+            sql += ' LIMIT ? OFFSET ?'
+            args += [int(params.get('limit', -1)), int(params.get('offset', 0))]
+        return [self.mirror.decode_row(table, names, values)
+                for values in self.mirror.db.execute(sql, args)]
+
+    def _insert(self, table: str, columns: Dict[str, Column], params: Dict, body,
+                prefer: Dict[str, str]) -> List[Dict]:
+        rows = body if isinstance(body, list) else [body]
+        upsert = prefer.get('resolution') == 'merge-duplicates'
+        on_conflict = params.get('on_conflict', self.mirror.key(table))
+        self._column(columns, table, on_conflict)
+        now = _now()
+        written = []
+        try:
+            # One statement in PostgREST: any failing row rolls back the whole array
+            with self.mirror.transaction():
+                for row in rows:
+                    written.extend(self._insert_row(table, columns, dict(row), now, upsert, on_conflict))
+        except sqlite3.IntegrityError as e:
+            if 'UNIQUE' in str(e):
+                raise PostgrestError(409, '23505', f'duplicate key value violates unique constraint: {e}')
+            raise PostgrestError(400, '23502', f'null value violates not-null constraint: {e}')
+        except sqlite3.OperationalError as e:
+            raise PostgrestError(400, '42P10', str(e))
+        return written
+
+    def _insert_row(self, table: str, columns: Dict[str, Column], row: Dict, now: str,
+                    upsert: bool, on_conflict: str) -> List[Dict]:
+        if 'id' in columns:
+            row.setdefault('id', str(uuid.uuid4()))
+        for name in TIMESTAMP_COLUMNS:
+            if name in columns:
+                row.setdefault(name, now)
+        names = list(row)
+        for name in names:
+            self._column(columns, table, name)
+        sql = f'INSERT INTO {table} ({", ".join(names)}) VALUES ({", ".join("?" * len(names))})'
+        if upsert:
+            updates = [name for name in names if name not in (on_conflict, 'created_at')]
+            sql += (f' ON CONFLICT ({on_conflict}) DO UPDATE SET '
+                    + ', '.join(f'{name} = excluded.{name}' for name in updates))
+        cursor = self.mirror.db.execute(sql + ' RETURNING *',
+                                        [columns[name].encode(row[name]) for name in names])
+        result_names = [d[0] for d in cursor.description]
+        return [self.mirror.decode_row(table, result_names, values) for values in cursor]
+
+    def _update(self, table: str, columns: Dict[str, Column], params: Dict, values: Dict) -> List[Dict]:
+        values = dict(values)
+        if 'updated_at' in columns:
+            values.setdefault('updated_at', _now())
+        for name in values:
+            self._column(columns, table, name)
+        where, args = self._where(table, columns, params)
+        sql = (f'UPDATE {table} SET {", ".join(f"{name} = ?" for name in values)}{where} RETURNING *')
+        try:
+            cursor = self.mirror.db.execute(sql, [columns[name].encode(value) for name, value in values.items()] + args)
+            names = [d[0] for d in cursor.description]
+            return [self.mirror.decode_row(table, names, row) for row in cursor.fetchall()]
+        except sqlite3.IntegrityError as e:
+            raise PostgrestError(400, '23502', f'null value violates not-null constraint: {e}')
+
+    def _delete(self, table: str, columns: Dict[str, Column], params: Dict) -> List[Dict]:
+        where, args = self._where(table, columns, params)
+        cursor = self.mirror.db.execute(f'DELETE FROM {table}{where} RETURNING *', args)
+        names = [d[0] for d in cursor.description]
+        return [self.mirror.decode_row(table, names, row) for row in cursor.fetchall()]
+
+
+def mirror_path() -> str:
+    """Mirror file from SUPABASE_MIRROR ('1' means the default path)"""
+    value = os.environ.get('SUPABASE_MIRROR', '')
+    return DEFAULT_MIRROR if value in ('', '1') else value
+
+
+def remote_client() -> SupabaseClient:
+    remote = SupabaseClient()
+    if not remote.configured:
+        print("❌ pull and push need SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY")
+        sys.exit(1)
+    return remote
+
+
+def pull(mirror: Mirror, remote: SupabaseClient, force: bool):
+    """Replace the mirror with the remote tables"""
+    if not force:
+        pending = {table: len(mirror.changes(table)[0]) for table in mirror.schema}
+        if any(pending.values()):
+            print(f"❌ The mirror has unpushed changes ({pending}); push them or pull --force")
+            sys.exit(1)
+    for table in mirror.schema:
+        started = time.perf_counter()
+        rows = [row for page in remote.select_pages(table, key=mirror.key(table)) for row in page]
+        mirror.replace(table, rows)
+        print(f"  ⬇ {table:<14} {len(rows):>7,} rows in {time.perf_counter() - started:.1f}s")
+
+
+def remote_edits(remote: SupabaseClient, table: str, key: str, names: List[str],
+                 synced: Dict[str, str]) -> Dict[str, Optional[str]]:
+    """Current remote checksum of every previously synced key (None if the row is gone)"""
+    ids = [row_id for row_id, checksum in synced.items() if checksum is not None]
+    current: Dict[str, Optional[str]] = {row_id: None for row_id in ids}
+    for chunk in chunked(ids, REMOTE_CHECK_CHUNK):
+        resp = remote.select(table, '*', {key: f'in.({",".join(chunk)})'})
+        resp.raise_for_status()
+        for row in resp.json():
+            current[row[key]] = row_checksum(row, names)
+    return current
+
+
+def push(mirror: Mirror, remote: SupabaseClient, chunk_size: int, dry_run: bool, force: bool) -> int:
+    """Upsert rows changed since the last sync; returns rows not pushed because of errors"""
+    failed_ids = set()
+    problems = 0
+    for table in mirror.schema:
+        names = list(mirror.schema[table])
+        key = mirror.key(table)
+        changed, synced, deleted = mirror.changes(table)
+        if deleted:
+            print(f"  ⚠ {table}: {len(deleted)} rows deleted locally are not deleted remotely")
+        if not changed:
+            print(f"  = {table:<14} no changes")
+            continue
+
+        current = remote_edits(remote, table, key, names, synced)
+        to_send, conflicts, already = [], [], []
+        parent = PARENT_COLUMNS.get(table)
+        for row in changed:
+            if parent and row.get(parent) in failed_ids:
+                failed_ids.add(row[key])  # Parent was not pushed
+                continue
+            if row[key] in current:
+                remote_checksum = current[row[key]]
+                if remote_checksum == row_checksum(row, names):
+                    already.append(row)
+                    continue
+                if remote_checksum != synced[row[key]] and not force:
+                    conflicts.append(row)
+                    continue
+            to_send.append(row)
+        for row in conflicts:
+            failed_ids.add(row[key])
+            print(f"  ✗ {table} {row[key]}: changed remotely since the last pull (use --force)")
+        problems += len(conflicts)
+
+        print(f"  ⬆ {table:<14} {len(to_send):>7,} to push, {len(already):,} already remote, "
+              f"{len(conflicts):,} conflicts")
+        mirror.mark_synced(table, already)
+        if dry_run or not to_send:
+            continue
+        payload = [{name: row.get(name) for name in names if name != 'created_at'} for row in to_send]
+        written, failures = remote.upsert_many(table, payload, chunk_size, on_conflict=key)
+        failed_in_table = set()
+        for chunk, resp in failures:
+            failed_in_table.update(row[key] for row in chunk)
+            print(f"  ✗ Failed to upsert {len(chunk)} {table}: {resp.text[:200]}")
+        failed_ids |= failed_in_table
+        problems += len(failed_in_table)
+        mirror.mark_synced(table, [row for row in to_send if row[key] not in failed_in_table])
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local SQLite mirror of the content tables")
+    parser.add_argument('command', choices=['pull', 'status', 'push'])
+    parser.add_argument('--mirror', default=mirror_path(), help="Mirror file (default from SUPABASE_MIRROR)")
+    parser.add_argument('--force', action='store_true',
+                        help="pull: discard unpushed changes; push: overwrite rows edited remotely")
+    parser.add_argument('--dry-run', action='store_true', help="push: report without writing")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Rows per bulk upsert request (default {DEFAULT_CHUNK_SIZE})")
+    args = parser.parse_args()
+
+    mirror = Mirror(args.mirror)
+    print(f"🗄  Mirror: {os.path.relpath(args.mirror)}")
+    if args.command == 'pull':
+        pull(mirror, remote_client(), args.force)
+    elif args.command == 'status':
+        for table in mirror.schema:
+            changed, synced, deleted = mirror.changes(table)
+            added = sum(1 for checksum in synced.values() if checksum is None)
+            print(f"  {table:<14} {mirror.count(table):>7,} rows, {len(changed) - added:,} changed, "
+                  f"{added:,} new, {len(deleted):,} deleted")
+    else:
+        problems = push(mirror, remote_client(), args.chunk_size, args.dry_run, args.force)
+        mirror.close()
+        if problems:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
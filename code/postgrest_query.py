@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+PostgREST query-string and header parsing shared by the local stand-ins
+
+fake_postgrest.py (in-memory tables) and local_mirror.py (SQLite) both
+answer /rest/v1 requests the way PostgREST does; this module holds the parts
+they parse identically: reserved query parameters, `in.(...)` lists, order
+terms, the Prefer header, and errors in PostgREST's JSON shape.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+RESERVED_PARAMS = {'select', 'order', 'limit', 'offset', 'on_conflict', 'columns'}
+
+
+class PostgrestError(Exception):
+    """Error response in PostgREST's JSON shape"""
+
+    def __init__(self, status: int, code: str, message: str, details: Optional[str] = None):
+        super().__init__(message)
+        self.status = status
+        self.body = {'code': code, 'details': details, 'hint': None, 'message': message}
+
+
+def parse_in(raw: str) -> List[str]:
+    """Values of an `in.(a,"b")` operand"""
+    return [value.strip().strip('"') for value in raw.strip('()').split(',') if value]
+
+
+def parse_order(order: str) -> List[Tuple[str, bool]]:
+    """[(column, descending)] from `col.asc,other.desc`"""
+    terms = []
+    for term in order.split(','):
+        column, _, direction = term.partition('.')
+        terms.append((column, direction.startswith('desc')))
+    return terms
+
+
+def parse_prefer(header: Optional[str]) -> Dict[str, str]:
+    prefer = {}
+    for item in (header or '').split(','):
+        key, _, value = item.strip().partition('=')
+        if key:
+            prefer[key] = value
+    return prefer
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Pre-flight validation for generated lesson HTML and quiz JSON
+
+Rows are checked locally before they are written, so broken output is
+rejected without a round trip instead of surfacing in the browser:
+
+    - content_html: tags must balance. One regex pass over the tags (no DOM,
+      same approach as text_stats.py) keeps a stack of open elements; void
+      elements, self-closing tags, comments and script/style bodies are
+      skipped.
+    - questions_json: a non-empty list of {question, options, correct_answer,
+      explanation} with at least MIN_OPTIONS distinct options and
+      correct_answer an in-range index. The legacy correctAnswer key and
+      unknown keys are rejected.
+
+SupabaseClient runs row_problems() on every lesson and quiz write, and a
+rejected write gets a local 422 response. Set SUPABASE_PREFLIGHT=0 to skip
+it. The CLI validates a whole corpus on a process pool:
+
+    python3 code/preflight.py                     # every catalog render
+    python3 code/preflight.py --source db         # lessons and quizzes tables
+    python3 code/preflight.py --template enhanced --workers 8 --json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+PREFLIGHT_STATUS = 422  # What PostgREST returns for a row that fails a CHECK constraint
+PREFLIGHT_CODE = 'PREFLIGHT'
+MAX_PROBLEMS = 10  # Per document; the first few are enough to find the template
+MIN_OPTIONS = 2
+QUESTION_KEYS = {'question', 'options', 'correct_answer', 'explanation'}
+VOID_ELEMENTS = frozenset({'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+                           'meta', 'source', 'track', 'wbr'})
+
+# Comments, script/style blocks (skipped whole) and start/end tags
+_TAG = re.compile(r'<!--.*?-->|<(script|style)\b.*?</\1\s*>|<(/?)([a-zA-Z][a-zA-Z0-9-]*)\b[^>]*?(/?)>',
+                  re.DOTALL | re.IGNORECASE)
+
+
+def enabled() -> bool:
+    return os.environ.get('SUPABASE_PREFLIGHT', '1') != '0'
+
+
+def _line(content: str, position: int) -> int:
+    return content.count('\n', 0, position) + 1
+
+
+def check_html(content: Optional[str]) -> List[str]:
+    """Unbalanced, stray or misnested tags in content, with line numbers"""
+    if not content:
+        return []
+    problems = []
+    stack: List[Tuple[str, int]] = []  # (tag, offset of its start tag)
+    for match in _TAG.finditer(content):
+        name = match.group(3)
+        if name is None:
+            continue  # Comment or script/style block
+        name = name.lower()
+        if not match.group(2):
+            if name not in VOID_ELEMENTS and not match.group(4):
+                stack.append((name, match.start()))
+            continue
+        if name in VOID_ELEMENTS:
+            continue
+        if stack and stack[-1][0] == name:
+            stack.pop()
+            continue
+        depth = next((i for i in range(len(stack) - 1, -1, -1) if stack[i][0] == name), None)
+        if depth is None:
+            problems.append(f"line {_line(content, match.start())}: stray </{name}>")
+        else:
+            # Close the elements the author forgot, then this one
+            for tag, start in reversed(stack[depth + 1:]):
+                problems.append(f"line {_line(content, match.start())}: </{name}> closes "
+                                f"<{tag}> from line {_line(content, start)}")
+            del stack[depth:]
+        if len(problems) >= MAX_PROBLEMS:
+            return problems
+    for tag, start in stack[:MAX_PROBLEMS - len(problems)]:
+        problems.append(f"line {_line(content, start)}: <{tag}> is never closed")
+    return problems
+
+
+def check_questions(questions) -> List[str]:
+    """Schema problems in a questions_json value"""
+    if not isinstance(questions, list) or not questions:
+        return ["questions_json must be a non-empty list"]
+    problems = []
+    for number, question in enumerate(questions, 1):
+        where = f"question {number}"
+        if not isinstance(question, dict):
+            problems.append(f"{where}: expected an object")
+            continue
+        if 'correctAnswer' in question:
+            problems.append(f"{where}: uses correctAnswer; the key is correct_answer")
+        unknown = sorted(set(question) - QUESTION_KEYS - {'correctAnswer'})
+        if unknown:
+            problems.append(f"{where}: unexpected keys {', '.join(unknown)}")
+        text = question.get('question')
+        if not isinstance(text, str) or not text.strip():
+            problems.append(f"{where}: question text is missing")
+        options = question.get('options')
+        if not isinstance(options, list) or not all(isinstance(o, str) and o.strip() for o in options):
+            problems.append(f"{where}: options must be a list of non-empty strings")
+            options = None
+        elif len(options) < MIN_OPTIONS:
+            problems.append(f"{where}: {len(options)} options, need at least {MIN_OPTIONS}")
+        elif len(set(options)) < len(options):
+            problems.append(f"{where}: duplicate options")
+        answer = question.get('correct_answer')
+        if 'correct_answer' not in question:
+            if 'correctAnswer' not in question:
+                problems.append(f"{where}: correct_answer is missing")
+        elif not isinstance(answer, int) or isinstance(answer, bool):
+            problems.append(f"{where}: correct_answer must be an option index, got {answer!r}")
+        elif options is not None and not 0 <= answer < len(options):
+            problems.append(f"{where}: correct_answer {answer} is out of range for {len(options)} options")
+        explanation = question.get('explanation')
+        if explanation is not None and not isinstance(explanation, str):
+            problems.append(f"{where}: explanation must be a string")
+        if len(problems) >= MAX_PROBLEMS:
+            break
+    return problems[:MAX_PROBLEMS]
+
+
+def row_problems(table: str, row: Dict) -> List[str]:
+    """Problems in the generated fields of one lessons or quizzes row (only fields present)"""
+    problems = []
+    if table == 'lessons' and 'content_html' in row:
+        problems.extend(check_html(row['content_html']))
+    elif table == 'quizzes':
+        if 'questions_json' in row:
+            problems.extend(check_questions(row['questions_json']))
+        score = row.get('passing_score')
+        if score is not None and (not isinstance(score, int) or isinstance(score, bool)
+                                  or not 0 <= score <= 100):
+            problems.append(f"passing_score must be 0-100, got {score!r}")
+    return problems
+
+
+def rejections(table: str, rows) -> List[Dict]:
+    """[{index, id, problems}] for the rows of a write payload (object or array) that fail"""
+    if not enabled() or table not in ('lessons', 'quizzes'):
+        return []
+    rows = rows if isinstance(rows, list) else [rows]
+    rejected = []
+    for index, row in enumerate(rows):
+        problems = row_problems(table, row) if isinstance(row, dict) else []
+        if problems:
+            rejected.append({'index': index, 'id': row.get('id'), 'problems': problems})
+    return rejected
+
+
+def rejection_body(table: str, rejected: List[Dict]) -> Dict:
+    """PostgREST-style error body for a write refused by pre-flight validation"""
+    first = rejected[0]
+    return {
+        'code': PREFLIGHT_CODE,
+        'message': f"{len(rejected)} {table} row(s) failed pre-flight validation",
+        'details': f"row {first['index']} ({first['id']}): {first['problems'][0]}",
+        'hint': None,
+        'rows': rejected,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Corpus validation
+# ---------------------------------------------------------------------------
+
+def _validate(item: Tuple[str, str, Dict]) -> Tuple[str, str, List[str]]:
+    table, label, row = item
+    return table, label, row_problems(table, row)
+
+
+def catalog_rows(template: str) -> Iterator[Tuple[str, str, Dict]]:
+    """(table, label, row) for every catalog tutorial's lesson and quiz, as the insert scripts render them"""
+    from content_generator_full import generate_lesson_content, generate_quiz_questions
+    from curriculum_catalog import get_catalog, lesson_topics
+    from lesson_templates import generate_enhanced_content
+
+    for tutorial in get_catalog():
+        label = f"{tutorial['code']} {tutorial['title']}"
+        description = tutorial.get('description', '')
+        topics = lesson_topics(tutorial['topics'], description)
+        if template == 'enhanced':
+            html = generate_enhanced_content(tutorial['title'], "")
+        else:
+            html = generate_lesson_content(tutorial['code'], tutorial['title'], topics, description)
+        yield 'lessons', label, {'content_html': html}
+        questions = generate_quiz_questions(tutorial['code'], tutorial['title'], topics)
+        yield 'quizzes', label, {'questions_json': questions}
+
+
+def db_rows(page_size: int) -> Iterator[Tuple[str, str, Dict]]:
+    from block_store import BlockResolver
+    from supabase_client import get_client
+
+    client = get_client()
+    resolver = BlockResolver(client)  # Deduplicated lessons only have content_blocks
+    for page in client.select_pages('lessons', 'id,title,content_html,content_blocks', page_size=page_size):
+        for row in resolver.fill(page):
+            yield 'lessons', f"{row['title']} ({row['id']})", {'content_html': row['content_html']}
+    for page in client.select_pages('quizzes', 'id,title,passing_score,questions_json', page_size=page_size):
+        for row in page:
+            yield 'quizzes', f"{row['title']} ({row['id']})", row
+
+
+def validate_corpus(rows: Iterable[Tuple[str, str, Dict]], workers: int) -> Iterator[Tuple[str, str, List[str]]]:
+    """(table, label, problems) for every row, checked on a process pool when workers > 1"""
+    if workers <= 1:
+        yield from map(_validate, rows)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_validate, rows, chunksize=16)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate generated lesson HTML and quiz JSON before writing")
+    parser.add_argument('--source', choices=['catalog', 'db'], default='catalog',
+                        help="Render the catalog locally, or read the lessons and quizzes tables")
+    parser.add_argument('--template', choices=['lesson', 'enhanced'], default='lesson',
+                        help="Lesson body for --source catalog")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--page-size', type=int, default=500)
+    parser.add_argument('--json', action='store_true', help="Print failures as JSON")
+    args = parser.parse_args()
+
+    rows = catalog_rows(args.template) if args.source == 'catalog' else db_rows(args.page_size)
+    checked = {'lessons': 0, 'quizzes': 0}
+    failures = []
+    for table, label, problems in validate_corpus(rows, args.workers):
+        checked[table] += 1
+        if problems:
+            failures.append({'table': table, 'row': label, 'problems': problems})
+
+    if args.json:
+        print(json.dumps({'checked': checked, 'failures': failures}, indent=2))
+    else:
+        for failure in failures:
+            print(f"✗ {failure['table']}: {failure['row']}")
+            for problem in failure['problems']:
+                print(f"    {problem}")
+        print(f"\n{'✅' if not failures else '❌'} {checked['lessons']:,} lessons and {checked['quizzes']:,} "
+              f"quizzes checked, {len(failures):,} invalid")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Rate limiting for Supabase writes
+
+Combines an optional token bucket (steady requests/sec plus a burst
+allowance), exponential backoff with full jitter on 429/503, Retry-After
+handling and a circuit breaker that stops sending while the API keeps
+failing. The same RateLimiter instance can be shared by threads and asyncio
+tasks.
+
+There is no request cap unless SUPABASE_RATE_LIMIT is set, so concurrency
+settings such as enhance_all_lessons.py --max-in-flight are not silently
+capped; backoff and the circuit breaker are always on. The breaker counts a
+request as failed only once its retries are exhausted.
+
+Configuration (environment):
+    - SUPABASE_RATE_LIMIT   (optional, requests/sec cap; unset or 0 means no cap)
+    - SUPABASE_BURST        (optional, default 2x the rate)
+"""
+
+import asyncio
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Optional, Union
+
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_BASE_DELAY = 0.5  # Seconds before the first retry
+DEFAULT_MAX_DELAY = 30.0  # Upper bound for any single backoff
+DEFAULT_FAILURE_THRESHOLD = 5  # Consecutive failures that open the circuit
+DEFAULT_RESET_TIMEOUT = 30.0  # Seconds the circuit stays open
+THROTTLE_STATUSES = (429, 503)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending while the circuit breaker is open"""
+
+
+class TokenBucket:
+    """Token bucket refilled at rate tokens/sec, holding at most burst"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate * 2)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token, returning how long the caller must wait for it"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        wait = self.reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+
+class CircuitBreaker:
+    """Closed -> open after repeated failures -> half-open after a cooldown"""
+
+    def __init__(self, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout: float = DEFAULT_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.trips = 0  # Times the circuit opened since the last success
+        self.opened_at: Optional[float] = None
+        self.lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return 'half-open'
+        return 'open'
+
+    def seconds_until_half_open(self) -> float:
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def check(self):
+        if self.state == 'open':
+            raise CircuitOpenError(
+                f"Circuit open after {self.failures} consecutive failed requests; "
+                f"half-open in {self.seconds_until_half_open():.0f}s")
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.trips = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            # A failed half-open trial restarts the cooldown
+            if self.failures >= self.failure_threshold or self.opened_at is not None:
+                if self.state != 'open':
+                    self.trips += 1
+                self.opened_at = time.monotonic()
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given as delta-seconds or an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, base: float = DEFAULT_BASE_DELAY,
+                  cap: float = DEFAULT_MAX_DELAY) -> float:
+    """Exponential backoff with full jitter for the given 0-based attempt"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+RetryPolicy = Union[bool, Callable[[object], bool]]  # Whether a throttled response may be sent again
+
+
+def failed(resp) -> bool:
+    """Responses that count against the circuit breaker"""
+    return resp.status_code in THROTTLE_STATUSES or resp.status_code >= 500
+
+
+def server_requested_retry(resp) -> bool:
+    """A 429 with Retry-After: the server rejected the request unprocessed and asked for it again"""
+    return resp.status_code == 429 and retry_after_seconds(resp.headers.get('Retry-After')) is not None
+
+
+class RateLimiter:
+    """Throttles calls and retries throttled responses with backoff"""
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[float] = None,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                 base_delay: float = DEFAULT_BASE_DELAY, max_delay: float = DEFAULT_MAX_DELAY,
+                 breaker: Optional[CircuitBreaker] = None):
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker = breaker or CircuitBreaker()
+        self.throttled = 0  # Responses that triggered a backoff
+        self.resume_at = 0.0  # time.monotonic() before which nobody sends
+        self.lock = threading.Lock()
+
+    def _delay_for(self, resp, attempt: int) -> float:
+        retry_after = retry_after_seconds(resp.headers.get('Retry-After'))
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return backoff_delay(attempt, self.base_delay, self.max_delay)
+
+    def _wait(self) -> float:
+        """Seconds to wait before sending: for a token, and for any backoff pause"""
+        wait = self.bucket.reserve() if self.bucket else 0.0
+        return max(wait, self.resume_at - time.monotonic())
+
+    def pause(self, seconds: float):
+        """Hold back every caller sharing this limiter, not just the one that was throttled"""
+        with self.lock:
+            self.resume_at = max(self.resume_at, time.monotonic() + seconds)
+
+    def _retry(self, resp, retry: RetryPolicy, attempt: int) -> bool:
+        """True if resp should be sent again (and the backoff pause is applied)"""
+        if not failed(resp) or attempt == self.max_attempts - 1:
+            return False
+        if resp.status_code not in THROTTLE_STATUSES or not (retry(resp) if callable(retry) else retry):
+            return False
+        self.throttled += 1
+        self.pause(self._delay_for(resp, attempt))
+        return True
+
+    def _settle(self, resp):
+        """Record the final outcome of a request, after its retries"""
+        if failed(resp):
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        return resp
+
+    def call(self, send: Callable, retry: RetryPolicy = True):
+        """
+        Send through the limiter; send() must return a response object
+
+        retry is a bool or a predicate on the throttled response deciding
+        whether it may be sent again.
+        """
+        for attempt in range(self.max_attempts):
+            self.breaker.check()
+            wait = self._wait()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                resp = send()
+            except Exception:
+                self.breaker.record_failure()
+                raise
+            if not self._retry(resp, retry, attempt):
+                return self._settle(resp)
+
+    async def call_async(self, send: Callable[[], Awaitable], retry: RetryPolicy = True):
+        """Async counterpart of call(); send() must return an awaitable response"""
+        for attempt in range(self.max_attempts):
+            self.breaker.check()
+            wait = self._wait()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                resp = await send()
+            except Exception:
+                self.breaker.record_failure()
+                raise
+            if not self._retry(resp, retry, attempt):
+                return self._settle(resp)
+
+
+def limiter_from_env() -> RateLimiter:
+    """RateLimiter configured from the environment (a request cap only if SUPABASE_RATE_LIMIT is set)"""
+    rate = float(os.environ.get('SUPABASE_RATE_LIMIT') or 0)
+    burst = os.environ.get('SUPABASE_BURST')
+    return RateLimiter(rate if rate > 0 else None, float(burst) if burst else None)
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_loaded = False
+
+
+def get_limiter() -> Optional[RateLimiter]:
+    """Process-wide limiter so sync and async clients share one quota"""
+    global _limiter, _limiter_loaded
+    if not _limiter_loaded:
+        _limiter = limiter_from_env()
+        _limiter_loaded = True
+    return _limiter
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Bulk re-grader for quiz_attempts
+
+Generated quizzes store each answer key as `correct_answer`, but
+submit-quiz used to compare answers with `question.correctAnswer` (always
+undefined), so stored scores and pass flags can be wrong. This script loads
+every quiz's answer key, streams quiz_attempts, and recomputes score and
+passed exactly as submit-quiz does:
+
+    score  = Math.round(correct / questions * 100)
+    passed = score >= (passing_score || 70)
+
+Attempts are grouped per quiz and graded in vectorized NumPy passes: the
+answer key is an int16 vector, buffered attempts form an
+(attempts x questions) int16 matrix (-1 for unanswered or malformed
+answers), and score and passed are computed for the whole matrix at once.
+Only attempts whose score or passed flag changes become {id, score,
+passed} corrections. They are streamed as each grading pass produces them:
+written to --output line by line and applied with --apply through the
+apply_quiz_regrades() SQL function in chunks, so at most one chunk is held
+in memory. XP is not awarded retroactively for attempts that now pass; the
+summary counts them.
+
+Usage:
+    python3 code/regrade_quizzes.py                          # report only
+    python3 code/regrade_quizzes.py --output corrections.jsonl
+    python3 code/regrade_quizzes.py --apply [--chunk-size 5000]
+
+Requirements:
+    - numpy
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from typing import Dict, IO, Iterable, Iterator, List, Optional
+
+import numpy as np
+import requests
+
+sys.path.append(os.path.dirname(__file__))
+from supabase_client import DEFAULT_PAGE_SIZE, chunked, get_client
+
+DEFAULT_PASSING_SCORE = 70  # submit-quiz: quiz.passing_score || 70
+UNANSWERED = -1  # What the lesson player sends for a skipped question
+NO_KEY = -2  # Answer key for a question without one: never matches
+MAX_OPTION = np.iinfo(np.int16).max
+FLUSH_ROWS = 200_000  # Buffered attempts across all quizzes before a grading pass
+CORRECTIONS_PER_CALL = 5000
+ATTEMPT_COLUMNS = 'id,quiz_id,score,passed,answers_json'
+_TYPE_OF = np.frompyfunc(type, 1, 1)  # Element-wise type() over an object array
+
+
+def _option(value) -> int:
+    """An answer or key as an option index; anything === can't match becomes UNANSWERED"""
+    if isinstance(value, bool):
+        return UNANSWERED
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, int) and 0 <= value <= MAX_OPTION:
+        return value
+    return UNANSWERED
+
+
+class AnswerKey:
+    """One quiz's answer key as an int16 vector, plus its pass mark"""
+
+    def __init__(self, questions: Optional[List[Dict]], passing_score: Optional[int]):
+        questions = questions if isinstance(questions, list) else []
+        keys = []
+        for question in questions:
+            key = None
+            if isinstance(question, dict):
+                # submit-quiz: question.correct_answer ?? question.correctAnswer
+                key = question.get('correct_answer')
+                if key is None:
+                    key = question.get('correctAnswer')
+            option = _option(key)
+            keys.append(NO_KEY if option == UNANSWERED else option)
+        self.key = np.array(keys, dtype=np.int16)
+        self.passing_score = passing_score or DEFAULT_PASSING_SCORE
+
+    @property
+    def questions(self) -> int:
+        return len(self.key)
+
+
+def encode_answers(answers_rows: List, questions: int) -> np.ndarray:
+    """(attempts x questions) int16 matrix of the chosen options"""
+    if questions == 0:
+        return np.empty((len(answers_rows), 0), dtype=np.int16)
+    # Fast path: every attempt is a full-length list of plain ints (what the lesson player sends).
+    # NumPy would turn True into 1, but true === 1 is false in submit-quiz, so a type mask over the
+    # object array sends bools (and floats, strings, nulls) to the slow path.
+    try:
+        objects = np.array(answers_rows, dtype=object)
+        if objects.shape == (len(answers_rows), questions) and (_TYPE_OF(objects) == int).all():
+            matrix = objects.astype(np.int64)
+            return np.where((matrix >= 0) & (matrix <= MAX_OPTION), matrix, UNANSWERED).astype(np.int16)
+    except (ValueError, OverflowError):  # Nested lists, or ints too large for int64
+        pass
+
+    matrix = np.full((len(answers_rows), questions), UNANSWERED, dtype=np.int16)
+    for i, answers in enumerate(answers_rows):
+        if isinstance(answers, dict):
+            # Objects keyed by question index ("0", "1", ...) are read like arrays in JS
+            answers = [answers.get(str(j)) for j in range(questions)]
+        elif not isinstance(answers, list):
+            continue
+        row = [_option(value) for value in answers[:questions]]
+        matrix[i, :len(row)] = row
+    return matrix
+
+
+def grade(key: AnswerKey, answers: np.ndarray):
+    """(scores, passed) for every row of an encoded answer matrix"""
+    if key.questions == 0:
+        scores = np.zeros(len(answers), dtype=np.int32)
+    else:
+        correct = (answers == key.key).sum(axis=1)
+        # Same float64 arithmetic as Math.round(correct / total * 100) in submit-quiz
+        scores = np.floor(correct / key.questions * 100 + 0.5).astype(np.int32)
+    return scores, scores >= key.passing_score
+
+
+class Regrader:
+    """Buffers attempts per quiz and emits corrections in vectorized passes"""
+
+    def __init__(self, keys: Dict[str, AnswerKey]):
+        self.keys = keys
+        self.buffers: Dict[str, List[Dict]] = {}
+        self.buffered = 0
+        self.stats = Counter()
+
+    def add(self, attempt: Dict) -> List[Dict]:
+        """Buffer one attempt; returns corrections when a grading pass runs"""
+        if attempt['quiz_id'] not in self.keys:
+            self.stats['unknown_quiz'] += 1
+            return []
+        self.buffers.setdefault(attempt['quiz_id'], []).append(attempt)
+        self.buffered += 1
+        return self.flush() if self.buffered >= FLUSH_ROWS else []
+
+    def flush(self) -> List[Dict]:
+        corrections = []
+        for quiz_id, attempts in self.buffers.items():
+            key = self.keys[quiz_id]
+            scores, passed = grade(key, encode_answers([a['answers_json'] for a in attempts], key.questions))
+            stored_scores = np.array([a['score'] if a['score'] is not None else -1 for a in attempts],
+                                     dtype=np.int32)
+            stored_passed = np.array([bool(a['passed']) for a in attempts])
+            changed = (scores != stored_scores) | (passed != stored_passed)
+            self.stats['graded'] += len(attempts)
+            self.stats['now_passing'] += int((passed & ~stored_passed).sum())
+            self.stats['now_failing'] += int((~passed & stored_passed).sum())
+            for i in np.flatnonzero(changed):
+                corrections.append({'id': attempts[i]['id'], 'score': int(scores[i]),
+                                    'passed': bool(passed[i])})
+        self.stats['corrections'] += len(corrections)
+        self.buffers = {}
+        self.buffered = 0
+        return corrections
+
+
+def load_answer_keys(client, page_size: int) -> Dict[str, AnswerKey]:
+    return {quiz['id']: AnswerKey(quiz['questions_json'], quiz['passing_score'])
+            for page in client.select_pages('quizzes', 'id,passing_score,questions_json', page_size=page_size)
+            for quiz in page}
+
+
+def regrade(client, regrader: Regrader, page_size: int) -> Iterable[Dict]:
+    """Stream quiz_attempts through regrader and yield corrections"""
+    for page in client.select_pages('quiz_attempts', ATTEMPT_COLUMNS, page_size=page_size):
+        for attempt in page:
+            yield from regrader.add(attempt)
+    yield from regrader.flush()
+
+
+def write_corrections(corrections: Iterable[Dict], out: IO[str]) -> Iterator[Dict]:
+    """Pass corrections through, writing each as a JSON line"""
+    for correction in corrections:
+        out.write(json.dumps(correction) + '\n')
+        yield correction
+
+
+def apply_corrections(client, corrections: Iterable[Dict], chunk_size: int, stats: Counter):
+    """Send corrections to apply_quiz_regrades() a chunk at a time; counts rows updated in stats"""
+    for chunk in chunked(corrections, chunk_size):
+        resp = client.rpc('apply_quiz_regrades', {'p_corrections': chunk})
+        resp.raise_for_status()
+        stats['applied'] += resp.json()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute quiz_attempts scores from the stored answer keys")
+    parser.add_argument('--output', help="Write corrections as JSON lines ({id, score, passed})")
+    parser.add_argument('--apply', action='store_true', help="Apply corrections through apply_quiz_regrades()")
+    parser.add_argument('--page-size', type=int, default=DEFAULT_PAGE_SIZE,
+                        help=f"Attempts fetched per request (default {DEFAULT_PAGE_SIZE})")
+    parser.add_argument('--chunk-size', type=int, default=CORRECTIONS_PER_CALL,
+                        help=f"Corrections per apply call (default {CORRECTIONS_PER_CALL})")
+    args = parser.parse_args()
+
+    client = get_client()
+    if not client.configured:
+        print("❌ Missing SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    try:
+        keys = load_answer_keys(client, args.page_size)
+    except requests.HTTPError as e:
+        print(f"❌ Error fetching quizzes: {e.response.status_code} {e.response.text[:200]}")
+        sys.exit(1)
+    print(f"🔑 Loaded answer keys for {len(keys):,} quizzes")
+    regrader = Regrader(keys)
+    stats = regrader.stats
+
+    # Corrections are written and applied as grading passes produce them
+    out = open(args.output, 'w', encoding='utf-8') if args.output else None
+    try:
+        corrections = regrade(client, regrader, args.page_size)
+        if out is not None:
+            corrections = write_corrections(corrections, out)
+        if args.apply:
+            apply_corrections(client, corrections, args.chunk_size, stats)
+        else:
+            for _ in corrections:
+                pass
+    except requests.HTTPError as e:
+        print(f"❌ Request failed: {e.response.status_code} {e.response.text[:200]}")
+        if args.apply:
+            print(f"   {stats['applied']:,} corrections were applied before the error; re-run to finish")
+        sys.exit(1)
+    finally:
+        if out is not None:
+            out.close()
+    elapsed = time.perf_counter() - started
+
+    print(f"   Attempts graded:   {stats['graded']:,} in {elapsed:.1f}s")
+    print(f"   Corrections:       {stats['corrections']:,}")
+    print(f"   Now passing:       {stats['now_passing']:,} (no XP is awarded retroactively)")
+    print(f"   Now failing:       {stats['now_failing']:,}")
+    if stats['unknown_quiz']:
+        print(f"   ⚠ Skipped {stats['unknown_quiz']:,} attempts whose quiz no longer exists")
+
+    if args.output:
+        print(f"✓ Wrote {os.path.relpath(args.output)}")
+    if args.apply:
+        print(f"✓ Applied {stats['applied']:,} corrections")
+
+
+if __name__ == "__main__":
+    main()
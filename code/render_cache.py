@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Persistent render cache for generated lessons and quizzes
+
+Rendered output is stored in SQLite (code/.cache/render_cache.sqlite)
+keyed by a SHA-256 of the generator name and its inputs (title, topics,
+description, ...) plus a fingerprint of the template and generator
+sources, so a rerun only re-renders lessons whose inputs or templates
+changed. Editing any file in TEMPLATE_SOURCES invalidates every entry;
+stale entries are purged when the cache is opened.
+
+The cache is bounded by size: least recently used entries are evicted once
+the stored values exceed the limit. Recency updates are batched in memory
+and written on flush(), so hits cost one indexed read.
+
+Configuration (environment):
+    - RENDER_CACHE          (optional, 0 disables)
+    - RENDER_CACHE_MAX_MB   (optional, default 256)
+
+Usage:
+    from render_cache import get_render_cache
+    cache = get_render_cache()
+    html = cache.render('lesson', generate_lesson_content, code, title, topics, description)
+    print(cache.summary())
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+CODE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.path.join(CODE_DIR, '.cache', 'render_cache.sqlite')
+CACHE_VERSION = 1  # Bump when the stored value layout changes
+DEFAULT_MAX_MB = 256
+FLUSH_EVERY = 500  # Writes per transaction
+EVICT_TO = 0.9  # Evict down to this fraction of the limit
+
+# Files whose contents decide what a render produces; text_stats.py is
+# included because cached enhanced renders carry their word count, and
+# render_tenants.py because it decides which text becomes a brand slot
+TEMPLATE_SOURCES = ('lesson_templates.py', 'content_generator_full.py',
+                    'fragment_template.py', 'text_stats.py', 'render_tenants.py')
+
+
+def template_fingerprint(sources=TEMPLATE_SOURCES) -> str:
+    """SHA-256 over the generator sources and the cache layout version"""
+    digest = hashlib.sha256(f'render-cache-v{CACHE_VERSION}'.encode())
+    for name in sources:
+        with open(os.path.join(CODE_DIR, name), 'rb') as f:
+            digest.update(name.encode() + b'\0' + f.read())
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Size-bounded LRU cache of JSON-serializable render results in SQLite"""
+
+    def __init__(self, path: str = CACHE_PATH, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024,
+                 fingerprint: Optional[str] = None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.fingerprint = fingerprint or template_fingerprint()
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._touched: Dict[str, float] = {}
+        self._pending_writes = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.execute('''CREATE TABLE IF NOT EXISTS renders (
+            key TEXT PRIMARY KEY,
+            fingerprint TEXT NOT NULL,
+            value TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            last_used REAL NOT NULL)''')
+        self.db.execute('CREATE INDEX IF NOT EXISTS renders_last_used ON renders (last_used)')
+        # Entries rendered by other template versions can never hit again
+        self.db.execute('DELETE FROM renders WHERE fingerprint != ?', (self.fingerprint,))
+        self.db.commit()
+        self.size = self.db.execute('SELECT COALESCE(SUM(size), 0) FROM renders').fetchone()[0]
+
+    def key(self, kind: str, inputs) -> str:
+        payload = json.dumps([kind, inputs], ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(f'{self.fingerprint}\0{payload}'.encode('utf-8')).hexdigest()
+
+    def get(self, key: str):
+        """Cached value for key, or None"""
+        with self._lock:
+            row = self.db.execute('SELECT value FROM renders WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched[key] = time.time()
+        return json.loads(row[0])
+
+    def put(self, key: str, value):
+        data = json.dumps(value, ensure_ascii=False)
+        size = len(data)
+        with self._lock:
+            previous = self.db.execute('SELECT size FROM renders WHERE key = ?', (key,)).fetchone()
+            self.db.execute('INSERT OR REPLACE INTO renders VALUES (?, ?, ?, ?, ?)',
+                            (key, self.fingerprint, data, size, time.time()))
+            self.size += size - (previous[0] if previous else 0)
+            self._pending_writes += 1
+            if self._pending_writes >= FLUSH_EVERY or self.size > self.max_bytes:
+                self._flush()
+
+    def render(self, kind: str, func: Callable, *args):
+        """func(*args), served from the cache when the same inputs were rendered before"""
+        key = self.key(kind, args)
+        value = self.get(key)
+        if value is None:
+            value = func(*args)
+            self.put(key, value)
+        return value
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if self._touched:
+            self.db.executemany('UPDATE renders SET last_used = ? WHERE key = ?',
+                                [(used, key) for key, used in self._touched.items()])
+            self._touched.clear()
+        if self.size > self.max_bytes:
+            self._evict()
+        self.db.commit()
+        self._pending_writes = 0
+
+    def _evict(self):
+        """Drop least recently used entries until the cache is under EVICT_TO of its limit"""
+        target = self.max_bytes * EVICT_TO
+        victims = []
+        for key, size in self.db.execute('SELECT key, size FROM renders ORDER BY last_used'):
+            if self.size <= target:
+                break
+            victims.append((key,))
+            self.size -= size
+        self.db.executemany('DELETE FROM renders WHERE key = ?', victims)
+        self.evicted += len(victims)
+
+    def summary(self) -> str:
+        total = self.hits + self.misses
+        rate = f" ({self.hits / total * 100:.0f}% hit rate)" if total else ""
+        evicted = f", {self.evicted:,} evicted" if self.evicted else ""
+        return f"{self.hits:,} hits, {self.misses:,} misses{rate}{evicted}"
+
+    def close(self):
+        with self._lock:
+            if self.db is None:
+                return
+            self._flush()
+            self.db.close()
+            self.db = None
+
+
+class NullRenderCache:
+    """Drop-in stand-in when caching is disabled: always renders"""
+
+    hits = 0
+    evicted = 0
+
+    def __init__(self):
+        self.misses = 0
+
+    def render(self, kind: str, func: Callable, *args):
+        self.misses += 1
+        return func(*args)
+
+    def flush(self):
+        pass
+
+    def summary(self) -> str:
+        return "disabled"
+
+    def close(self):
+        pass
+
+
+_cache = None
+
+
+def get_render_cache():
+    """Process-wide render cache configured from the environment"""
+    global _cache
+    if _cache is None:
+        if os.environ.get('RENDER_CACHE', '1') == '0':
+            _cache = NullRenderCache()
+        else:
+            max_mb = float(os.environ.get('RENDER_CACHE_MAX_MB', DEFAULT_MAX_MB))
+            try:
+                _cache = RenderCache(max_bytes=int(max_mb * 1024 * 1024))
+            except (OSError, sqlite3.Error):
+                _cache = NullRenderCache()  # Read-only checkout: run uncached
+        atexit.register(_cache.close)
+    return _cache
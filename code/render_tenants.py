@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Branded lesson copies for white-label tenants
+
+Every tenant gets its own copy of the shared catalog (courses with no
+tenant_id): a course row under the tenant's id plus a lesson and quiz each.
+Lesson HTML is rendered once per course with the brand slots left open
+(cached in the render cache as a base template), then filled with each
+tenant's brand tokens. Onboarding a tenant is one join per lesson, not a
+full render. Each tenant's new and rebranded rows are sent as chunked bulk
+upserts (courses, then lessons, then quizzes) before the next tenant is
+built, so memory holds one tenant's HTML at a time.
+
+Brand tokens come from tenants.branding_config (brand_name), falling back to
+the tenant name. The platform brand (DEFAULT_BRAND) in catalog titles,
+topics and descriptions goes through the same slot, so a course such as
+"ScorePro Platform Introduction & Setup" is copied under the tenant's brand. The platform's own tenant (PLATFORM_TENANT) uses the shared
+catalog directly and is never copied.
+
+Usage:
+    python3 code/render_tenants.py                        # every active tenant
+    python3 code/render_tenants.py --tenant acme --dry-run
+    python3 code/render_tenants.py --rebrand              # refill existing tenant lessons
+    python3 code/render_tenants.py --template enhanced
+"""
+
+import argparse
+import html
+import os
+import sys
+import time
+import uuid
+from typing import Dict, List, Optional
+
+sys.path.append(os.path.dirname(__file__))
+from content_generator_full import generate_lesson_content, generate_quiz_questions
+from curriculum_catalog import get_catalog, lesson_topics
+from fragment_template import CompiledTemplate, compile_rendered, compile_template, slot_marker
+from lesson_templates import DEFAULT_BRAND, generate_enhanced_content
+from render_cache import get_render_cache
+from supabase_client import DEFAULT_CHUNK_SIZE, get_client
+from text_stats import text_stats
+
+BRAND_SLOTS = ('brand',)
+PLATFORM_TENANT = 'scorepro'  # Seeded by 1761204000_seed_scorepro_tenant.sql
+PASSING_SCORE = 70
+COURSE_COPY_COLUMNS = ('category_id', 'title', 'slug', 'description', 'difficulty_level',
+                       'duration_minutes', 'display_order', 'prerequisites')
+
+
+def brand_name(tenant: Dict) -> str:
+    config = tenant.get('branding_config') or {}
+    return config.get('brand_name') or tenant['name']
+
+
+def brand_tokens(tenant: Dict) -> Dict[str, str]:
+    """Values for BRAND_SLOTS from a tenants row, HTML-escaped (tenants pick their own names)"""
+    return {'brand': html.escape(brand_name(tenant))}
+
+
+def mark_brand(text: str) -> str:
+    """Catalog text with the platform brand replaced by the brand slot marker"""
+    return text.replace(DEFAULT_BRAND, slot_marker('brand'))
+
+
+def fill_brand(value, brand: str):
+    """Copy of a marked string, or list/dict of them, with the marker replaced by brand"""
+    if isinstance(value, str):
+        return value.replace(slot_marker('brand'), brand)
+    if isinstance(value, list):
+        return [fill_brand(item, brand) for item in value]
+    if isinstance(value, dict):
+        return {key: fill_brand(item, brand) for key, item in value.items()}
+    return value
+
+
+def render_base_source(template: str, code: str, title: str, topics: List[str],
+                       description: str) -> str:
+    """Template source of one lesson with only the brand slots left open"""
+    markers = {name: slot_marker(name) for name in BRAND_SLOTS}
+    title, description = mark_brand(title), mark_brand(description)
+    topics = [mark_brand(topic) for topic in topics]
+    if template == 'enhanced':
+        rendered = generate_enhanced_content(title, "", **markers)
+    else:
+        rendered = generate_lesson_content(code, title, topics, description, **markers)
+    return compile_rendered(rendered, BRAND_SLOTS).source
+
+
+def render_base_quiz(code: str, title: str, topics: List[str]) -> List[Dict]:
+    """Quiz questions with the platform brand left as a marker for fill_brand()"""
+    return generate_quiz_questions(code, mark_brand(title), [mark_brand(topic) for topic in topics])
+
+
+def tutorial_inputs(course: Dict, catalog) -> Dict:
+    """Generator inputs for a shared course, with insert_all_content.py's defaults"""
+    description = course.get('description') or ''
+    tutorial = catalog.lookup_title(course['title'])
+    if tutorial is None:
+        tutorial = {"code": "X.X", "duration": None, "xp": 20, "topics": []}
+    return {
+        'code': tutorial['code'],
+        'duration': tutorial['duration'],
+        'xp': tutorial['xp'],
+        'topics': lesson_topics(tutorial['topics'], description),
+        'description': description,
+    }
+
+
+class SharedLesson:
+    """A shared course's generator inputs, base template and quiz, built once for all tenants"""
+
+    def __init__(self, course: Dict, inputs: Dict, base: CompiledTemplate, questions: List[Dict]):
+        self.course = course
+        self.inputs = inputs
+        self.base = base
+        self.questions = questions
+
+
+def build_tenant_rows(tenant: Dict, shared: List[SharedLesson], tenant_courses: Dict[str, Dict],
+                      lesson_ids: Dict[str, str], rebrand: bool) -> Dict[str, List[Dict]]:
+    """New courses, new or rebranded lessons, and new quizzes for one tenant"""
+    tokens = brand_tokens(tenant)
+    brand = brand_name(tenant)  # Plain-text columns are not HTML
+    rows = {'courses': [], 'lessons': [], 'quizzes': []}
+    for item in shared:
+        branded = {column: item.course.get(column) for column in COURSE_COPY_COLUMNS}
+        for column in ('title', 'description'):
+            if branded[column]:
+                branded[column] = fill_brand(mark_brand(branded[column]), brand)
+        course = tenant_courses.get(item.course['slug'])
+        if course is None:
+            course = dict(branded, id=str(uuid.uuid4()), tenant_id=tenant['id'], is_active=True)
+            rows['courses'].append(course)
+        elif rebrand and any(course.get(column) != branded[column] for column in ('title', 'description')):
+            course = dict(branded, id=course['id'], tenant_id=tenant['id'], is_active=course.get('is_active', True))
+            rows['courses'].append(course)
+        lesson_id = lesson_ids.get(course['id'])
+        if lesson_id is not None and not rebrand:
+            continue
+
+        content_html = item.base.render(**tokens)
+        lesson = {
+            'id': lesson_id or str(uuid.uuid4()),
+            'course_id': course['id'],
+            'title': branded['title'],
+            'slug': course['slug'],
+            'content_type': 'text',
+            'content_html': content_html,
+            'duration_minutes': item.inputs['duration'] or text_stats(content_html).reading_minutes,
+            'xp_reward': item.inputs['xp'],
+            'is_active': True,
+            'display_order': 1,
+        }
+        rows['lessons'].append(lesson)
+        if lesson_id is None:
+            rows['quizzes'].append({
+                'id': str(uuid.uuid4()),
+                'lesson_id': lesson['id'],
+                'title': f"{branded['title']} - Quiz",
+                'passing_score': PASSING_SCORE,
+                'questions_json': fill_brand(item.questions, brand),
+                'is_active': True,
+            })
+    return rows
+
+
+def upload(client, rows: Dict[str, List[Dict]], chunk_size: int) -> Dict[str, int]:
+    """Upsert courses, lessons and quizzes, dropping rows whose parent chunk failed"""
+    written = {}
+    failed_ids = set()
+    parents = {'courses': None, 'lessons': 'course_id', 'quizzes': 'lesson_id'}
+    for table, parent in parents.items():
+        table_rows = [row for row in rows[table] if parent is None or row[parent] not in failed_ids]
+        written[table], failures = client.upsert_many(table, table_rows, chunk_size)
+        for chunk, resp in failures:
+            failed_ids.update(row['id'] for row in chunk)
+            print(f"  ✗ Failed to upsert {len(chunk)} {table}: {resp.text[:200]}")
+    return written
+
+
+def count_rows(rows: Dict[str, List[Dict]]) -> Dict[str, int]:
+    return {table: len(table_rows) for table, table_rows in rows.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render branded lesson copies for white-label tenants")
+    parser.add_argument('--tenant', action='append', metavar='SLUG',
+                        help="Only this tenant (repeatable); default every active tenant")
+    parser.add_argument('--template', choices=['lesson', 'enhanced'], default='lesson',
+                        help="Lesson body to brand: generate_lesson_content or the enhanced template")
+    parser.add_argument('--rebrand', action='store_true',
+                        help="Also refill lessons tenants already have (after a brand change)")
+    parser.add_argument('--dry-run', action='store_true', help="Render and count rows without writing")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Rows per bulk upsert request (default {DEFAULT_CHUNK_SIZE})")
+    args = parser.parse_args()
+
+    client = get_client()
+    catalog = get_catalog()
+    render_cache = get_render_cache()
+
+    print("Fetching tenants, courses and lessons...")
+    tenants = [tenant for page in client.select_pages('tenants', 'id,slug,name,branding_config,is_active')
+               for tenant in page if tenant.get('is_active', True)]
+    if args.tenant:
+        tenants = [tenant for tenant in tenants if tenant['slug'] in args.tenant]
+        missing = set(args.tenant) - {tenant['slug'] for tenant in tenants}
+        if missing:
+            print(f"❌ Unknown or inactive tenant(s): {', '.join(sorted(missing))}")
+            sys.exit(1)
+    else:
+        tenants = [tenant for tenant in tenants if tenant['slug'] != PLATFORM_TENANT]
+    courses = [course for page in client.select_pages('courses') for course in page]
+    lesson_ids = {row['course_id']: row['id']
+                  for page in client.select_pages('lessons', 'id,course_id') for row in page}
+
+    shared_courses = [course for course in courses if course.get('tenant_id') is None]
+    courses_by_tenant: Dict[str, Dict[str, Dict]] = {}
+    for course in courses:
+        if course.get('tenant_id') is not None:
+            courses_by_tenant.setdefault(course['tenant_id'], {})[course['slug']] = course
+    print(f"Found {len(tenants)} tenants and {len(shared_courses)} shared courses")
+
+    # Tenant-independent work, once per shared course
+    started = time.perf_counter()
+    shared = []
+    for course in shared_courses:
+        inputs = tutorial_inputs(course, catalog)
+        source = render_cache.render(f'{args.template}_base', render_base_source, args.template,
+                                     inputs['code'], course['title'], inputs['topics'], inputs['description'])
+        questions = render_cache.render('quiz_base', render_base_quiz,
+                                        inputs['code'], course['title'], inputs['topics'])
+        shared.append(SharedLesson(course, inputs, compile_template(source), questions))
+    base_seconds = time.perf_counter() - started
+
+    render_cache.flush()
+
+    # Per tenant: only the brand slots are filled, then that tenant's rows are
+    # upserted before the next tenant is built; only counts are kept
+    planned = {'courses': 0, 'lessons': 0, 'quizzes': 0}
+    written: Optional[Dict[str, int]] = None if args.dry_run else dict(planned)
+    fill_seconds = 0.0
+    if not args.dry_run:
+        print(f"\n📤 Upserting each tenant in chunks of {args.chunk_size}...")
+    for tenant in tenants:
+        started = time.perf_counter()
+        tenant_rows = build_tenant_rows(tenant, shared, courses_by_tenant.get(tenant['id'], {}),
+                                        lesson_ids, args.rebrand)
+        fill_seconds += time.perf_counter() - started
+        counts = count_rows(tenant_rows)
+        print(f"  🏷  {tenant['slug']} ({brand_name(tenant)}): "
+              f"{counts['courses']} courses, {counts['lessons']} lessons, {counts['quizzes']} quizzes")
+        for table, count in counts.items():
+            planned[table] += count
+        if written is not None and any(counts.values()):
+            for table, count in upload(client, tenant_rows, args.chunk_size).items():
+                written[table] += count
+
+    print(f"\n{'='*60}")
+    print(f"✅ Tenant rendering {'planned (dry run)' if args.dry_run else 'complete'}")
+    for table, count in planned.items():
+        sent = f" ({written[table]} written)" if written is not None else ""
+        print(f"   {table.capitalize() + ':':<9} {count}{sent}")
+    print(f"   Base renders:  {len(shared)} in {base_seconds:.2f}s")
+    print(f"   Brand fills:   {planned['lessons']} in {fill_seconds:.2f}s")
+    print(f"   Render cache:  {render_cache.summary()}")
+    print(f"{'='*60}")
+    if written is not None and any(written[table] < planned[table] for table in planned):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Shared Supabase REST client for the ScorePro content scripts
+
+Every script in code/ talks to PostgREST through one pooled requests.Session
+so repeated calls reuse keep-alive connections instead of paying a fresh
+TCP+TLS handshake per request.
+
+Configuration (environment):
+    - SUPABASE_URL
+    - SUPABASE_SERVICE_ROLE_KEY
+    - SUPABASE_POOL_SIZE    (optional, default 10)
+    - SUPABASE_MAX_RETRIES  (optional, default 3)
+    - SUPABASE_RATE_LIMIT / SUPABASE_BURST (see rate_limit.py)
+    - SUPABASE_MIRROR       (optional: serve requests from the local SQLite
+                             mirror instead, see local_mirror.py)
+    - SUPABASE_PREFLIGHT    (optional, default 1: validate lesson and quiz
+                             writes locally first, see preflight.py)
+
+AsyncSupabaseClient is the asyncio counterpart for concurrent writers; it
+needs httpx, which is imported only when an async client is created.
+"""
+
+import json
+import os
+from http import HTTPStatus
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, Tuple, TypedDict, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from preflight import PREFLIGHT_STATUS, rejection_body, rejections
+from rate_limit import RateLimiter, get_limiter, server_requested_retry
+
+Table = Literal['categories', 'courses', 'lessons', 'quizzes', 'quiz_attempts', 'content_blocks',
+                'tenants']
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_TIMEOUT = 30  # Seconds per request
+DEFAULT_CHUNK_SIZE = 500  # Rows per bulk upsert request
+DEFAULT_PAGE_SIZE = 1000  # Rows per keyset page (PostgREST max-rows default)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+IDEMPOTENT_METHODS = Retry.DEFAULT_ALLOWED_METHODS
+
+_FROM_ENV = object()  # Sentinel: use the shared limiter from rate_limit.get_limiter()
+
+
+class CourseRow(TypedDict, total=False):
+    id: str
+    category_id: str
+    tenant_id: Optional[str]
+    title: str
+    slug: str
+    description: Optional[str]
+    difficulty_level: Optional[str]
+    duration_minutes: Optional[int]
+    display_order: int
+    is_active: bool
+
+
+class LessonRow(TypedDict, total=False):
+    id: str
+    course_id: str
+    title: str
+    slug: str
+    content_type: str
+    content_html: Optional[str]
+    duration_minutes: Optional[int]
+    display_order: int
+    xp_reward: int
+    is_active: bool
+
+
+class QuizRow(TypedDict, total=False):
+    id: str
+    lesson_id: str
+    title: str
+    passing_score: int
+    questions_json: List[Dict]
+    is_active: bool
+
+
+Row = Union[CourseRow, LessonRow, QuizRow, Dict]
+
+
+def eq(value) -> str:
+    """PostgREST equality filter value"""
+    return f'eq.{value}'
+
+
+def chunked(rows: Iterable, size: int) -> Iterator[List]:
+    """Split rows into lists of at most size items"""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def json_response(status: int, payload=None, url: str = '') -> requests.Response:
+    """requests.Response carrying a PostgREST-shaped JSON body, built without a round trip"""
+    resp = requests.Response()
+    resp.status_code = status
+    resp.reason = HTTPStatus(status).phrase
+    resp.url = url
+    resp.encoding = 'utf-8'
+    resp.headers['Content-Type'] = 'application/json; charset=utf-8'
+    resp._content = b'' if payload is None else json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    return resp
+
+
+def write_retry(method: str, replayable: bool, retry_reads: bool):
+    """Limiter retry policy: reads and replayable writes always, other writes only when the server asks"""
+    if method.upper() in IDEMPOTENT_METHODS:
+        return retry_reads
+    return True if replayable else server_requested_retry
+
+
+class SupabaseClient:
+    """
+    Pooled PostgREST client with retries for idempotent verbs
+
+    Every request passes through the rate limiter. Reads are retried by
+    urllib3. A write is only sent again when the server asks for it (429
+    with Retry-After) or when it is safe to replay: upserts (the conflict
+    key makes a replay write the same row) and writes the caller marks
+    replayable. Pass limiter=None to disable throttling. Lesson and quiz writes that fail
+    pre-flight validation get a local 422 response and are never sent.
+    """
+
+    local = False  # True for local_mirror.LocalClient
+
+    def __init__(self, url: Optional[str] = None, service_key: Optional[str] = None,
+                 pool_size: Optional[int] = None, max_retries: Optional[int] = None,
+                 timeout: float = DEFAULT_TIMEOUT, limiter=_FROM_ENV):
+        self.url = (url or os.environ.get('SUPABASE_URL') or '').rstrip('/')
+        self.service_key = service_key or os.environ.get('SUPABASE_SERVICE_ROLE_KEY')
+        if pool_size is None:
+            pool_size = int(os.environ.get('SUPABASE_POOL_SIZE', DEFAULT_POOL_SIZE))
+        if max_retries is None:
+            max_retries = int(os.environ.get('SUPABASE_MAX_RETRIES', DEFAULT_MAX_RETRIES))
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.limiter: Optional[RateLimiter] = get_limiter() if limiter is _FROM_ENV else limiter
+
+        # urllib3 only retries the methods in allowed_methods, so POST/PATCH
+        # writes are never replayed behind the caller's back (see request()).
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=IDEMPOTENT_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                              max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'apikey': self.service_key or '',
+            'Authorization': f'Bearer {self.service_key}',
+            'Content-Type': 'application/json',
+        })
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.url and self.service_key)
+
+    def endpoint(self, table: Table) -> str:
+        return f'{self.url}/rest/v1/{table}'
+
+    def preflight(self, method: str, table: Table, json) -> Optional[requests.Response]:
+        """Local 422 response if a POST/PATCH body fails pre-flight validation, else None"""
+        if method.upper() not in ('POST', 'PATCH') or json is None:
+            return None
+        rejected = rejections(table, json)
+        if not rejected:
+            return None
+        return json_response(PREFLIGHT_STATUS, rejection_body(table, rejected), self.endpoint(table))
+
+    def request(self, method: str, table: Table, params: Optional[Dict] = None,
+                json=None, prefer: Optional[str] = None, replayable: bool = False) -> requests.Response:
+        """
+        Send one PostgREST request
+
+        replayable marks a write whose replay has the same effect (e.g. a
+        PATCH of fixed values by primary key); the limiter may then resend
+        it on 429/503 without a Retry-After.
+        """
+        rejected = self.preflight(method, table, json)
+        if rejected is not None:
+            return rejected
+        headers = {'Prefer': prefer} if prefer else None
+
+        def send():
+            return self.session.request(method, self.endpoint(table), params=params,
+                                        json=json, headers=headers, timeout=self.timeout)
+
+        if self.limiter is None:
+            return send()
+        # Reads were already retried by urllib3
+        return self.limiter.call(send, retry=write_retry(method, replayable, retry_reads=False))
+
+    def select(self, table: Table, columns: str = '*', filters: Optional[Dict] = None,
+               **params) -> requests.Response:
+        """GET rows; filters are PostgREST column filters, e.g. {'id': eq(x)}"""
+        query = {'select': columns}
+        query.update(filters or {})
+        query.update({k: str(v) for k, v in params.items()})
+        return self.request('GET', table, params=query)
+
+    def select_pages(self, table: Table, columns: str = '*', filters: Optional[Dict] = None,
+                     page_size: int = DEFAULT_PAGE_SIZE, key: str = 'id') -> Iterator[List[Dict]]:
+        """
+        Yield pages of rows using keyset pagination on key (key=gt.{last})
+
+        Unlike offset paging, each page is an index range scan, so late pages
+        cost the same as early ones. key is added to the projection if needed.
+        """
+        if columns != '*' and key not in columns.split(','):
+            columns = f'{columns},{key}'
+        last = None
+        while True:
+            query = dict(filters or {})
+            if last is not None:
+                query[key] = f'gt.{last}'
+            resp = self.select(table, columns, query, order=f'{key}.asc', limit=page_size)
+            resp.raise_for_status()
+            rows = resp.json()
+            if rows:
+                yield rows
+            if len(rows) < page_size:
+                return
+            last = rows[-1][key]
+
+    def insert(self, table: Table, rows: Union[Row, List[Row]],
+               returning: str = 'representation') -> requests.Response:
+        """POST one row or an array of rows"""
+        return self.request('POST', table, json=rows, prefer=f'return={returning}')
+
+    def upsert(self, table: Table, rows: Union[Row, List[Row]], on_conflict: str = 'id',
+               returning: str = 'minimal') -> requests.Response:
+        """POST with merge-duplicates so reruns update instead of failing"""
+        return self.request('POST', table, params={'on_conflict': on_conflict}, json=rows,
+                            prefer=f'resolution=merge-duplicates,return={returning}', replayable=True)
+
+    def upsert_many(self, table: Table, rows: List[Row], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    on_conflict: str = 'id') -> Tuple[int, List[Tuple[List[Row], requests.Response]]]:
+        """
+        Array-upsert rows in chunks; returns (rows written, failed chunks)
+
+        Rows failing pre-flight validation are reported as their own failed
+        chunk (with the local 422 response) so they don't sink valid rows.
+        """
+        written = 0
+        failures = []
+        rejected = rejections(table, rows)
+        if rejected:
+            bad = {item['index'] for item in rejected}
+            failures.append(([rows[i] for i in sorted(bad)],
+                             json_response(PREFLIGHT_STATUS, rejection_body(table, rejected), self.endpoint(table))))
+            rows = [row for i, row in enumerate(rows) if i not in bad]
+        for chunk in chunked(rows, chunk_size):
+            resp = self.upsert(table, chunk, on_conflict=on_conflict)
+            if resp.status_code in (200, 201, 204):
+                written += len(chunk)
+            else:
+                failures.append((chunk, resp))
+        return written, failures
+
+    def patch(self, table: Table, values: Row, filters: Dict,
+              returning: str = 'minimal', replayable: bool = False) -> requests.Response:
+        """PATCH the rows matched by filters (replayable: see request())"""
+        return self.request('PATCH', table, params=filters, json=values,
+                            prefer=f'return={returning}', replayable=replayable)
+
+    def rpc(self, function: str, params: Dict) -> requests.Response:
+        """POST to a SQL function exposed at /rpc/{function}"""
+        return self.request('POST', f'rpc/{function}', json=params)
+
+    def storage_upload(self, bucket: str, path: str, data: bytes,
+                       content_type: str = 'application/json',
+                       cache_control: Optional[str] = None) -> requests.Response:
+        """Upsert an object into a Supabase Storage bucket"""
+        headers = {'Content-Type': content_type, 'x-upsert': 'true'}
+        if cache_control:
+            headers['Cache-Control'] = cache_control
+
+        def send():
+            return self.session.post(f'{self.url}/storage/v1/object/{bucket}/{path}', data=data,
+                                     headers=headers, timeout=self.timeout)
+
+        if self.limiter is None:
+            return send()
+        # x-upsert makes the upload safe to replay on 429/503
+        return self.limiter.call(send, retry=True)
+
+    def close(self):
+        self.session.close()
+
+
+class AsyncSupabaseClient:
+    """Pooled asyncio PostgREST client (httpx) sharing SupabaseClient's config"""
+
+    def __init__(self, url: Optional[str] = None, service_key: Optional[str] = None,
+                 pool_size: Optional[int] = None, timeout: float = DEFAULT_TIMEOUT,
+                 limiter=_FROM_ENV):
+        import httpx
+
+        self.url = (url or os.environ.get('SUPABASE_URL') or '').rstrip('/')
+        self.service_key = service_key or os.environ.get('SUPABASE_SERVICE_ROLE_KEY')
+        if pool_size is None:
+            pool_size = int(os.environ.get('SUPABASE_POOL_SIZE', DEFAULT_POOL_SIZE))
+        self.pool_size = pool_size
+        self.limiter: Optional[RateLimiter] = get_limiter() if limiter is _FROM_ENV else limiter
+        self.http = httpx.AsyncClient(
+            headers={
+                'apikey': self.service_key or '',
+                'Authorization': f'Bearer {self.service_key}',
+                'Content-Type': 'application/json',
+            },
+            limits=httpx.Limits(max_connections=pool_size,
+                                max_keepalive_connections=pool_size),
+            timeout=timeout,
+        )
+
+    def endpoint(self, table: Table) -> str:
+        return f'{self.url}/rest/v1/{table}'
+
+    async def request(self, method: str, table: Table, params: Optional[Dict] = None,
+                      json=None, prefer: Optional[str] = None, replayable: bool = False):
+        if method.upper() in ('POST', 'PATCH') and json is not None:
+            rejected = rejections(table, json)
+            if rejected:
+                import httpx
+                return httpx.Response(PREFLIGHT_STATUS, json=rejection_body(table, rejected))
+        headers = {'Prefer': prefer} if prefer else None
+
+        def send():
+            return self.http.request(method, self.endpoint(table), params=params,
+                                     json=json, headers=headers)
+
+        if self.limiter is None:
+            return await send()
+        # httpx has no transport-level status retries, so reads are retried here too
+        return await self.limiter.call_async(send, retry=write_retry(method, replayable, retry_reads=True))
+
+    async def patch(self, table: Table, values: Row, filters: Dict,
+                    returning: str = 'minimal', replayable: bool = False):
+        """PATCH the rows matched by filters (replayable: see SupabaseClient.request())"""
+        return await self.request('PATCH', table, params=filters, json=values,
+                                  prefer=f'return={returning}', replayable=replayable)
+
+    async def close(self):
+        await self.http.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+_client: Optional[SupabaseClient] = None
+
+
+def get_client() -> SupabaseClient:
+    """Process-wide client so every caller shares one connection pool"""
+    global _client
+    if _client is None:
+        if os.environ.get('SUPABASE_MIRROR'):
+            from local_mirror import LocalClient, mirror_path
+            _client = LocalClient(mirror_path())
+        else:
+            _client = SupabaseClient()
+    return _client
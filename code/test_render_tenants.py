@@ -0,0 +1,33 @@
+"""Tests for render_tenants.py (python3 -m pytest code/test_render_tenants.py)"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(__file__))
+from fragment_template import compile_template
+from render_tenants import build_tenant_rows, render_base_source, SharedLesson
+
+TENANT = {'id': 'tenant-1', 'slug': 'smith', 'name': 'Smith & Sons',
+          'branding_config': {'brand_name': '<script>alert(1)</script> Smith & Sons'}}
+COURSE = {'id': 'course-1', 'title': 'Credit Basics', 'slug': 'credit-basics', 'description': ''}
+
+
+def render_for(tenant):
+    inputs = {'code': '1.1', 'duration': 30, 'xp': 20, 'topics': ['Credit scores'], 'description': ''}
+    source = render_base_source('lesson', inputs['code'], COURSE['title'], inputs['topics'], '')
+    shared = [SharedLesson(COURSE, inputs, compile_template(source), [])]
+    rows = build_tenant_rows(tenant, shared, {}, {}, rebrand=False)
+    return rows['lessons'][0]['content_html']
+
+
+def test_brand_name_is_escaped():
+    content = render_for(TENANT)
+    assert '&lt;script&gt;alert(1)&lt;/script&gt; Smith &amp; Sons' in content
+    assert '<script>' not in content
+    assert 'Smith & Sons' not in content
+
+
+def test_tenant_name_fallback_is_escaped():
+    content = render_for({**TENANT, 'branding_config': None, 'name': 'A<B & C'})
+    assert 'A&lt;B &amp; C' in content
+    assert 'A<B' not in content
@@ -429,6 +429,7 @@ export type Database = {
       }
       lessons: {
         Row: {
+          content_blocks: string[] | null
           content_html: string | null
           content_type: string | null
           course_id: string
@@ -445,6 +446,7 @@ export type Database = {
           xp_reward: number | null
         }
         Insert: {
+          content_blocks?: string[] | null
           content_html?: string | null
           content_type?: string | null
           course_id: string
@@ -461,6 +463,7 @@ export type Database = {
           xp_reward?: number | null
         }
         Update: {
+          content_blocks?: string[] | null
           content_html?: string | null
           content_type?: string | null
           course_id?: string
@@ -1074,7 +1077,10 @@ export type Database = {
       [_ in never]: never
     }
     Functions: {
-      [_ in never]: never
+      lesson_content_html: {
+        Args: { p_lesson_id: string }
+        Returns: string
+      }
     }
     Enums: {
       [_ in never]: never
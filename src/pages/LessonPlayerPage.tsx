@@ -54,6 +54,13 @@ export default function LessonPlayerPage() {
       resolvedLesson = fallbackLesson;
     }
 
+    if (resolvedLesson && !resolvedLesson.content_html && resolvedLesson.content_blocks?.length) {
+      // Deduplicated lesson: the HTML lives in content_blocks
+      const { data: contentHtml } = await supabase
+        .rpc('lesson_content_html', { p_lesson_id: resolvedLesson.id });
+      resolvedLesson = { ...resolvedLesson, content_html: contentHtml };
+    }
+
     setLesson(resolvedLesson);
     setActiveLessonId(resolvedLesson?.id ?? null);
 
@@ -72,7 +72,8 @@ Deno.serve(async (req) => {
         const totalQuestions = questions.length;
 
         questions.forEach((question: any, index: number) => {
-            if (answers[index] === question.correctAnswer) {
+            // Generated quizzes store the key as correct_answer
+            if (answers[index] === (question.correct_answer ?? question.correctAnswer)) {
                 correctCount++;
             }
         });
@@ -0,0 +1,66 @@
+-- Migration: create_content_blocks
+-- Created at: 1761205000
+
+-- Deduplicated lesson HTML: each unique block is stored once, keyed by the
+-- SHA-256 of its text; lessons keep the ordered list of block hashes
+-- (written by code/block_store.py --push)
+CREATE TABLE IF NOT EXISTS content_blocks (
+    hash TEXT PRIMARY KEY,
+    html TEXT NOT NULL,
+    bytes INTEGER NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+ALTER TABLE lessons ADD COLUMN IF NOT EXISTS content_blocks TEXT[];
+
+ALTER TABLE content_blocks ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Anyone can view content blocks" ON content_blocks
+  FOR SELECT USING (auth.role() IN ('anon', 'authenticated', 'service_role'));
+
+-- Only block_store.py --push (service role) writes blocks; anon can read them
+CREATE POLICY "Service role can insert content blocks" ON content_blocks
+  FOR INSERT WITH CHECK (auth.role() = 'service_role');
+
+CREATE POLICY "Service role can update content blocks" ON content_blocks
+  FOR UPDATE USING (auth.role() = 'service_role') WITH CHECK (auth.role() = 'service_role');
+
+CREATE POLICY "Service role can delete content blocks" ON content_blocks
+  FOR DELETE USING (auth.role() = 'service_role');
+
+-- Full lesson HTML: content_html when the lesson has it (every writer sets
+-- it), otherwise its blocks joined in order. block_store.py --push sets
+-- content_blocks and clears content_html in the same write.
+-- (callable as /rest/v1/rpc/lesson_content_html)
+CREATE OR REPLACE FUNCTION lesson_content_html(p_lesson_id UUID)
+RETURNS TEXT AS $$
+    SELECT COALESCE(
+        (SELECT content_html FROM lessons WHERE id = p_lesson_id),
+        (SELECT string_agg(b.html, '' ORDER BY refs.position)
+         FROM lessons l
+         CROSS JOIN LATERAL unnest(l.content_blocks) WITH ORDINALITY AS refs(hash, position)
+         JOIN content_blocks b ON b.hash = refs.hash
+         WHERE l.id = p_lesson_id)
+    );
+$$ LANGUAGE sql STABLE;
+
+-- A write that replaces content_html without also setting content_blocks
+-- (enhancers, tenant rebrands, mirror pushes) leaves the block list stale:
+-- drop it, so the lesson is served from content_html until the next
+-- block_store.py --push deduplicates it again
+CREATE OR REPLACE FUNCTION clear_stale_content_blocks()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.content_html IS NOT NULL
+       AND NEW.content_html IS DISTINCT FROM OLD.content_html
+       AND NEW.content_blocks IS NOT DISTINCT FROM OLD.content_blocks THEN
+        NEW.content_blocks := NULL;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS clear_stale_content_blocks ON lessons;
+CREATE TRIGGER clear_stale_content_blocks
+    BEFORE UPDATE OF content_html ON lessons
+    FOR EACH ROW EXECUTE FUNCTION clear_stale_content_blocks();
@@ -0,0 +1,15 @@
+-- Migration: add_tenant_brand_name
+-- Created at: 1761206000
+
+-- Brand name that replaces the platform name in a white-label tenant's
+-- lesson text (code/render_tenants.py falls back to tenants.name when empty)
+ALTER TABLE tenants ALTER COLUMN branding_config SET DEFAULT '{"logo_url": "",
+    "primary_color": "#1d4ed8",
+    "secondary_color": "#22c55e",
+    "font_family": "Inter",
+    "brand_name": ""}'::jsonb;
+
+UPDATE tenants
+SET branding_config = COALESCE(branding_config, '{}'::jsonb) || '{"brand_name": "ScorePro"}'::jsonb
+WHERE slug = 'scorepro'
+  AND NOT (COALESCE(branding_config, '{}'::jsonb) ? 'brand_name');
@@ -0,0 +1,23 @@
+-- Migration: create_apply_quiz_regrades
+-- Created at: 1761207000
+
+-- Bulk-apply re-graded quiz attempts (written by code/regrade_quizzes.py
+-- --apply). p_corrections is a JSON array of {id, score, passed}; returns
+-- the number of attempts updated. Runs with the caller's rights, and
+-- quiz_attempts has no UPDATE policy, so only the service role can use it.
+CREATE OR REPLACE FUNCTION apply_quiz_regrades(p_corrections JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    v_updated INTEGER;
+BEGIN
+    UPDATE quiz_attempts qa
+    SET
+        score = c.score,
+        passed = c.passed
+    FROM jsonb_to_recordset(p_corrections) AS c(id UUID, score INTEGER, passed BOOLEAN)
+    WHERE qa.id = c.id;
+
+    GET DIAGNOSTICS v_updated = ROW_COUNT;
+    RETURN v_updated;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,6 @@
+CREATE TABLE content_blocks (
+    hash TEXT PRIMARY KEY,
+    html TEXT NOT NULL,
+    bytes INTEGER NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
\ No newline at end of file
@@ -9,6 +9,7 @@ CREATE TABLE lessons (
     video_url TEXT,
     transcript TEXT,
     content_html TEXT,
+    content_blocks TEXT[],
     duration_minutes INTEGER,
     display_order INTEGER DEFAULT 0,
     xp_reward INTEGER DEFAULT 10,
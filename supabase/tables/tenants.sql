@@ -6,7 +6,8 @@ CREATE TABLE tenants (
     branding_config JSONB DEFAULT '{"logo_url": "",
     "primary_color": "#1d4ed8",
     "secondary_color": "#22c55e",
-    "font_family": "Inter"}'::jsonb,
+    "font_family": "Inter",
+    "brand_name": ""}'::jsonb,
     stripe_account_id TEXT,
     revenue_share_percentage DECIMAL(5,2) DEFAULT 70.00,
     is_active BOOLEAN DEFAULT true,